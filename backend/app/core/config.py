@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -17,6 +18,57 @@ class Settings(BaseSettings):
     bootstrap_admin_email: str = "admin@bankexample.com"
     bootstrap_admin_password: str = "Admin@12345"
     bootstrap_admin_name: str = "System Admin"
+    db_retry_attempts: int = Field(default=5, ge=1)
+    db_retry_base_delay_ms: int = Field(default=10, ge=0)
+    db_retry_max_delay_ms: int = Field(default=250, ge=0)
+    event_poll_interval_ms: int = Field(default=1000, ge=50)
+    event_keepalive_seconds: int = Field(default=15, ge=1)
+    event_retention_hours: int = Field(default=24, ge=1)
+    event_subscriber_queue_size: int = Field(default=1000, ge=1)
+    event_gap_timeout_seconds: int = Field(default=60, ge=1)
+    balance_cache_max_entries: int = Field(default=100_000, ge=0)
+    audit_mode: Literal["sync", "batched"] = "batched"
+    audit_spool_dir: str = "./data/audit_spool"
+    audit_batch_size: int = Field(default=500, ge=1)
+    audit_flush_interval_ms: int = Field(default=1000, ge=10)
+    audit_max_pending: int = Field(default=10_000, ge=1)
+    audit_enqueue_timeout_ms: int = Field(default=2000, ge=0)
+    audit_spool_fsync: bool = True
+    audit_archive_dir: str = "./data/audit_archive"
+    audit_retention_days: int = Field(default=90, ge=1)
+    audit_archive_batch_size: int = Field(default=1000, ge=1)
+    audit_archive_interval_minutes: int = Field(default=0, ge=0)
+    search_backend: Literal["auto", "fts5", "tokens"] = "auto"
+    search_index_batch_size: int = Field(default=1000, ge=1)
+    search_index_interval_seconds: int = Field(default=30, ge=0)
+    search_index_gap_timeout_seconds: int = Field(default=300, ge=1)
+    nav_upload_max_rows: int = Field(default=100_000, ge=1)
+    fund_order_mode: Literal["immediate", "order_book"] = "immediate"
+    fund_order_chunk_size: int = Field(default=200, ge=1)
+    fund_order_cutoff_interval_minutes: int = Field(default=0, ge=0)
+    fund_catalogue_check_interval_ms: int = Field(default=1000, ge=0)
+    sip_chunk_size: int = Field(default=500, ge=1)
+    sip_run_interval_minutes: int = Field(default=0, ge=0)
+    deposit_maturity_chunk_size: int = Field(default=1000, ge=1)
+    deposit_maturity_interval_minutes: int = Field(default=60, ge=0)
+    deposit_accrual_chunk_size: int = Field(default=1000, ge=1)
+    deposit_accrual_interval_minutes: int = Field(default=0, ge=0)
+    deposit_installment_chunk_size: int = Field(default=1000, ge=1)
+    deposit_installment_interval_minutes: int = Field(default=60, ge=0)
+    deposit_quote_cache_size: int = Field(default=4096, ge=1)
+    card_network_api_key: str = ""
+    card_state_cache_max_entries: int = Field(default=100_000, ge=0)
+    card_number_block_size: int = Field(default=1000, ge=1)
+    card_issue_chunk_size: int = Field(default=500, ge=1)
+    password_hash_workers: int = Field(default=4, ge=1)
+    bulk_status_chunk_size: int = Field(default=1000, ge=1)
+    user_import_dir: str = "./data/user_imports"
+    user_import_chunk_size: int = Field(default=1000, ge=1)
+    user_import_stale_minutes: int = Field(default=15, ge=1)
+    debug: bool = False
+    slow_query_threshold_ms: float = Field(default=500, ge=0)
+    slow_query_explain: bool = True
+    slow_query_max_statements: int = Field(default=200, ge=1)
 
 
 @lru_cache
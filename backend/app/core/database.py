@@ -4,6 +4,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 from app.core.config import settings
+from app.core.instrumentation import InstrumentedQueuePool, instrument_engine
 
 
 SQLALCHEMY_DATABASE_URL = settings.database_url
@@ -14,9 +15,12 @@ if SQLALCHEMY_DATABASE_URL.startswith("sqlite:///"):
     if not db_file.is_absolute():
         db_file = Path.cwd() / db_file
     db_file.parent.mkdir(parents=True, exist_ok=True)
-    engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}, future=True)
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}, poolclass=InstrumentedQueuePool, future=True
+    )
 else:
-    engine = create_engine(SQLALCHEMY_DATABASE_URL, pool_pre_ping=True, future=True)
+    engine = create_engine(SQLALCHEMY_DATABASE_URL, pool_pre_ping=True, poolclass=InstrumentedQueuePool, future=True)
+instrument_engine(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, expire_on_commit=False)
 
@@ -1,6 +1,7 @@
+import hmac
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Header
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 
@@ -33,3 +34,10 @@ def get_admin_user(current_user: Annotated[User, Depends(get_current_user)]) ->
     if not current_user.is_admin:
         raise AppError("Admin privileges are required", status_code=403)
     return current_user
+
+
+def require_network_key(x_network_key: Annotated[str | None, Header()] = None) -> None:
+    if not settings.card_network_api_key:
+        raise AppError("Card authorization is not configured", status_code=503)
+    if not x_network_key or not hmac.compare_digest(x_network_key, settings.card_network_api_key):
+        raise AppError("Invalid network key", status_code=401)
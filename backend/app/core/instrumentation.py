@@ -0,0 +1,198 @@
+"""Request, SQL and connection-pool instrumentation feeding ``app.core.metrics``.
+
+Everything on the hot path is a ``perf_counter`` pair plus one locked dict update; pool sizes
+are read only when ``/metrics`` is scraped.
+"""
+
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any
+
+from sqlalchemy import Engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import settings
+from app.core.metrics import (
+    DB_POOL_CHECKOUT_TIMEOUTS,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_QUERY_DURATION,
+    DB_QUERY_ERRORS,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_FLIGHT,
+    registry,
+)
+from app.core.slow_queries import slow_query_log
+
+_STATEMENT_KINDS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE"}
+_UNMATCHED_ROUTE = "<unmatched>"
+
+
+@dataclass
+class QueryLog:
+    """Statements run while serving one request."""
+
+    method: str
+    path: str
+    statements: list[tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def repeated(self) -> list[tuple[str, int]]:
+        """Statements run more than once with the same parameters, e.g. a re-fetched row."""
+        return [(statement, hits) for (statement, _), hits in Counter(self.statements).items() if hits > 1]
+
+
+_current_query_log: ContextVar[QueryLog | None] = ContextVar("current_query_log", default=None)
+_current_scope: ContextVar[dict[str, Any] | None] = ContextVar("current_scope", default=None)
+_query_log_observers: list[Callable[[QueryLog], None]] = []
+
+
+@contextmanager
+def observe_query_logs(observer: Callable[[QueryLog], None]) -> Iterator[None]:
+    """Call ``observer`` with the query log of every request finished inside the block."""
+    _query_log_observers.append(observer)
+    try:
+        yield
+    finally:
+        _query_log_observers.remove(observer)
+
+
+def current_endpoint() -> str | None:
+    """``"METHOD /route/{template}"`` of the request being served, or ``None`` outside a request."""
+    scope = _current_scope.get()
+    if scope is None:
+        return None
+    return f"{scope['method']} {_route_template(scope)}"
+
+
+def _route_template(scope: dict[str, Any]) -> str:
+    # The router stores the matched route on the scope; labelling by its template keeps
+    # /accounts/1 and /accounts/2 in one series.
+    return getattr(scope.get("route"), "path", None) or _UNMATCHED_ROUTE
+
+
+def statement_kind(statement: str) -> str:
+    head = statement.lstrip()[:16].split(None, 1)
+    kind = head[0].upper() if head else ""
+    return kind if kind in _STATEMENT_KINDS else "OTHER"
+
+
+class InstrumentedQueuePool(QueuePool):
+    """``QueuePool`` that records how long each checkout waited for a free connection."""
+
+    def _do_get(self) -> Any:
+        started = perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(perf_counter() - started)
+
+
+def instrument_engine(engine: Engine) -> None:
+    @event.listens_for(engine, "before_cursor_execute")
+    def _started(conn, _cursor, statement, parameters, _context, _executemany) -> None:
+        conn.info.setdefault("query_started", []).append(perf_counter())
+        # Sync endpoints run in a worker thread with a copy of the request's context, so the
+        # log object set by QueryCountMiddleware is shared with them.
+        query_log = _current_query_log.get()
+        if query_log is not None:
+            query_log.statements.append((statement, repr(parameters)))
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _finished(conn, cursor, statement, parameters, _context, executemany) -> None:
+        elapsed = perf_counter() - conn.info["query_started"].pop()
+        DB_QUERY_DURATION.observe(elapsed, statement=statement_kind(statement))
+        # Read per statement so the threshold can be changed at runtime; 0 disables the log.
+        threshold = settings.slow_query_threshold_ms
+        if threshold and elapsed * 1000 >= threshold:
+            slow_query_log.record(conn, cursor, statement, parameters, executemany, elapsed, current_endpoint())
+
+    @event.listens_for(engine, "handle_error")
+    def _failed(context) -> None:
+        started = context.connection.info.get("query_started") if context.connection is not None else None
+        if started:
+            started.pop()
+        DB_QUERY_ERRORS.inc(statement=statement_kind(context.statement or ""))
+
+    pool = engine.pool
+    if isinstance(pool, QueuePool):
+        registry.gauge("banking_db_pool_size", "Configured persistent pool connections.", callback=pool.size)
+        registry.gauge("banking_db_pool_checked_out", "Pooled connections currently in use.", callback=pool.checkedout)
+        # QueuePool.overflow() starts at -pool_size and counts up as connections open.
+        registry.gauge(
+            "banking_db_pool_overflow",
+            "Connections open beyond the pool size.",
+            callback=lambda: max(pool.overflow(), 0),
+        )
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware, so streaming responses are not buffered and timing covers the body."""
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def _send(message: dict[str, Any]) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc(method=method)
+        token = _current_scope.set(scope)
+        started = perf_counter()
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            elapsed = perf_counter() - started
+            _current_scope.reset(token)
+            HTTP_REQUESTS_IN_FLIGHT.dec(method=method)
+            template = _route_template(scope)
+            HTTP_REQUEST_DURATION.observe(elapsed, method=method, route=template)
+            HTTP_REQUESTS.inc(method=method, route=template, status=str(status_code))
+
+
+class QueryCountMiddleware:
+    """Counts SQL statements per request; in debug mode the count is sent as ``X-DB-Queries``."""
+
+    def __init__(self, app: Any):
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http" or not (settings.debug or _query_log_observers):
+            await self.app(scope, receive, send)
+            return
+
+        query_log = QueryLog(scope["method"], scope["path"])
+
+        async def _send(message: dict[str, Any]) -> None:
+            if message["type"] == "http.response.start" and settings.debug:
+                message = {**message, "headers": [*message.get("headers", []), (b"x-db-queries", str(query_log.count).encode())]}
+            await send(message)
+
+        token = _current_query_log.set(query_log)
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            _current_query_log.reset(token)
+            for observer in list(_query_log_observers):
+                observer(query_log)
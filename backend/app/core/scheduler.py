@@ -0,0 +1,52 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PeriodicJob:
+    name: str
+    interval_seconds: float
+    func: Callable[[], object]
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                result = await asyncio.to_thread(self.func)
+                logger.info("Job %s finished: %s", self.name, result)
+            except Exception:
+                logger.exception("Job %s failed", self.name)
+
+
+class JobScheduler:
+    def __init__(self):
+        self._jobs: dict[str, PeriodicJob] = {}
+
+    def register(self, name: str, interval_seconds: float, func: Callable[[], object]) -> None:
+        if interval_seconds <= 0 or name in self._jobs:
+            return
+        self._jobs[name] = PeriodicJob(name, interval_seconds, func)
+
+    async def start(self) -> None:
+        for job in self._jobs.values():
+            if job.task is None:
+                job.task = asyncio.create_task(job._run())
+
+    async def stop(self) -> None:
+        for job in self._jobs.values():
+            if job.task is None:
+                continue
+            job.task.cancel()
+            try:
+                await job.task
+            except asyncio.CancelledError:
+                pass
+            job.task = None
+
+
+scheduler = JobScheduler()
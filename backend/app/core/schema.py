@@ -60,3 +60,15 @@ def apply_schema_compatibility(engine: Engine) -> None:
                 except SQLAlchemyError as exc:
                     logger.error("Failed to add column %s.%s: %s", table_name, column.name, exc)
                     raise
+
+            existing_indexes = {index["name"] for index in inspector.get_indexes(table_name)}
+            for index in table.indexes:
+                if index.name in existing_indexes or engine.dialect.name not in index.info.get("dialects", (engine.dialect.name,)):
+                    continue
+
+                try:
+                    index.create(bind=conn)
+                    logger.info("Added missing index %s on %s", index.name, table_name)
+                except SQLAlchemyError as exc:
+                    logger.error("Failed to add index %s on %s: %s", index.name, table_name, exc)
+                    raise
@@ -1,21 +1,38 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from time import perf_counter
 from typing import Any
 
 import bcrypt
 from jose import JWTError, jwt
 
 from app.core.config import settings
+from app.core.metrics import PASSWORD_HASH_DURATION
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
+    started = perf_counter()
     try:
         return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
     except ValueError:
         return False
+    finally:
+        PASSWORD_HASH_DURATION.observe(perf_counter() - started, operation="verify")
 
 
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    started = perf_counter()
+    hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    PASSWORD_HASH_DURATION.observe(perf_counter() - started, operation="hash")
+    return hashed
+
+
+_hash_pool = ThreadPoolExecutor(max_workers=settings.password_hash_workers, thread_name_prefix="bcrypt")
+
+
+def hash_passwords(passwords: list[str]) -> list[str]:
+    # bcrypt releases the GIL while hashing, so a thread pool scales with cores.
+    return list(_hash_pool.map(hash_password, passwords))
 
 
 def create_access_token(subject: str, expires_delta: timedelta | None = None, extra_claims: dict[str, Any] | None = None) -> str:
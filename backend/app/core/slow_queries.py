@@ -0,0 +1,180 @@
+"""Slow query log: statements over ``SLOW_QUERY_THRESHOLD_MS`` are logged with their plan and aggregated.
+
+Only normalized SQL and parameter *types* are kept, never bound values, so the log and the
+admin listing carry no customer data.
+"""
+
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_EXPLAIN_PREFIX = {"sqlite": "EXPLAIN QUERY PLAN", "postgresql": "EXPLAIN", "mysql": "EXPLAIN"}
+_EXPLAINABLE = {"SELECT", "WITH", "UPDATE", "DELETE"}
+# A plan is re-captured at most this often per statement; plans only change with the data.
+_EXPLAIN_INTERVAL_SECONDS = 300
+_ENDPOINTS_KEPT = 5
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_NAMED_PLACEHOLDER = re.compile(r"%\(\w+\)s|(?<![:\w]):\w+\b|\$\d+")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """Collapse literals, placeholder styles and expanded ``IN`` lists so one query shape is one entry."""
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _NAMED_PLACEHOLDER.sub("?", sql)
+    sql = sql.replace("%s", "?")
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _WHITESPACE.sub(" ", sql).strip()
+    return _PLACEHOLDER_LIST.sub("(?, ...)", sql)
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> Any:
+    if executemany and isinstance(parameters, (list, tuple)):
+        return {"rows": len(parameters), "row": parameter_shape(parameters[0]) if parameters else None}
+    if isinstance(parameters, dict):
+        return {name: type(value).__name__ for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+@dataclass
+class SlowStatement:
+    sql: str
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    last_seen: datetime | None = None
+    parameter_shape: Any = None
+    endpoints: Counter = field(default_factory=Counter)
+    plan: list[str] | None = None
+    plan_captured_at: float | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "sql": self.sql,
+            "calls": self.calls,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "mean_ms": round(self.total_seconds * 1000 / self.calls, 3),
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "last_seen": self.last_seen,
+            "parameter_shape": self.parameter_shape,
+            "endpoints": [{"endpoint": endpoint, "calls": calls} for endpoint, calls in self.endpoints.most_common(_ENDPOINTS_KEPT)],
+            "plan": self.plan,
+        }
+
+
+def _explain(conn: Any, cursor: Any, statement: str, parameters: Any) -> list[str] | None:
+    dialect = conn.dialect.name
+    prefix = _EXPLAIN_PREFIX.get(dialect)
+    if prefix is None:
+        return None
+    # Same DBAPI connection, so the plan reflects the session's transaction and settings. A raw
+    # cursor keeps the EXPLAIN itself out of the engine events, metrics and this log.
+    explain_cursor = cursor.connection.cursor()
+    # A failed statement would abort the surrounding PostgreSQL transaction; the savepoint
+    # keeps a bad EXPLAIN from breaking the request that triggered it.
+    savepoint = dialect == "postgresql"
+    try:
+        if savepoint:
+            explain_cursor.execute("SAVEPOINT slow_query_explain")
+        try:
+            explain_cursor.execute(f"{prefix} {statement}", parameters)
+            rows = explain_cursor.fetchall()
+        except Exception:
+            if savepoint:
+                explain_cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+            raise
+        if savepoint:
+            explain_cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+        if dialect == "sqlite":
+            # (id, parent, notused, detail): only the detail is readable on its own.
+            return [str(row[-1]) for row in rows]
+        return [" | ".join(str(value) for value in row) for row in rows]
+    except Exception:
+        logger.warning("Could not capture plan for slow query", exc_info=True)
+        return None
+    finally:
+        explain_cursor.close()
+
+
+class SlowQueryLog:
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._statements: dict[str, SlowStatement] = {}
+
+    def record(
+        self,
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        executemany: bool,
+        elapsed: float,
+        endpoint: str | None,
+    ) -> None:
+        sql = normalize_sql(statement)
+        shape = parameter_shape(parameters, executemany)
+        endpoint = endpoint or "<background>"
+        with self._lock:
+            entry = self._statements.get(sql)
+            if entry is None:
+                self._evict()
+                entry = self._statements[sql] = SlowStatement(sql)
+            entry.calls += 1
+            entry.total_seconds += elapsed
+            entry.max_seconds = max(entry.max_seconds, elapsed)
+            entry.last_seen = datetime.now(timezone.utc)
+            entry.parameter_shape = shape
+            entry.endpoints[endpoint] += 1
+            now = monotonic()
+            capture_plan = (
+                settings.slow_query_explain
+                and not executemany
+                and sql.split(" ", 1)[0].upper() in _EXPLAINABLE
+                and (entry.plan_captured_at is None or now - entry.plan_captured_at >= _EXPLAIN_INTERVAL_SECONDS)
+            )
+            if capture_plan:
+                entry.plan_captured_at = now
+
+        plan = _explain(conn, cursor, statement, parameters) if capture_plan else None
+        if plan is not None:
+            with self._lock:
+                entry.plan = plan
+        logger.warning(
+            "Slow query (%.1f ms) from %s: %s params=%s plan=%s",
+            elapsed * 1000,
+            endpoint,
+            sql,
+            shape,
+            plan if plan is not None else entry.plan,
+        )
+
+    def _evict(self) -> None:
+        if len(self._statements) >= settings.slow_query_max_statements:
+            cheapest = min(self._statements.values(), key=lambda entry: entry.total_seconds)
+            del self._statements[cheapest.sql]
+
+    def top(self, limit: int) -> list[dict[str, Any]]:
+        with self._lock:
+            ranked = sorted(self._statements.values(), key=lambda entry: entry.total_seconds, reverse=True)[:limit]
+            return [entry.as_dict() for entry in ranked]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._statements.clear()
+
+
+slow_query_log = SlowQueryLog()
@@ -2,15 +2,29 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from app.core.bootstrap import bootstrap_defaults
 from app.core.config import settings
 from app.core.database import SessionLocal, engine
 from app.core.exceptions import register_exception_handlers
+from app.core.instrumentation import MetricsMiddleware, QueryCountMiddleware
 from app.core.logger import configure_logging
+from app.core.metrics import registry
 from app.core.response import api_response
+from app.core.scheduler import scheduler
 from app.core.schema import apply_schema_compatibility
-from app.routers import accounts, audit_logs, auth, debit_cards, deposits, mutual_funds, transactions, users
+from app.routers import accounts, audit_logs, auth, debit_cards, deposits, diagnostics, events, mutual_funds, search, transactions, users
+from app.services.audit import audit_writer
+from app.services.audit_archive import archive_expired_audit_logs
+from app.services.customer_search import backfill_search_columns
+from app.services.deposit_accrual import accrue_deposits
+from app.services.deposit_installments import backfill_installment_schedules, collect_installments
+from app.services.deposit_maturity import mature_deposits
+from app.services.events import dispatcher
+from app.services.fund_orders import execute_pending_orders
+from app.services.search import search_index
+from app.services.sips import run_due_sips
 
 configure_logging()
 
@@ -18,9 +32,35 @@ configure_logging()
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     apply_schema_compatibility(engine)
+    search_index.setup(engine)
+    backfill_search_columns(engine)
+    backfill_installment_schedules(engine)
     with SessionLocal() as session:
         bootstrap_defaults(session)
+    if settings.audit_mode == "batched":
+        audit_writer.start(engine)
+    await dispatcher.start()
+    scheduler.register(
+        "audit_archive",
+        settings.audit_archive_interval_minutes * 60,
+        lambda: archive_expired_audit_logs(engine),
+    )
+    scheduler.register(
+        "fund_order_cutoff",
+        settings.fund_order_cutoff_interval_minutes * 60,
+        execute_pending_orders,
+    )
+    scheduler.register("sip_run", settings.sip_run_interval_minutes * 60, run_due_sips)
+    scheduler.register("deposit_installments", settings.deposit_installment_interval_minutes * 60, collect_installments)
+    scheduler.register("deposit_accrual", settings.deposit_accrual_interval_minutes * 60, accrue_deposits)
+    scheduler.register("deposit_maturity", settings.deposit_maturity_interval_minutes * 60, mature_deposits)
+    if search_index.backend == "tokens":
+        scheduler.register("search_index", settings.search_index_interval_seconds, lambda: search_index.sync(engine))
+    await scheduler.start()
     yield
+    await scheduler.stop()
+    await dispatcher.stop()
+    audit_writer.stop()
 
 
 app = FastAPI(
@@ -37,6 +77,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(QueryCountMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 register_exception_handlers(app)
 
@@ -46,6 +88,11 @@ def health():
     return api_response("success", "Banking API is running", {"version": "1.0.0"})
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
 app.include_router(auth.router, prefix=settings.api_prefix)
 app.include_router(users.router, prefix=settings.api_prefix)
 app.include_router(accounts.router, prefix=settings.api_prefix)
@@ -54,3 +101,6 @@ app.include_router(debit_cards.router, prefix=settings.api_prefix)
 app.include_router(mutual_funds.router, prefix=settings.api_prefix)
 app.include_router(deposits.router, prefix=settings.api_prefix)
 app.include_router(audit_logs.router, prefix=settings.api_prefix)
+app.include_router(events.router, prefix=settings.api_prefix)
+app.include_router(search.router, prefix=settings.api_prefix)
+app.include_router(diagnostics.router, prefix=settings.api_prefix)
@@ -5,7 +5,8 @@ from decimal import Decimal
 from enum import Enum
 from typing import Any
 
-from sqlalchemy import Boolean, Date, DateTime, Enum as SqlEnum, ForeignKey, JSON, Numeric, String, UniqueConstraint, func
+from sqlalchemy import BigInteger, Boolean, Date, DateTime, Enum as SqlEnum, ForeignKey, Index, JSON, Numeric, String, UniqueConstraint, func
+from sqlalchemy.dialects import mysql
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -23,6 +24,7 @@ class TransactionType(str, Enum):
     MUTUAL_FUND_SELL = "mutual_fund_sell"
     DEPOSIT_CREATE = "deposit_create"
     DEPOSIT_CANCEL = "deposit_cancel"
+    DEPOSIT_MATURITY = "deposit_maturity"
     ADJUSTMENT = "adjustment"
 
 
@@ -38,6 +40,24 @@ class CardStatus(str, Enum):
     DISABLED = "disabled"
 
 
+class CardChannel(str, Enum):
+    POS = "pos"
+    ATM = "atm"
+
+
+class ImportJobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ImportRowStatus(str, Enum):
+    CREATED = "created"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
+
 class DepositType(str, Enum):
     FIXED = "fixed"
     RECURRING = "recurring"
@@ -54,6 +74,38 @@ class FundTradeType(str, Enum):
     SELL = "sell"
 
 
+class FundOrderStatus(str, Enum):
+    PENDING = "pending"
+    EXECUTED = "executed"
+    REJECTED = "rejected"
+    CANCELLED = "cancelled"
+
+
+class SipFrequency(str, Enum):
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+
+
+class SipStatus(str, Enum):
+    ACTIVE = "active"
+    CANCELLED = "cancelled"
+
+
+class SipExecutionStatus(str, Enum):
+    EXECUTED = "executed"
+    FAILED = "failed"
+
+
+def _search_key(length: int) -> String:
+    # Byte-order collation keeps "prefix <= value < next(prefix)" range scans correct
+    # regardless of the database locale; it matches migration 018.
+    return (
+        String(length)
+        .with_variant(String(length, collation="C"), "postgresql")
+        .with_variant(mysql.VARCHAR(length, charset="utf8mb4", collation="utf8mb4_bin"), "mysql")
+    )
+
+
 class TimestampMixin:
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
@@ -66,6 +118,11 @@ class TimestampMixin:
 
 class User(Base, TimestampMixin):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_search_name_id", "search_name", "id"),
+        Index("ix_users_search_email_id", "search_email", "id"),
+        Index("ix_users_search_contact_id", "search_contact", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String(120), nullable=False)
@@ -76,6 +133,9 @@ class User(Base, TimestampMixin):
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     is_admin: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    search_name: Mapped[str | None] = mapped_column(_search_key(120), nullable=True)
+    search_email: Mapped[str | None] = mapped_column(_search_key(255), nullable=True)
+    search_contact: Mapped[str | None] = mapped_column(_search_key(30), nullable=True)
 
     accounts: Mapped[list[Account]] = relationship(back_populates="user", cascade="save-update,merge")
     holdings: Mapped[list[MutualFundHolding]] = relationship(back_populates="user", cascade="save-update,merge")
@@ -94,6 +154,9 @@ class Account(Base, TimestampMixin):
     balance: Mapped[Decimal] = mapped_column(Numeric(14, 2), default=Decimal("0.00"), nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    version: Mapped[int] = mapped_column(default=1, nullable=False)
+
+    __mapper_args__ = {"version_id_col": version}
 
     user: Mapped[User] = relationship(back_populates="accounts")
     outgoing_transactions: Mapped[list[Transaction]] = relationship(
@@ -112,6 +175,12 @@ class Account(Base, TimestampMixin):
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index("ix_transactions_from_account_id_id", "from_account_id", "id"),
+        Index("ix_transactions_to_account_id_id", "to_account_id", "id"),
+        Index("ix_transactions_from_account_id_created_at", "from_account_id", "created_at", "amount"),
+        Index("ix_transactions_to_account_id_created_at", "to_account_id", "created_at", "amount"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     from_account_id: Mapped[int | None] = mapped_column(ForeignKey("accounts.id", ondelete="SET NULL"), nullable=True)
@@ -138,10 +207,27 @@ class DebitCard(Base, TimestampMixin):
     otp_hash: Mapped[str | None] = mapped_column(String(255), nullable=True)
     activation_date: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     expiry_date: Mapped[date] = mapped_column(Date, nullable=False)
+    daily_limit: Mapped[Decimal] = mapped_column(Numeric(14, 2), default=Decimal("2000.00"), nullable=False)
+    spent_today: Mapped[Decimal] = mapped_column(Numeric(14, 2), default=Decimal("0.00"), nullable=False)
+    spent_on: Mapped[date | None] = mapped_column(Date, nullable=True)
 
     account: Mapped[Account] = relationship(back_populates="debit_cards")
 
 
+class CardAuthorization(Base):
+    __tablename__ = "card_authorizations"
+    __table_args__ = (Index("ix_card_authorizations_account_id_created_at", "account_id", "created_at", "amount"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    card_id: Mapped[int] = mapped_column(ForeignKey("debit_cards.id", ondelete="RESTRICT"), index=True, nullable=False)
+    account_id: Mapped[int] = mapped_column(ForeignKey("accounts.id", ondelete="RESTRICT"), index=True, nullable=False)
+    amount: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False)
+    channel: Mapped[CardChannel] = mapped_column(SqlEnum(CardChannel), nullable=False)
+    merchant: Mapped[str | None] = mapped_column(String(120), nullable=True)
+    reference: Mapped[str] = mapped_column(String(40), unique=True, index=True, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
 class MutualFund(Base, TimestampMixin):
     __tablename__ = "mutual_funds"
 
@@ -149,6 +235,7 @@ class MutualFund(Base, TimestampMixin):
     name: Mapped[str] = mapped_column(String(120), nullable=False)
     symbol: Mapped[str] = mapped_column(String(40), unique=True, index=True, nullable=False)
     nav: Mapped[Decimal] = mapped_column(Numeric(12, 4), nullable=False)
+    nav_version: Mapped[int] = mapped_column(default=1, nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
 
     holdings: Mapped[list[MutualFundHolding]] = relationship(back_populates="fund")
@@ -157,7 +244,10 @@ class MutualFund(Base, TimestampMixin):
 
 class MutualFundHolding(Base, TimestampMixin):
     __tablename__ = "mutual_fund_holdings"
-    __table_args__ = (UniqueConstraint("user_id", "account_id", "fund_id", name="uq_user_account_fund_holding"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "account_id", "fund_id", name="uq_user_account_fund_holding"),
+        Index("ix_mutual_fund_holdings_fund_valuation", "fund_id", "units", "average_nav"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="RESTRICT"), nullable=False, index=True)
@@ -180,6 +270,7 @@ class MutualFundTrade(Base):
     fund_id: Mapped[int] = mapped_column(ForeignKey("mutual_funds.id", ondelete="RESTRICT"), nullable=False, index=True)
     trade_type: Mapped[FundTradeType] = mapped_column(SqlEnum(FundTradeType), nullable=False)
     nav: Mapped[Decimal] = mapped_column(Numeric(12, 4), nullable=False)
+    nav_version: Mapped[int | None] = mapped_column(nullable=True)
     units: Mapped[Decimal] = mapped_column(Numeric(14, 4), nullable=False)
     amount: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -188,8 +279,79 @@ class MutualFundTrade(Base):
     fund: Mapped[MutualFund] = relationship(back_populates="trades")
 
 
+class MutualFundOrder(Base, TimestampMixin):
+    __tablename__ = "mutual_fund_orders"
+    __table_args__ = (Index("ix_mutual_fund_orders_status_account_id", "status", "account_id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="RESTRICT"), nullable=False, index=True)
+    account_id: Mapped[int] = mapped_column(ForeignKey("accounts.id", ondelete="RESTRICT"), nullable=False)
+    fund_id: Mapped[int] = mapped_column(ForeignKey("mutual_funds.id", ondelete="RESTRICT"), nullable=False)
+    order_type: Mapped[FundTradeType] = mapped_column(SqlEnum(FundTradeType), nullable=False)
+    amount: Mapped[Decimal | None] = mapped_column(Numeric(14, 2), nullable=True)
+    units: Mapped[Decimal | None] = mapped_column(Numeric(14, 4), nullable=True)
+    status: Mapped[FundOrderStatus] = mapped_column(SqlEnum(FundOrderStatus), default=FundOrderStatus.PENDING, nullable=False)
+    batch_id: Mapped[str | None] = mapped_column(String(40), nullable=True)
+    trade_id: Mapped[int | None] = mapped_column(ForeignKey("mutual_fund_trades.id", ondelete="SET NULL"), nullable=True)
+    executed_nav: Mapped[Decimal | None] = mapped_column(Numeric(12, 4), nullable=True)
+    executed_units: Mapped[Decimal | None] = mapped_column(Numeric(14, 4), nullable=True)
+    executed_amount: Mapped[Decimal | None] = mapped_column(Numeric(14, 2), nullable=True)
+    failure_reason: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+
+class SipInstruction(Base, TimestampMixin):
+    __tablename__ = "sip_instructions"
+    __table_args__ = (Index("ix_sip_instructions_status_next_run_date", "status", "next_run_date", "id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="RESTRICT"), nullable=False, index=True)
+    account_id: Mapped[int] = mapped_column(ForeignKey("accounts.id", ondelete="RESTRICT"), nullable=False)
+    fund_id: Mapped[int] = mapped_column(ForeignKey("mutual_funds.id", ondelete="RESTRICT"), nullable=False)
+    amount: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False)
+    frequency: Mapped[SipFrequency] = mapped_column(SqlEnum(SipFrequency), nullable=False)
+    start_date: Mapped[date] = mapped_column(Date, nullable=False)
+    next_run_date: Mapped[date] = mapped_column(Date, nullable=False)
+    last_run_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    status: Mapped[SipStatus] = mapped_column(SqlEnum(SipStatus), default=SipStatus.ACTIVE, nullable=False)
+
+
+class SipExecution(Base):
+    __tablename__ = "sip_executions"
+    __table_args__ = (UniqueConstraint("instruction_id", "run_date", name="uq_sip_executions_instruction_run_date"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    instruction_id: Mapped[int] = mapped_column(ForeignKey("sip_instructions.id", ondelete="CASCADE"), nullable=False)
+    run_date: Mapped[date] = mapped_column(Date, nullable=False)
+    batch_id: Mapped[str] = mapped_column(String(40), nullable=False)
+    status: Mapped[SipExecutionStatus] = mapped_column(SqlEnum(SipExecutionStatus), nullable=False)
+    amount: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False)
+    trade_id: Mapped[int | None] = mapped_column(ForeignKey("mutual_fund_trades.id", ondelete="SET NULL"), nullable=True)
+    units: Mapped[Decimal | None] = mapped_column(Numeric(14, 4), nullable=True)
+    nav: Mapped[Decimal | None] = mapped_column(Numeric(12, 4), nullable=True)
+    failure_reason: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class MutualFundNav(Base):
+    __tablename__ = "mutual_fund_navs"
+    __table_args__ = (
+        UniqueConstraint("fund_id", "nav_date", name="uq_mutual_fund_navs_fund_date"),
+        Index("ix_mutual_fund_navs_nav_date", "nav_date"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    fund_id: Mapped[int] = mapped_column(ForeignKey("mutual_funds.id", ondelete="CASCADE"), nullable=False)
+    nav_date: Mapped[date] = mapped_column(Date, nullable=False)
+    nav: Mapped[Decimal] = mapped_column(Numeric(12, 4), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
 class Deposit(Base, TimestampMixin):
     __tablename__ = "deposits"
+    __table_args__ = (
+        Index("ix_deposits_status_maturity_date", "status", "maturity_date", "id"),
+        Index("ix_deposits_status_next_installment", "status", "next_installment_date", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     account_id: Mapped[int] = mapped_column(ForeignKey("accounts.id", ondelete="RESTRICT"), nullable=False, index=True)
@@ -202,6 +364,13 @@ class Deposit(Base, TimestampMixin):
     maturity_date: Mapped[date] = mapped_column(Date, nullable=False)
     penalty_amount: Mapped[Decimal] = mapped_column(Numeric(14, 2), default=Decimal("0.00"), nullable=False)
     cancelled_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    installments_paid: Mapped[int] = mapped_column(default=1, nullable=False)
+    installments_missed: Mapped[int] = mapped_column(default=0, nullable=False)
+    next_installment_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    accrued_interest: Mapped[Decimal] = mapped_column(Numeric(14, 2), default=Decimal("0.00"), nullable=False)
+    accrued_through: Mapped[date | None] = mapped_column(Date, nullable=True)
+    payout_amount: Mapped[Decimal | None] = mapped_column(Numeric(14, 2), nullable=True)
+    matured_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
     account: Mapped[Account] = relationship(back_populates="deposits")
 
@@ -215,6 +384,121 @@ class AuditLog(Base):
     entity: Mapped[str] = mapped_column(String(80), nullable=False)
     entity_id: Mapped[int | None] = mapped_column(nullable=True)
     details: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
 
     user: Mapped[User | None] = relationship(back_populates="audit_logs")
+
+
+class AuditSpoolCheckpoint(Base):
+    __tablename__ = "audit_spool_checkpoints"
+
+    spool_name: Mapped[str] = mapped_column(String(120), primary_key=True)
+    last_seq: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+class CacheVersion(Base):
+    __tablename__ = "cache_versions"
+
+    name: Mapped[str] = mapped_column(String(60), primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+class SearchToken(Base):
+    __tablename__ = "search_tokens"
+    __table_args__ = (Index("ix_search_tokens_source_source_id", "source", "source_id"),)
+
+    source: Mapped[str] = mapped_column(String(20), primary_key=True)
+    token: Mapped[str] = mapped_column(String(64), primary_key=True)
+    source_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    hits: Mapped[int] = mapped_column(default=1, nullable=False)
+
+
+class SearchIndexCheckpoint(Base):
+    __tablename__ = "search_index_checkpoints"
+
+    source: Mapped[str] = mapped_column(String(20), primary_key=True)
+    last_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+class JobCheckpoint(Base):
+    __tablename__ = "job_checkpoints"
+
+    name: Mapped[str] = mapped_column(String(60), primary_key=True)
+    run_key: Mapped[str] = mapped_column(String(40), nullable=False)
+    position: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
+    processed: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+
+class OutboxEvent(Base):
+    __tablename__ = "outbox_events"
+    __table_args__ = (Index("ix_outbox_events_user_id_id", "user_id", "id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    event_type: Mapped[str] = mapped_column(String(60), nullable=False)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    account_id: Mapped[int | None] = mapped_column(ForeignKey("accounts.id", ondelete="SET NULL"), nullable=True)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON, default=dict, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class NumberSequence(Base):
+    __tablename__ = "number_sequences"
+
+    name: Mapped[str] = mapped_column(String(60), primary_key=True)
+    next_value: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+
+class UserImportJob(Base, TimestampMixin):
+    __tablename__ = "user_import_jobs"
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    created_by: Mapped[int | None] = mapped_column(ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    filename: Mapped[str] = mapped_column(String(255), default="", nullable=False)
+    file_path: Mapped[str] = mapped_column(String(500), default="", nullable=False)
+    file_format: Mapped[str] = mapped_column(String(10), nullable=False)
+    status: Mapped[ImportJobStatus] = mapped_column(SqlEnum(ImportJobStatus), default=ImportJobStatus.PENDING, nullable=False)
+    processed_rows: Mapped[int] = mapped_column(default=0, nullable=False)
+    created_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    skipped_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    failed_count: Mapped[int] = mapped_column(default=0, nullable=False)
+    error: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+class UserImportResult(Base):
+    __tablename__ = "user_import_results"
+    __table_args__ = (UniqueConstraint("job_id", "line", name="uq_user_import_results_job_line"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    job_id: Mapped[int] = mapped_column(ForeignKey("user_import_jobs.id", ondelete="CASCADE"), nullable=False)
+    line: Mapped[int] = mapped_column(nullable=False)
+    email: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    status: Mapped[ImportRowStatus] = mapped_column(SqlEnum(ImportRowStatus), nullable=False)
+    user_id: Mapped[int | None] = mapped_column(ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    error: Mapped[str | None] = mapped_column(String(255), nullable=True)
+
+
+PARTIAL_INDEX_DIALECTS = ("sqlite", "postgresql")
+
+
+def _live_rows_index(name: str, mysql_name: str, flag: Any, *columns: Any) -> None:
+    """Index ``columns`` for rows where ``flag`` is false.
+
+    SQLite and PostgreSQL get a partial index matching the ``flag.is_(False)`` filter the queries
+    use; MySQL has no partial indexes, so it gets ``flag`` as an extra key column before the last one.
+    """
+    Index(
+        name,
+        *columns,
+        sqlite_where=flag.is_(False),
+        postgresql_where=flag.is_(False),
+        info={"dialects": PARTIAL_INDEX_DIALECTS},
+    ).ddl_if(dialect=PARTIAL_INDEX_DIALECTS)
+    Index(mysql_name, *columns[:-1], flag, columns[-1], info={"dialects": ("mysql",)}).ddl_if(dialect="mysql")
+
+
+_live_rows_index("ix_users_live_id", "ix_users_is_deleted_id", User.is_deleted, User.id)
+_live_rows_index("ix_accounts_live_id", "ix_accounts_is_deleted_id", Account.is_deleted, Account.id)
@@ -1,14 +1,20 @@
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy import select
 
-from app.core.dependencies import DbSession, get_current_user
+from app.core.dependencies import DbSession, get_admin_user, get_current_user
 from app.core.exceptions import AppError
 from app.core.response import api_response
 from app.models import Account, User
-from app.schemas import AccountBalanceOut, AccountCreate, AccountOut, AccountUpdate
+from app.schemas import AccountBalanceOut, AccountBulkStatusUpdate, AccountCreate, AccountOut, AccountUpdate
+from app.services.account_overview import account_overview
 from app.services.audit import log_action
+from app.services.balance_cache import load_balance
+from app.services.balance_history import balance_history
+from app.services.bulk_status import set_account_active
+from app.services.events import record_account_event
 from app.services.utils import generate_account_number
 
 router = APIRouter(prefix="/accounts", tags=["Accounts"])
@@ -59,6 +65,14 @@ def create_account(payload: AccountCreate, db: DbSession, current_user: User = D
     return api_response("success", "Account created", {"account_id": account.id})
 
 
+@router.post("/bulk-status")
+def bulk_update_account_status(payload: AccountBulkStatusUpdate, current_user: User = Depends(get_admin_user)):
+    result = set_account_active(
+        payload.is_active, user_id=payload.user_id, account_ids=payload.account_ids, actor_id=current_user.id
+    )
+    return api_response("success", "Account statuses updated", result)
+
+
 @router.get("/")
 def list_accounts(
     db: DbSession,
@@ -86,6 +100,41 @@ def get_account(account_id: int, db: DbSession, current_user: User = Depends(get
     return api_response("success", "Account fetched", {"account": AccountOut.model_validate(account).model_dump()})
 
 
+@router.get("/{account_id}/overview")
+def get_account_overview(
+    account_id: int,
+    db: DbSession,
+    current_user: User = Depends(get_current_user),
+    transactions: int = Query(default=10, ge=0, le=100),
+):
+    overview = account_overview(db, account_id, current_user, transactions)
+    return api_response("success", "Account overview fetched", overview)
+
+
+@router.get("/{account_id}/balance-history")
+def get_balance_history(
+    account_id: int,
+    db: DbSession,
+    current_user: User = Depends(get_current_user),
+    date_from: datetime | None = Query(default=None, alias="from"),
+    date_to: datetime | None = Query(default=None, alias="to"),
+    buckets: int = Query(default=100, ge=1, le=1000),
+):
+    account = db.get(Account, account_id)
+    if not account or account.is_deleted:
+        raise AppError("Account not found", status_code=status.HTTP_404_NOT_FOUND)
+    if not _can_access_account(current_user, account):
+        raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
+
+    date_to = date_to or datetime.now(timezone.utc)
+    date_from = date_from or date_to - timedelta(days=365)
+    if date_from >= date_to:
+        raise AppError("from must be before to", status_code=status.HTTP_400_BAD_REQUEST)
+
+    history = balance_history(db, account, date_from, date_to, buckets)
+    return api_response("success", "Balance history fetched", history)
+
+
 @router.put("/{account_id}")
 def update_account(account_id: int, payload: AccountUpdate, db: DbSession, current_user: User = Depends(get_current_user)):
     account = db.get(Account, account_id)
@@ -98,6 +147,8 @@ def update_account(account_id: int, payload: AccountUpdate, db: DbSession, curre
     for field, value in updates.items():
         setattr(account, field, value)
 
+    db.flush()
+    record_account_event(db, account)
     log_action(db, "update", "account", account.id, current_user.id, {"fields": list(updates.keys())})
     db.commit()
 
@@ -114,6 +165,8 @@ def delete_account(account_id: int, db: DbSession, current_user: User = Depends(
 
     account.is_deleted = True
     account.is_active = False
+    db.flush()
+    record_account_event(db, account)
 
     log_action(db, "delete", "account", account.id, current_user.id)
     db.commit()
@@ -123,11 +176,11 @@ def delete_account(account_id: int, db: DbSession, current_user: User = Depends(
 
 @router.get("/{account_id}/balance")
 def get_balance(account_id: int, db: DbSession, current_user: User = Depends(get_current_user)):
-    account = db.get(Account, account_id)
-    if not account or account.is_deleted:
+    cached = load_balance(db, account_id)
+    if not cached or cached.is_deleted:
         raise AppError("Account not found", status_code=status.HTTP_404_NOT_FOUND)
-    if not _can_access_account(current_user, account):
+    if not current_user.is_admin and cached.user_id != current_user.id:
         raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
 
-    payload = AccountBalanceOut(account_id=account.id, balance=account.balance)
+    payload = AccountBalanceOut(account_id=cached.account_id, balance=cached.balance)
     return api_response("success", "Account balance fetched", {"balance": payload.model_dump()})
@@ -1,15 +1,78 @@
-from fastapi import APIRouter, Depends
+import heapq
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy import select
 
+from app.core.database import engine
 from app.core.dependencies import DbSession, get_admin_user
 from app.core.response import api_response
 from app.models import AuditLog, User
 from app.schemas import AuditLogOut
+from app.services.audit import log_action
+from app.services.audit_archive import archive_expired_audit_logs, audit_archive
 
 router = APIRouter(prefix="/audit-logs", tags=["Audit Logs"])
 
 
+def _sort_key(item: AuditLogOut) -> datetime:
+    created_at = item.created_at
+    return created_at if created_at.tzinfo else created_at.replace(tzinfo=timezone.utc)
+
+
 @router.get("/")
-def list_audit_logs(db: DbSession, current_user: User = Depends(get_admin_user)):
-    logs = db.execute(select(AuditLog).order_by(AuditLog.created_at.desc())).scalars().all()
-    return api_response("success", "Audit logs fetched", {"items": [AuditLogOut.model_validate(log).model_dump() for log in logs]})
+def list_audit_logs(
+    db: DbSession,
+    current_user: User = Depends(get_admin_user),
+    date_from: datetime | None = Query(default=None),
+    date_to: datetime | None = Query(default=None),
+    page: int = Query(default=1, ge=1),
+    page_size: int = Query(default=50, ge=1, le=500),
+):
+    offset = (page - 1) * page_size
+    # One extra row tells whether another page exists.
+    wanted = offset + page_size + 1
+    stmt = select(AuditLog)
+    if date_from:
+        stmt = stmt.where(AuditLog.created_at >= date_from)
+    if date_to:
+        stmt = stmt.where(AuditLog.created_at <= date_to)
+    stmt = stmt.order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
+
+    # Archived segments are read only when the window overlaps them and the page reaches back
+    # past the newest archived row; the segment indexes answer that without decompressing.
+    newest_archived = audit_archive.newest(date_from, date_to)
+    if newest_archived is None:
+        items = [AuditLogOut.model_validate(log) for log in db.execute(stmt.offset(offset).limit(page_size + 1)).scalars().all()]
+    else:
+        items = [AuditLogOut.model_validate(log) for log in db.execute(stmt.limit(wanted)).scalars().all()]
+        if len(items) < wanted or _sort_key(items[-1]) <= newest_archived:
+            hot_ids = {item.id for item in items}
+            archived = (AuditLogOut.model_validate(record) for record in audit_archive.query(date_from, date_to))
+            # Only the newest ``wanted`` archived rows are kept in memory, whatever the window holds.
+            items.extend(heapq.nlargest(wanted, (item for item in archived if item.id not in hot_ids), key=_sort_key))
+            items.sort(key=lambda item: (_sort_key(item), item.id), reverse=True)
+        items = items[offset:wanted]
+
+    return api_response(
+        "success",
+        "Audit logs fetched",
+        {
+            "items": [item.model_dump() for item in items[:page_size]],
+            "page": page,
+            "page_size": page_size,
+            "has_more": len(items) > page_size,
+        },
+    )
+
+
+@router.post("/archive")
+def archive_audit_logs(
+    db: DbSession,
+    current_user: User = Depends(get_admin_user),
+    max_batches: int | None = Query(default=None, ge=1),
+):
+    archived = archive_expired_audit_logs(engine, max_batches=max_batches)
+    log_action(db, "archive", "audit_log", None, current_user.id, {"archived": archived})
+    db.commit()
+    return api_response("success", "Audit logs archived", {"archived": archived})
@@ -1,16 +1,31 @@
-from datetime import date, datetime, timezone
+import json
+from datetime import datetime, timezone
 
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 
-from app.core.dependencies import DbSession, get_current_user
+from app.core.dependencies import DbSession, get_admin_user, get_current_user, require_network_key
 from app.core.exceptions import AppError
 from app.core.response import api_response
 from app.core.security import hash_password, verify_password
 from app.models import Account, CardStatus, DebitCard, User
-from app.schemas import DebitCardActivateRequest, DebitCardCreate, DebitCardOut, DebitCardStatusUpdate
+from app.schemas import (
+    CardAuthorizationRequest,
+    DebitCardActivateRequest,
+    DebitCardBulkCreate,
+    DebitCardBulkStatusUpdate,
+    DebitCardCreate,
+    DebitCardLimitUpdate,
+    DebitCardOut,
+    DebitCardStatusUpdate,
+)
 from app.services.audit import log_action
-from app.services.utils import generate_card_number, generate_otp
+from app.services.bulk_status import set_card_status
+from app.services.card_authorizations import authorize_card
+from app.services.card_issuance import card_expiry, card_number_allocator, issue_cards
+from app.services.events import record_card_event
+from app.services.utils import generate_otp
 
 router = APIRouter(prefix="/debit-cards", tags=["Debit Cards"])
 
@@ -19,6 +34,17 @@ def _can_manage_card(current_user: User, account: Account) -> bool:
     return current_user.is_admin or account.user_id == current_user.id
 
 
+def _load_card(db: DbSession, card_id: int, current_user: User) -> tuple[DebitCard, Account]:
+    row = db.execute(select(DebitCard, Account).join(Account, DebitCard.account_id == Account.id).where(DebitCard.id == card_id)).first()
+    if not row:
+        raise AppError("Card not found", status_code=status.HTTP_404_NOT_FOUND)
+
+    card, account = row
+    if not _can_manage_card(current_user, account):
+        raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
+    return card, account
+
+
 @router.post("/")
 def create_debit_card(payload: DebitCardCreate, db: DbSession, current_user: User = Depends(get_current_user)):
     account = db.get(Account, payload.account_id)
@@ -27,23 +53,13 @@ def create_debit_card(payload: DebitCardCreate, db: DbSession, current_user: Use
     if not _can_manage_card(current_user, account):
         raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
 
-    card_number = None
-    for _ in range(6):
-        candidate = generate_card_number()
-        existing = db.execute(select(DebitCard.id).where(DebitCard.card_number == candidate)).scalar_one_or_none()
-        if not existing:
-            card_number = candidate
-            break
-    if not card_number:
-        raise AppError("Failed to generate card number", status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
     otp = generate_otp()
     card = DebitCard(
         account_id=account.id,
-        card_number=card_number,
+        card_number=card_number_allocator.allocate(1)[0],
         status=CardStatus.PENDING,
         otp_hash=hash_password(otp),
-        expiry_date=date(date.today().year + 5, date.today().month, min(date.today().day, 28)),
+        expiry_date=card_expiry(),
     )
     db.add(card)
     db.flush()
@@ -57,6 +73,42 @@ def create_debit_card(payload: DebitCardCreate, db: DbSession, current_user: Use
     )
 
 
+@router.post("/bulk")
+def bulk_issue_cards(payload: DebitCardBulkCreate, current_user: User = Depends(get_admin_user)):
+    results = issue_cards(payload.account_ids, current_user.id)
+    return StreamingResponse((json.dumps(result) + "\n" for result in results), media_type="application/x-ndjson")
+
+
+@router.post("/bulk-status")
+def bulk_update_card_status(payload: DebitCardBulkStatusUpdate, current_user: User = Depends(get_admin_user)):
+    result = set_card_status(
+        payload.status,
+        user_id=payload.user_id,
+        account_ids=payload.account_ids,
+        card_ids=payload.card_ids,
+        expiry_before=payload.expiry_before,
+        actor_id=current_user.id,
+    )
+    return api_response("success", "Card statuses updated", result)
+
+
+@router.post("/authorize", dependencies=[Depends(require_network_key)])
+def authorize(payload: CardAuthorizationRequest, db: DbSession):
+    authorization, balance = authorize_card(db, payload.card_number, payload.amount, payload.channel, payload.merchant)
+    return api_response(
+        "success",
+        "Authorization approved",
+        {
+            "authorization_id": authorization.id,
+            "reference": authorization.reference,
+            "card_id": authorization.card_id,
+            "account_id": authorization.account_id,
+            "amount": str(authorization.amount),
+            "available_balance": str(balance),
+        },
+    )
+
+
 @router.get("/")
 def list_cards(db: DbSession, current_user: User = Depends(get_current_user)):
     stmt = select(DebitCard)
@@ -69,45 +121,39 @@ def list_cards(db: DbSession, current_user: User = Depends(get_current_user)):
 
 @router.get("/{card_id}")
 def get_card(card_id: int, db: DbSession, current_user: User = Depends(get_current_user)):
-    card = db.get(DebitCard, card_id)
-    if not card:
-        raise AppError("Card not found", status_code=status.HTTP_404_NOT_FOUND)
-
-    account = db.get(Account, card.account_id)
-    if not account or not _can_manage_card(current_user, account):
-        raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
-
+    card, _ = _load_card(db, card_id, current_user)
     return api_response("success", "Card fetched", {"card": DebitCardOut.model_validate(card).model_dump()})
 
 
 @router.put("/{card_id}/status")
 def update_card_status(card_id: int, payload: DebitCardStatusUpdate, db: DbSession, current_user: User = Depends(get_current_user)):
-    card = db.get(DebitCard, card_id)
-    if not card:
-        raise AppError("Card not found", status_code=status.HTTP_404_NOT_FOUND)
-
-    account = db.get(Account, card.account_id)
-    if not account or not _can_manage_card(current_user, account):
-        raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
+    card, account = _load_card(db, card_id, current_user)
     if payload.status not in {CardStatus.ACTIVE, CardStatus.DISABLED}:
         raise AppError("Only active/disabled states are allowed", status_code=status.HTTP_400_BAD_REQUEST)
 
     card.status = payload.status
     log_action(db, "update", "debit_card", card.id, current_user.id, {"status": payload.status.value})
+    record_card_event(db, card, account.user_id)
     db.commit()
 
     return api_response("success", "Card status updated", {"card_id": card.id})
 
 
+@router.put("/{card_id}/limit")
+def update_card_limit(card_id: int, payload: DebitCardLimitUpdate, db: DbSession, current_user: User = Depends(get_current_user)):
+    card, account = _load_card(db, card_id, current_user)
+
+    card.daily_limit = payload.daily_limit
+    log_action(db, "update", "debit_card", card.id, current_user.id, {"daily_limit": str(payload.daily_limit)})
+    record_card_event(db, card, account.user_id)
+    db.commit()
+
+    return api_response("success", "Card limit updated", {"card_id": card.id, "daily_limit": str(card.daily_limit)})
+
+
 @router.put("/activate")
 def activate_card(payload: DebitCardActivateRequest, db: DbSession, current_user: User = Depends(get_current_user)):
-    card = db.get(DebitCard, payload.card_id)
-    if not card:
-        raise AppError("Card not found", status_code=status.HTTP_404_NOT_FOUND)
-
-    account = db.get(Account, card.account_id)
-    if not account or not _can_manage_card(current_user, account):
-        raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
+    card, account = _load_card(db, payload.card_id, current_user)
     if card.status != CardStatus.PENDING:
         raise AppError("Card is not pending activation", status_code=status.HTTP_400_BAD_REQUEST)
     if not card.otp_hash or not verify_password(payload.otp, card.otp_hash):
@@ -118,6 +164,7 @@ def activate_card(payload: DebitCardActivateRequest, db: DbSession, current_user
     card.activation_date = datetime.now(timezone.utc)
 
     log_action(db, "activate", "debit_card", card.id, current_user.id)
+    record_card_event(db, card, account.user_id)
     db.commit()
 
     return api_response("success", "Card activated", {"card_id": card.id})
@@ -125,16 +172,11 @@ def activate_card(payload: DebitCardActivateRequest, db: DbSession, current_user
 
 @router.delete("/{card_id}")
 def delete_card(card_id: int, db: DbSession, current_user: User = Depends(get_current_user)):
-    card = db.get(DebitCard, card_id)
-    if not card:
-        raise AppError("Card not found", status_code=status.HTTP_404_NOT_FOUND)
-
-    account = db.get(Account, card.account_id)
-    if not account or not _can_manage_card(current_user, account):
-        raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
+    card, account = _load_card(db, card_id, current_user)
 
     card.status = CardStatus.DISABLED
     log_action(db, "delete", "debit_card", card.id, current_user.id)
+    record_card_event(db, card, account.user_id)
     db.commit()
 
     return api_response("success", "Card disabled", {"card_id": card.id})
@@ -4,7 +4,7 @@ from decimal import Decimal, ROUND_HALF_UP
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy import select
 
-from app.core.dependencies import DbSession, get_current_user
+from app.core.dependencies import DbSession, get_admin_user, get_current_user
 from app.core.exceptions import AppError
 from app.core.response import api_response
 from app.models import (
@@ -16,8 +16,15 @@ from app.models import (
     TransactionType,
     User,
 )
-from app.schemas import DepositCreate, DepositOut
+from app.schemas import DepositCreate, DepositOut, DepositQuoteOut, DepositQuoteRequest
 from app.services.audit import log_action
+from app.services.deposit_accrual import accrue_deposits
+from app.services.deposit_installments import collect_installments, next_installment_date
+from app.services.deposit_math import accrued_interest, early_exit_penalty, principal_paid
+from app.services.deposit_maturity import mature_deposit, mature_deposits
+from app.services.deposit_quotes import quote_deposit
+from app.services.events import record_balance_event
+from app.services.unit_of_work import lock_accounts, run_in_transaction
 from app.services.utils import calculate_maturity_date, generate_transaction_reference
 
 router = APIRouter(prefix="/deposits", tags=["Deposits"])
@@ -29,35 +36,37 @@ def _can_access(current_user: User, account: Account) -> bool:
 
 @router.post("/")
 def create_deposit(payload: DepositCreate, db: DbSession, current_user: User = Depends(get_current_user)):
-    account = db.get(Account, payload.account_id)
-    if not account or account.is_deleted or not account.is_active:
-        raise AppError("Account not found", status_code=status.HTTP_404_NOT_FOUND)
-    if not _can_access(current_user, account):
-        raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
-
-    amount = Decimal(payload.amount).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-    if account.balance < amount:
-        raise AppError("Insufficient account balance", status_code=status.HTTP_400_BAD_REQUEST)
-
-    start_date = date.today()
-    maturity_date = calculate_maturity_date(start_date, payload.term_months)
-
-    account.balance -= amount
-    deposit = Deposit(
-        account_id=account.id,
-        deposit_type=payload.deposit_type,
-        term_months=payload.term_months,
-        amount=amount,
-        interest_rate=payload.interest_rate,
-        status=DepositStatus.ACTIVE,
-        start_date=start_date,
-        maturity_date=maturity_date,
-    )
-    db.add(deposit)
-    db.flush()
+    def _apply() -> int:
+        account = lock_accounts(db, [payload.account_id]).get(payload.account_id)
+        if not account or account.is_deleted or not account.is_active:
+            raise AppError("Account not found", status_code=status.HTTP_404_NOT_FOUND)
+        if not _can_access(current_user, account):
+            raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
+
+        amount = Decimal(payload.amount).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        if account.balance < amount:
+            raise AppError("Insufficient account balance", status_code=status.HTTP_400_BAD_REQUEST)
+
+        start_date = date.today()
+        maturity_date = calculate_maturity_date(start_date, payload.term_months)
+
+        account.balance -= amount
+        deposit = Deposit(
+            account_id=account.id,
+            deposit_type=payload.deposit_type,
+            term_months=payload.term_months,
+            amount=amount,
+            interest_rate=payload.interest_rate,
+            status=DepositStatus.ACTIVE,
+            start_date=start_date,
+            maturity_date=maturity_date,
+            installments_paid=1,
+        )
+        deposit.next_installment_date = next_installment_date(deposit)
+        db.add(deposit)
+        db.flush()
 
-    db.add(
-        Transaction(
+        transaction = Transaction(
             from_account_id=account.id,
             to_account_id=None,
             transaction_type=TransactionType.DEPOSIT_CREATE,
@@ -66,19 +75,29 @@ def create_deposit(payload: DepositCreate, db: DbSession, current_user: User = D
             status=TransactionStatus.SUCCESS,
             reference=generate_transaction_reference(),
         )
-    )
+        db.add(transaction)
+        db.flush()
+        record_balance_event(db, account, transaction)
+
+        log_action(
+            db,
+            "create",
+            "deposit",
+            deposit.id,
+            current_user.id,
+            {"account_id": account.id, "amount": str(amount), "deposit_type": payload.deposit_type.value},
+        )
+        return deposit.id
 
-    log_action(
-        db,
-        "create",
-        "deposit",
-        deposit.id,
-        current_user.id,
-        {"account_id": account.id, "amount": str(amount), "deposit_type": payload.deposit_type.value},
-    )
-    db.commit()
+    deposit_id = run_in_transaction(db, _apply, "deposit_create")
 
-    return api_response("success", "Deposit created", {"deposit_id": deposit.id})
+    return api_response("success", "Deposit created", {"deposit_id": deposit_id})
+
+
+@router.post("/quote")
+def quote(payload: DepositQuoteRequest, current_user: User = Depends(get_current_user)):
+    projection = quote_deposit(payload.deposit_type, payload.term_months, payload.amount, payload.interest_rate)
+    return api_response("success", "Deposit quote", {"quote": DepositQuoteOut.model_validate(projection).model_dump()})
 
 
 @router.get("/")
@@ -97,14 +116,32 @@ def list_deposits(
     return api_response("success", "Deposits fetched", {"items": [DepositOut.model_validate(item).model_dump() for item in deposits]})
 
 
+@router.post("/accrue")
+def run_accrual(current_user: User = Depends(get_admin_user), as_of: date | None = Query(default=None)):
+    summary = accrue_deposits(as_of, current_user.id)
+    return api_response("success", "Deposit interest accrued", summary)
+
+
+@router.post("/collect")
+def run_installments(current_user: User = Depends(get_admin_user), as_of: date | None = Query(default=None)):
+    summary = collect_installments(as_of, current_user.id)
+    return api_response("success", "Deposit installments collected", summary)
+
+
+@router.post("/mature")
+def run_maturity(current_user: User = Depends(get_admin_user), as_of: date | None = Query(default=None)):
+    summary = mature_deposits(as_of, current_user.id)
+    return api_response("success", "Matured deposits processed", summary)
+
+
 @router.get("/{deposit_id}")
 def get_deposit(deposit_id: int, db: DbSession, current_user: User = Depends(get_current_user)):
-    deposit = db.get(Deposit, deposit_id)
-    if not deposit:
+    row = db.execute(select(Deposit, Account).join(Account, Deposit.account_id == Account.id).where(Deposit.id == deposit_id)).first()
+    if not row:
         raise AppError("Deposit not found", status_code=status.HTTP_404_NOT_FOUND)
 
-    account = db.get(Account, deposit.account_id)
-    if not account or not _can_access(current_user, account):
+    deposit, account = row
+    if not _can_access(current_user, account):
         raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
 
     return api_response("success", "Deposit fetched", {"deposit": DepositOut.model_validate(deposit).model_dump()})
@@ -112,51 +149,90 @@ def get_deposit(deposit_id: int, db: DbSession, current_user: User = Depends(get
 
 @router.put("/{deposit_id}/cancel")
 def cancel_deposit(deposit_id: int, db: DbSession, current_user: User = Depends(get_current_user)):
-    deposit = db.get(Deposit, deposit_id)
-    if not deposit:
-        raise AppError("Deposit not found", status_code=status.HTTP_404_NOT_FOUND)
-    if deposit.status != DepositStatus.ACTIVE:
-        raise AppError("Only active deposits can be cancelled", status_code=status.HTTP_400_BAD_REQUEST)
-
-    account = db.get(Account, deposit.account_id)
-    if not account or not _can_access(current_user, account):
-        raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
-
-    today = date.today()
-    penalty = Decimal("0.00")
-    if today < deposit.maturity_date:
-        penalty = (deposit.amount * Decimal("0.01")).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-
-    credit_amount = (deposit.amount - penalty).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-    account.balance += credit_amount
-
-    deposit.status = DepositStatus.CANCELLED
-    deposit.penalty_amount = penalty
-    deposit.cancelled_at = datetime.now(timezone.utc)
-
-    db.add(
-        Transaction(
+    def _apply() -> tuple[DepositStatus, Decimal, Decimal]:
+        # One locking read for the deposit and its account instead of a plain read, the account
+        # lock and a locking refresh of the deposit.
+        row = db.execute(
+            select(Deposit, Account)
+            .join(Account, Deposit.account_id == Account.id)
+            .where(Deposit.id == deposit_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        ).first()
+        if not row:
+            raise AppError("Deposit not found", status_code=status.HTTP_404_NOT_FOUND)
+
+        deposit, account = row
+        if not _can_access(current_user, account):
+            raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
+
+        if deposit.status != DepositStatus.ACTIVE:
+            raise AppError("Only active deposits can be cancelled", status_code=status.HTTP_400_BAD_REQUEST)
+
+        today = date.today()
+        if today >= deposit.maturity_date:
+            # The maturity job has not reached this deposit yet: pay it out as the job would.
+            transaction = mature_deposit(deposit, account, datetime.now(timezone.utc))
+            db.add(transaction)
+            db.flush()
+            record_balance_event(db, account, transaction)
+            log_action(
+                db,
+                "mature",
+                "deposit",
+                deposit.id,
+                current_user.id,
+                {"interest": str(deposit.accrued_interest), "payout": str(deposit.payout_amount)},
+            )
+            return deposit.status, deposit.accrued_interest, Decimal("0.00")
+
+        # Interest is paid as recorded by the accrual job, brought up to today if the job has
+        # not run yet today.
+        if deposit.accrued_through != today:
+            deposit.accrued_interest = accrued_interest(deposit, today)
+            deposit.accrued_through = today
+        interest = deposit.accrued_interest
+        principal = principal_paid(deposit)
+        penalty = early_exit_penalty(principal)
+
+        credit_amount = principal + interest - penalty
+        account.balance += credit_amount
+
+        deposit.status = DepositStatus.CANCELLED
+        deposit.penalty_amount = penalty
+        deposit.next_installment_date = None
+        deposit.cancelled_at = datetime.now(timezone.utc)
+
+        transaction = Transaction(
             from_account_id=None,
             to_account_id=account.id,
             transaction_type=TransactionType.DEPOSIT_CANCEL,
             amount=credit_amount,
-            description=f"Deposit cancelled (penalty: {penalty})",
+            description=f"Deposit cancelled (interest: {interest}, penalty: {penalty})",
             status=TransactionStatus.SUCCESS,
             reference=generate_transaction_reference(),
         )
-    )
+        db.add(transaction)
+        db.flush()
+        record_balance_event(db, account, transaction)
+
+        log_action(
+            db,
+            "cancel",
+            "deposit",
+            deposit.id,
+            current_user.id,
+            {"interest": str(interest), "penalty": str(penalty), "credit_amount": str(credit_amount)},
+        )
+        return deposit.status, interest, penalty
 
-    log_action(
-        db,
-        "cancel",
-        "deposit",
-        deposit.id,
-        current_user.id,
-        {"penalty": str(penalty), "credit_amount": str(credit_amount)},
-    )
-    db.commit()
+    deposit_status, interest, penalty = run_in_transaction(db, _apply, "deposit_cancel")
 
-    return api_response("success", "Deposit cancelled", {"deposit_id": deposit.id, "penalty": str(penalty)})
+    return api_response(
+        "success",
+        "Deposit matured" if deposit_status == DepositStatus.MATURED else "Deposit cancelled",
+        {"deposit_id": deposit_id, "status": deposit_status.value, "interest": str(interest), "penalty": str(penalty)},
+    )
 
 
 @router.delete("/{deposit_id}")
@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, Query
+
+from app.core.config import settings
+from app.core.dependencies import get_admin_user
+from app.core.response import api_response
+from app.core.slow_queries import slow_query_log
+from app.models import User
+
+router = APIRouter(prefix="/diagnostics", tags=["Diagnostics"])
+
+
+@router.get("/slow-queries")
+def list_slow_queries(_: User = Depends(get_admin_user), limit: int = Query(default=20, ge=1, le=200)):
+    return api_response(
+        "success",
+        "Slow queries fetched",
+        {"threshold_ms": settings.slow_query_threshold_ms, "items": slow_query_log.top(limit)},
+    )
+
+
+@router.delete("/slow-queries")
+def reset_slow_queries(_: User = Depends(get_admin_user)):
+    slow_query_log.reset()
+    return api_response("success", "Slow query log cleared")
@@ -0,0 +1,112 @@
+import asyncio
+import json
+from time import monotonic
+
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.dependencies import DbSession, get_current_user
+from app.core.response import api_response
+from app.models import OutboxEvent, User
+from app.schemas import OutboxEventOut
+from app.services.events import dispatcher, fetch_events, fetch_events_by_id
+
+router = APIRouter(prefix="/events", tags=["Events"])
+
+REPLAY_PAGE_SIZE = 500
+
+
+def _format_sse(outbox_event: OutboxEvent) -> str:
+    data = json.dumps(OutboxEventOut.model_validate(outbox_event).model_dump(mode="json"))
+    return f"id: {outbox_event.id}\nevent: {outbox_event.event_type}\ndata: {data}\n\n"
+
+
+def _replay_page(user_id: int, is_admin: bool, after_id: int) -> list[OutboxEvent]:
+    with SessionLocal() as session:
+        return fetch_events(session, user_id, is_admin, after_id, REPLAY_PAGE_SIZE)
+
+
+def _replay_late(user_id: int, is_admin: bool, event_ids: list[int]) -> list[OutboxEvent]:
+    with SessionLocal() as session:
+        return fetch_events_by_id(session, user_id, is_admin, event_ids)
+
+
+@router.get("/")
+def list_events(
+    db: DbSession,
+    current_user: User = Depends(get_current_user),
+    after_id: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=REPLAY_PAGE_SIZE),
+):
+    events = fetch_events(db, current_user.id, current_user.is_admin, after_id, limit)
+    return api_response("success", "Events fetched", {"items": [OutboxEventOut.model_validate(item).model_dump() for item in events]})
+
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    last_event_id: int | None = Header(default=None, alias="Last-Event-ID"),
+    after_id: int | None = Query(default=None, ge=0),
+):
+    user_id, is_admin = current_user.id, current_user.is_admin
+    resume_from = last_event_id if last_event_id is not None else after_id
+
+    async def _events():
+        subscription = dispatcher.subscribe(user_id, is_admin)
+        # Ids can commit out of order, so a stream remembers what it sent within the gap window
+        # rather than a high-water mark: a late lower id is still delivered, a replayed one that
+        # is also queued live is not sent twice.
+        sent: dict[int, float] = {}
+
+        def _send(outbox_event: OutboxEvent) -> str | None:
+            now = monotonic()
+            expired_before = now - settings.event_gap_timeout_seconds
+            for event_id in [event_id for event_id, sent_at in sent.items() if sent_at < expired_before]:
+                del sent[event_id]
+            if outbox_event.id in sent:
+                return None
+            sent[outbox_event.id] = now
+            return _format_sse(outbox_event)
+
+        try:
+            if resume_from is not None:
+                # Events that committed late below the resume point were dispatched after the
+                # client's last id; they may have been missed while it was disconnected.
+                late_ids = dispatcher.late_ids(resume_from)
+                late = await run_in_threadpool(_replay_late, user_id, is_admin, late_ids) if late_ids else []
+                for outbox_event in late:
+                    if message := _send(outbox_event):
+                        yield message
+
+                cursor = resume_from
+                while True:
+                    page = await run_in_threadpool(_replay_page, user_id, is_admin, cursor)
+                    for outbox_event in page:
+                        if message := _send(outbox_event):
+                            yield message
+                    if len(page) < REPLAY_PAGE_SIZE:
+                        break
+                    cursor = page[-1].id
+
+            while not await request.is_disconnected():
+                try:
+                    outbox_event = await asyncio.wait_for(subscription.queue.get(), timeout=settings.event_keepalive_seconds)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if outbox_event is None:
+                    break
+                if message := _send(outbox_event):
+                    yield message
+        finally:
+            dispatcher.unsubscribe(subscription)
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,17 +1,24 @@
+from datetime import date
 from decimal import Decimal, ROUND_HALF_UP
+from typing import Literal
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, File, Query, UploadFile, status
 from sqlalchemy import select
 
+from app.core.config import settings
 from app.core.dependencies import DbSession, get_admin_user, get_current_user
 from app.core.exceptions import AppError
 from app.core.response import api_response
 from app.models import (
-    Account,
+    FundOrderStatus,
     MutualFund,
     MutualFundHolding,
+    MutualFundOrder,
     MutualFundTrade,
     FundTradeType,
+    SipExecution,
+    SipInstruction,
+    SipStatus,
     Transaction,
     TransactionStatus,
     TransactionType,
@@ -22,11 +29,24 @@ from app.schemas import (
     FundTradeRequest,
     MutualFundCreate,
     MutualFundHoldingOut,
+    MutualFundNavOut,
+    MutualFundOrderOut,
     MutualFundOut,
     MutualFundTradeOut,
     MutualFundUpdate,
+    SipCreate,
+    SipExecutionOut,
+    SipInstructionOut,
 )
 from app.services.audit import log_action
+from app.services.events import record_balance_event, record_fund_order_event
+from app.services.fund_catalogue import fund_catalogue
+from app.services.fund_navs import import_nav_file, nav_history, record_nav
+from app.services.fund_orders import execute_pending_orders, place_order
+from app.services.portfolio import firm_summary, user_portfolio
+from app.services.record_files import detect_format
+from app.services.sips import create_sip, run_due_sips
+from app.services.unit_of_work import lock_accounts, run_in_transaction
 from app.services.utils import generate_transaction_reference
 
 router = APIRouter(prefix="/mutual-funds", tags=["Mutual Funds"])
@@ -41,6 +61,7 @@ def create_fund(payload: MutualFundCreate, db: DbSession, current_user: User = D
     fund = MutualFund(name=payload.name, symbol=payload.symbol.upper(), nav=payload.nav, is_active=True)
     db.add(fund)
     db.flush()
+    fund_catalogue.mark_changed(db)
     log_action(db, "create", "mutual_fund", fund.id, current_user.id, {"symbol": fund.symbol})
     db.commit()
 
@@ -49,7 +70,7 @@ def create_fund(payload: MutualFundCreate, db: DbSession, current_user: User = D
 
 @router.get("/")
 def list_funds(db: DbSession, current_user: User = Depends(get_current_user)):
-    funds = db.execute(select(MutualFund).where(MutualFund.is_active.is_(True)).order_by(MutualFund.id)).scalars().all()
+    funds = fund_catalogue.get(db).active
     return api_response("success", "Mutual funds fetched", {"items": [MutualFundOut.model_validate(fund).model_dump() for fund in funds]})
 
 
@@ -67,6 +88,24 @@ def list_holdings(db: DbSession, current_user: User = Depends(get_current_user))
     )
 
 
+@router.get("/portfolio")
+def get_portfolio(
+    db: DbSession,
+    current_user: User = Depends(get_current_user),
+    user_id: int | None = Query(default=None),
+):
+    if user_id is not None and user_id != current_user.id and not current_user.is_admin:
+        raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
+
+    portfolio = user_portfolio(db, user_id if user_id is not None else current_user.id)
+    return api_response("success", "Portfolio fetched", portfolio)
+
+
+@router.get("/portfolio/summary")
+def get_portfolio_summary(db: DbSession, current_user: User = Depends(get_admin_user)):
+    return api_response("success", "Portfolio summary fetched", firm_summary(db))
+
+
 @router.get("/trades")
 def list_trades(db: DbSession, current_user: User = Depends(get_current_user)):
     stmt = select(MutualFundTrade)
@@ -84,12 +123,46 @@ def update_fund(fund_id: int, payload: MutualFundUpdate, db: DbSession, current_
         raise AppError("Fund not found", status_code=status.HTTP_404_NOT_FOUND)
 
     fund.nav = payload.nav
+    fund.nav_version += 1
+    record_nav(db, fund.id, payload.nav)
+    fund_catalogue.mark_changed(db)
     log_action(db, "update", "mutual_fund", fund.id, current_user.id, {"nav": str(payload.nav)})
     db.commit()
 
     return api_response("success", "Mutual fund updated", {"fund_id": fund.id})
 
 
+@router.post("/navs/upload")
+def upload_navs(
+    db: DbSession,
+    current_user: User = Depends(get_admin_user),
+    file: UploadFile = File(...),
+    file_format: Literal["csv", "json", "ndjson"] | None = Query(default=None, alias="format"),
+):
+    file_format = file_format or detect_format(file.filename, file.content_type)
+    summary = import_nav_file(db, file.file, file_format, settings.nav_upload_max_rows)
+    fund_catalogue.mark_changed(db)
+    log_action(db, "bulk_update", "mutual_fund", None, current_user.id, {"filename": file.filename, **summary})
+    db.commit()
+
+    return api_response("success", "Mutual fund NAVs uploaded", summary)
+
+
+@router.get("/{fund_id}/navs")
+def list_fund_navs(
+    fund_id: int,
+    db: DbSession,
+    current_user: User = Depends(get_current_user),
+    date_from: date | None = Query(default=None),
+    date_to: date | None = Query(default=None),
+):
+    if not fund_catalogue.fund(db, fund_id):
+        raise AppError("Fund not found", status_code=status.HTTP_404_NOT_FOUND)
+
+    navs = nav_history(db, fund_id, date_from, date_to)
+    return api_response("success", "Mutual fund NAV history fetched", {"items": [MutualFundNavOut.model_validate(nav).model_dump() for nav in navs]})
+
+
 @router.delete("/{fund_id}")
 def deactivate_fund(fund_id: int, db: DbSession, current_user: User = Depends(get_admin_user)):
     fund = db.get(MutualFund, fund_id)
@@ -97,6 +170,7 @@ def deactivate_fund(fund_id: int, db: DbSession, current_user: User = Depends(ge
         raise AppError("Fund not found", status_code=status.HTTP_404_NOT_FOUND)
 
     fund.is_active = False
+    fund_catalogue.mark_changed(db)
     log_action(db, "delete", "mutual_fund", fund.id, current_user.id)
     db.commit()
 
@@ -105,154 +179,286 @@ def deactivate_fund(fund_id: int, db: DbSession, current_user: User = Depends(ge
 
 @router.post("/buy")
 def buy_fund(payload: FundTradeRequest, db: DbSession, current_user: User = Depends(get_current_user)):
-    account = db.get(Account, payload.account_id)
-    if not account or account.is_deleted or not account.is_active:
-        raise AppError("Account not found", status_code=status.HTTP_404_NOT_FOUND)
-    if not current_user.is_admin and account.user_id != current_user.id:
-        raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
-
-    fund = db.get(MutualFund, payload.fund_id)
-    if not fund or not fund.is_active:
-        raise AppError("Mutual fund not found", status_code=status.HTTP_404_NOT_FOUND)
+    if settings.fund_order_mode == "order_book":
+        order = place_order(db, current_user, payload.account_id, payload.fund_id, FundTradeType.BUY, amount=payload.amount)
+        db.commit()
+        return api_response("success", "Mutual fund buy order accepted", {"order_id": order.id, "status": order.status.value})
+
+    def _apply() -> int:
+        account = lock_accounts(db, [payload.account_id]).get(payload.account_id)
+        if not account or account.is_deleted or not account.is_active:
+            raise AppError("Account not found", status_code=status.HTTP_404_NOT_FOUND)
+        if not current_user.is_admin and account.user_id != current_user.id:
+            raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
+
+        fund = fund_catalogue.fund(db, payload.fund_id)
+        if not fund or not fund.is_active:
+            raise AppError("Mutual fund not found", status_code=status.HTTP_404_NOT_FOUND)
+
+        amount = Decimal(payload.amount).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        if account.balance < amount:
+            raise AppError("Insufficient account balance", status_code=status.HTTP_400_BAD_REQUEST)
+
+        units = (amount / Decimal(fund.nav)).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
+
+        holding = db.execute(
+            select(MutualFundHolding).where(
+                MutualFundHolding.user_id == account.user_id,
+                MutualFundHolding.account_id == account.id,
+                MutualFundHolding.fund_id == fund.id,
+            )
+        ).scalar_one_or_none()
+
+        account.balance -= amount
+
+        if not holding:
+            holding = MutualFundHolding(
+                user_id=account.user_id,
+                account_id=account.id,
+                fund_id=fund.id,
+                units=units,
+                average_nav=Decimal(fund.nav),
+            )
+            db.add(holding)
+        else:
+            total_cost = (holding.units * holding.average_nav) + amount
+            new_units = (holding.units + units).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
+            holding.average_nav = (total_cost / new_units).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
+            holding.units = new_units
+
+        trade = MutualFundTrade(
+            user_id=account.user_id,
+            account_id=account.id,
+            fund_id=fund.id,
+            trade_type=FundTradeType.BUY,
+            nav=fund.nav,
+            nav_version=fund.nav_version,
+            units=units,
+            amount=amount,
+        )
+        db.add(trade)
+        db.flush()
+
+        transaction = Transaction(
+            from_account_id=account.id,
+            to_account_id=None,
+            transaction_type=TransactionType.MUTUAL_FUND_BUY,
+            amount=amount,
+            description=f"Mutual fund buy: {fund.symbol}",
+            status=TransactionStatus.SUCCESS,
+            reference=generate_transaction_reference(),
+        )
+        db.add(transaction)
+        db.flush()
+        record_balance_event(db, account, transaction)
+
+        log_action(
+            db,
+            "buy",
+            "mutual_fund",
+            fund.id,
+            current_user.id,
+            {"account_id": account.id, "amount": str(amount), "units": str(units)},
+        )
+        return trade.id
 
-    amount = Decimal(payload.amount).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-    if account.balance < amount:
-        raise AppError("Insufficient account balance", status_code=status.HTTP_400_BAD_REQUEST)
+    trade_id = run_in_transaction(db, _apply, "fund_buy")
 
-    units = (amount / Decimal(fund.nav)).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
+    return api_response("success", "Mutual fund purchased", {"trade_id": trade_id})
 
-    holding = db.execute(
-        select(MutualFundHolding).where(
-            MutualFundHolding.user_id == account.user_id,
-            MutualFundHolding.account_id == account.id,
-            MutualFundHolding.fund_id == fund.id,
-        )
-    ).scalar_one_or_none()
 
-    account.balance -= amount
-
-    if not holding:
-        holding = MutualFundHolding(
+@router.post("/sell")
+def sell_fund(payload: FundSellRequest, db: DbSession, current_user: User = Depends(get_current_user)):
+    if settings.fund_order_mode == "order_book":
+        order = place_order(db, current_user, payload.account_id, payload.fund_id, FundTradeType.SELL, units=payload.units)
+        db.commit()
+        return api_response("success", "Mutual fund sell order accepted", {"order_id": order.id, "status": order.status.value})
+
+    def _apply() -> int:
+        account = lock_accounts(db, [payload.account_id]).get(payload.account_id)
+        if not account or account.is_deleted or not account.is_active:
+            raise AppError("Account not found", status_code=status.HTTP_404_NOT_FOUND)
+        if not current_user.is_admin and account.user_id != current_user.id:
+            raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
+
+        fund = fund_catalogue.fund(db, payload.fund_id)
+        if not fund:
+            raise AppError("Mutual fund not found", status_code=status.HTTP_404_NOT_FOUND)
+
+        holding = db.execute(
+            select(MutualFundHolding).where(
+                MutualFundHolding.user_id == account.user_id,
+                MutualFundHolding.account_id == account.id,
+                MutualFundHolding.fund_id == fund.id,
+            )
+        ).scalar_one_or_none()
+
+        if not holding or holding.units < payload.units:
+            raise AppError("Insufficient holding units", status_code=status.HTTP_400_BAD_REQUEST)
+
+        units = Decimal(payload.units).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
+        amount = (units * Decimal(fund.nav)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+        holding.units = (holding.units - units).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
+        if holding.units <= Decimal("0.0000"):
+            db.delete(holding)
+
+        account.balance += amount
+
+        trade = MutualFundTrade(
             user_id=account.user_id,
             account_id=account.id,
             fund_id=fund.id,
+            trade_type=FundTradeType.SELL,
+            nav=fund.nav,
+            nav_version=fund.nav_version,
             units=units,
-            average_nav=Decimal(fund.nav),
+            amount=amount,
         )
-        db.add(holding)
-    else:
-        total_cost = (holding.units * holding.average_nav) + amount
-        new_units = (holding.units + units).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
-        holding.average_nav = (total_cost / new_units).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
-        holding.units = new_units
-
-    trade = MutualFundTrade(
-        user_id=account.user_id,
-        account_id=account.id,
-        fund_id=fund.id,
-        trade_type=FundTradeType.BUY,
-        nav=fund.nav,
-        units=units,
-        amount=amount,
-    )
-    db.add(trade)
-    db.flush()
+        db.add(trade)
+        db.flush()
+
+        transaction = Transaction(
+            from_account_id=None,
+            to_account_id=account.id,
+            transaction_type=TransactionType.MUTUAL_FUND_SELL,
+            amount=amount,
+            description=f"Mutual fund sell: {fund.symbol}",
+            status=TransactionStatus.SUCCESS,
+            reference=generate_transaction_reference(),
+        )
+        db.add(transaction)
+        db.flush()
+        record_balance_event(db, account, transaction)
+
+        log_action(
+            db,
+            "sell",
+            "mutual_fund",
+            fund.id,
+            current_user.id,
+            {"account_id": account.id, "amount": str(amount), "units": str(units)},
+        )
+        return trade.id
 
-    transaction = Transaction(
-        from_account_id=account.id,
-        to_account_id=None,
-        transaction_type=TransactionType.MUTUAL_FUND_BUY,
-        amount=amount,
-        description=f"Mutual fund buy: {fund.symbol}",
-        status=TransactionStatus.SUCCESS,
-        reference=generate_transaction_reference(),
-    )
-    db.add(transaction)
-
-    log_action(
-        db,
-        "buy",
-        "mutual_fund",
-        fund.id,
-        current_user.id,
-        {"account_id": account.id, "amount": str(amount), "units": str(units)},
-    )
+    trade_id = run_in_transaction(db, _apply, "fund_sell")
+
+    return api_response("success", "Mutual fund sold", {"trade_id": trade_id})
+
+
+@router.get("/orders")
+def list_orders(
+    db: DbSession,
+    current_user: User = Depends(get_current_user),
+    order_status: FundOrderStatus | None = Query(default=None, alias="status"),
+):
+    stmt = select(MutualFundOrder)
+    if not current_user.is_admin:
+        stmt = stmt.where(MutualFundOrder.user_id == current_user.id)
+    if order_status:
+        stmt = stmt.where(MutualFundOrder.status == order_status)
+
+    orders = db.execute(stmt.order_by(MutualFundOrder.id.desc())).scalars().all()
+    return api_response("success", "Mutual fund orders fetched", {"items": [MutualFundOrderOut.model_validate(order).model_dump() for order in orders]})
+
+
+@router.put("/orders/{order_id}/cancel")
+def cancel_order(order_id: int, db: DbSession, current_user: User = Depends(get_current_user)):
+    def _apply() -> None:
+        order = db.get(MutualFundOrder, order_id)
+        if not order:
+            raise AppError("Order not found", status_code=status.HTTP_404_NOT_FOUND)
+        if not current_user.is_admin and order.user_id != current_user.id:
+            raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
+
+        db.refresh(order, with_for_update=True)
+        if order.status != FundOrderStatus.PENDING:
+            raise AppError("Only pending orders can be cancelled", status_code=status.HTTP_400_BAD_REQUEST)
+
+        order.status = FundOrderStatus.CANCELLED
+        db.flush()
+        record_fund_order_event(db, order)
+        log_action(db, "cancel_order", "mutual_fund", order.fund_id, current_user.id, {"order_id": order.id})
+
+    run_in_transaction(db, _apply, "fund_order_cancel")
+
+    return api_response("success", "Mutual fund order cancelled", {"order_id": order_id})
+
+
+@router.post("/orders/execute")
+def execute_orders(current_user: User = Depends(get_admin_user)):
+    summary = execute_pending_orders(current_user.id)
+    return api_response("success", "Mutual fund orders executed", summary)
+
+
+@router.post("/sips")
+def create_sip_instruction(payload: SipCreate, db: DbSession, current_user: User = Depends(get_current_user)):
+    instruction = create_sip(db, current_user, payload.account_id, payload.fund_id, payload.amount, payload.frequency, payload.start_date)
     db.commit()
+    db.refresh(instruction)
+    return api_response("success", "SIP created", {"sip": SipInstructionOut.model_validate(instruction).model_dump()})
 
-    return api_response("success", "Mutual fund purchased", {"trade_id": trade.id})
 
+@router.get("/sips")
+def list_sips(
+    db: DbSession,
+    current_user: User = Depends(get_current_user),
+    sip_status: SipStatus | None = Query(default=None, alias="status"),
+):
+    stmt = select(SipInstruction)
+    if not current_user.is_admin:
+        stmt = stmt.where(SipInstruction.user_id == current_user.id)
+    if sip_status:
+        stmt = stmt.where(SipInstruction.status == sip_status)
 
-@router.post("/sell")
-def sell_fund(payload: FundSellRequest, db: DbSession, current_user: User = Depends(get_current_user)):
-    account = db.get(Account, payload.account_id)
-    if not account or account.is_deleted or not account.is_active:
-        raise AppError("Account not found", status_code=status.HTTP_404_NOT_FOUND)
-    if not current_user.is_admin and account.user_id != current_user.id:
+    instructions = db.execute(stmt.order_by(SipInstruction.id.desc())).scalars().all()
+    return api_response("success", "SIPs fetched", {"items": [SipInstructionOut.model_validate(item).model_dump() for item in instructions]})
+
+
+@router.get("/sips/{sip_id}/executions")
+def list_sip_executions(sip_id: int, db: DbSession, current_user: User = Depends(get_current_user)):
+    instruction = db.get(SipInstruction, sip_id)
+    if not instruction:
+        raise AppError("SIP not found", status_code=status.HTTP_404_NOT_FOUND)
+    if not current_user.is_admin and instruction.user_id != current_user.id:
         raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
 
-    fund = db.get(MutualFund, payload.fund_id)
-    if not fund:
-        raise AppError("Mutual fund not found", status_code=status.HTTP_404_NOT_FOUND)
+    executions = db.execute(
+        select(SipExecution).where(SipExecution.instruction_id == sip_id).order_by(SipExecution.run_date.desc())
+    ).scalars().all()
+    return api_response("success", "SIP executions fetched", {"items": [SipExecutionOut.model_validate(item).model_dump() for item in executions]})
 
-    holding = db.execute(
-        select(MutualFundHolding).where(
-            MutualFundHolding.user_id == account.user_id,
-            MutualFundHolding.account_id == account.id,
-            MutualFundHolding.fund_id == fund.id,
-        )
-    ).scalar_one_or_none()
 
-    if not holding or holding.units < payload.units:
-        raise AppError("Insufficient holding units", status_code=status.HTTP_400_BAD_REQUEST)
+@router.put("/sips/{sip_id}/cancel")
+def cancel_sip(sip_id: int, db: DbSession, current_user: User = Depends(get_current_user)):
+    def _apply() -> None:
+        instruction = db.get(SipInstruction, sip_id)
+        if not instruction:
+            raise AppError("SIP not found", status_code=status.HTTP_404_NOT_FOUND)
+        if not current_user.is_admin and instruction.user_id != current_user.id:
+            raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
 
-    units = Decimal(payload.units).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
-    amount = (units * Decimal(fund.nav)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        db.refresh(instruction, with_for_update=True)
+        if instruction.status != SipStatus.ACTIVE:
+            raise AppError("Only active SIPs can be cancelled", status_code=status.HTTP_400_BAD_REQUEST)
 
-    holding.units = (holding.units - units).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
-    if holding.units <= Decimal("0.0000"):
-        db.delete(holding)
+        instruction.status = SipStatus.CANCELLED
+        log_action(db, "cancel_sip", "mutual_fund", instruction.fund_id, current_user.id, {"sip_id": instruction.id})
 
-    account.balance += amount
+    run_in_transaction(db, _apply, "sip_cancel")
 
-    trade = MutualFundTrade(
-        user_id=account.user_id,
-        account_id=account.id,
-        fund_id=fund.id,
-        trade_type=FundTradeType.SELL,
-        nav=fund.nav,
-        units=units,
-        amount=amount,
-    )
-    db.add(trade)
-    db.flush()
+    return api_response("success", "SIP cancelled", {"sip_id": sip_id})
 
-    transaction = Transaction(
-        from_account_id=None,
-        to_account_id=account.id,
-        transaction_type=TransactionType.MUTUAL_FUND_SELL,
-        amount=amount,
-        description=f"Mutual fund sell: {fund.symbol}",
-        status=TransactionStatus.SUCCESS,
-        reference=generate_transaction_reference(),
-    )
-    db.add(transaction)
-
-    log_action(
-        db,
-        "sell",
-        "mutual_fund",
-        fund.id,
-        current_user.id,
-        {"account_id": account.id, "amount": str(amount), "units": str(units)},
-    )
-    db.commit()
 
-    return api_response("success", "Mutual fund sold", {"trade_id": trade.id})
+@router.post("/sips/run")
+def run_sips(current_user: User = Depends(get_admin_user), run_date: date | None = Query(default=None)):
+    summary = run_due_sips(run_date, current_user.id)
+    return api_response("success", "SIPs executed", summary)
 
 
 @router.get("/{fund_id}")
 def get_fund(fund_id: int, db: DbSession, current_user: User = Depends(get_current_user)):
-    fund = db.get(MutualFund, fund_id)
+    fund = fund_catalogue.fund(db, fund_id)
     if not fund:
         raise AppError("Fund not found", status_code=status.HTTP_404_NOT_FOUND)
     return api_response("success", "Mutual fund fetched", {"fund": MutualFundOut.model_validate(fund).model_dump()})
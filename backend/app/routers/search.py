@@ -0,0 +1,67 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy import or_, select
+
+from app.core.dependencies import DbSession, get_admin_user, get_current_user
+from app.core.exceptions import AppError
+from app.core.response import api_response
+from app.models import Account, Transaction, User
+from app.schemas import AccountOut, AuditLogOut, TransactionOut, UserOut
+from app.services.customer_search import search_customers
+from app.services.search import AUDIT_LOG, TRANSACTION, search_index, tokenize
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+_SOURCES = {"transactions": TRANSACTION, "audit_logs": AUDIT_LOG}
+_SCHEMAS = {TRANSACTION: TransactionOut, AUDIT_LOG: AuditLogOut}
+
+
+@router.get("/")
+def search(
+    db: DbSession,
+    current_user: User = Depends(get_current_user),
+    q: str = Query(min_length=1, max_length=200),
+    source: Literal["transactions", "audit_logs"] = Query(default="transactions"),
+    page: int = Query(default=1, ge=1),
+    page_size: int = Query(default=20, ge=1, le=100),
+):
+    if not tokenize(q):
+        raise AppError("Search query must contain letters or digits", status_code=status.HTTP_400_BAD_REQUEST)
+
+    search_source = _SOURCES[source]
+    filters = []
+    if search_source == AUDIT_LOG and not current_user.is_admin:
+        raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
+    if search_source == TRANSACTION and not current_user.is_admin:
+        owned = select(Account.id).where(Account.user_id == current_user.id, Account.is_deleted.is_(False))
+        filters.append(or_(Transaction.from_account_id.in_(owned), Transaction.to_account_id.in_(owned)))
+
+    results = search_index.search(db, search_source, q, filters, offset=(page - 1) * page_size, limit=page_size + 1)
+    schema = _SCHEMAS[search_source]
+    items = [{"score": score, search_source: schema.model_validate(item).model_dump()} for item, score in results[:page_size]]
+    return api_response(
+        "success",
+        "Search results fetched",
+        {"items": items, "page": page, "page_size": page_size, "has_more": len(results) > page_size},
+    )
+
+
+@router.get("/customers")
+def search_customers_route(
+    db: DbSession,
+    _: User = Depends(get_admin_user),
+    q: str = Query(min_length=1, max_length=200),
+    field: Literal["name", "email", "contact", "account_number"] = Query(default="name"),
+    cursor: str | None = Query(default=None, max_length=500),
+    page_size: int = Query(default=20, ge=1, le=100),
+):
+    hits, next_cursor = search_customers(db, field, q, cursor, page_size)
+    items = [
+        {
+            "user": UserOut.model_validate(user).model_dump(),
+            "account": AccountOut.model_validate(account).model_dump() if account is not None else None,
+        }
+        for user, account in hits
+    ]
+    return api_response("success", "Customers fetched", {"items": items, "page_size": page_size, "next_cursor": next_cursor})
@@ -1,3 +1,4 @@
+import logging
 from datetime import datetime
 from decimal import Decimal
 
@@ -10,9 +11,12 @@ from app.core.response import api_response
 from app.models import Account, Transaction, TransactionStatus, TransactionType, User
 from app.schemas import TransactionOut, TransactionUpdate, TransferRequest
 from app.services.audit import log_action
+from app.services.events import record_balance_event
+from app.services.unit_of_work import lock_accounts, run_in_transaction
 from app.services.utils import generate_transaction_reference
 
 router = APIRouter(prefix="/transactions", tags=["Transactions"])
+logger = logging.getLogger(__name__)
 
 
 def _owned_account_ids(db: DbSession, user_id: int) -> set[int]:
@@ -27,81 +31,78 @@ def transfer_funds(payload: TransferRequest, db: DbSession, current_user: User =
     if payload.to_account_id is not None and payload.to_account_id == payload.from_account_id:
         raise AppError("from_account_id and to_account_id cannot be same", status_code=status.HTTP_400_BAD_REQUEST)
 
-    from_account = db.execute(
-        select(Account)
-        .where(Account.id == payload.from_account_id, Account.is_deleted.is_(False), Account.is_active.is_(True))
-        .with_for_update()
-    ).scalar_one_or_none()
-    if not from_account:
-        raise AppError("Source account not found", status_code=status.HTTP_404_NOT_FOUND)
+    def _apply() -> int:
+        accounts = lock_accounts(db, [payload.from_account_id, payload.to_account_id])
 
-    if not current_user.is_admin and from_account.user_id != current_user.id:
-        raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
+        from_account = accounts.get(payload.from_account_id)
+        if not from_account or from_account.is_deleted or not from_account.is_active:
+            raise AppError("Source account not found", status_code=status.HTTP_404_NOT_FOUND)
+
+        if not current_user.is_admin and from_account.user_id != current_user.id:
+            raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
+
+        to_account = None
+        if payload.to_account_id is not None:
+            to_account = accounts.get(payload.to_account_id)
+            if not to_account or to_account.is_deleted or not to_account.is_active:
+                raise AppError("Destination account not found", status_code=status.HTTP_404_NOT_FOUND)
+
+        amount = Decimal(payload.amount)
+        if from_account.balance < amount:
+            raise AppError("Insufficient balance", status_code=status.HTTP_400_BAD_REQUEST)
+
+        from_account.balance -= amount
+        if to_account:
+            to_account.balance += amount
+
+        reference = None
+        for _ in range(6):
+            candidate = generate_transaction_reference()
+            existing = db.execute(select(Transaction.id).where(Transaction.reference == candidate)).scalar_one_or_none()
+            if not existing:
+                reference = candidate
+                break
+        if not reference:
+            raise AppError("Failed to generate transaction reference", status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        transaction = Transaction(
+            from_account_id=from_account.id,
+            to_account_id=to_account.id if to_account else None,
+            transaction_type=TransactionType.TRANSFER,
+            amount=amount,
+            description=payload.description,
+            external_bank_name=payload.external_bank_name,
+            status=TransactionStatus.SUCCESS,
+            reference=reference,
+        )
+        db.add(transaction)
+        db.flush()
+        record_balance_event(db, from_account, transaction)
+        if to_account:
+            record_balance_event(db, to_account, transaction)
+        log_action(
+            db,
+            "transfer",
+            "transaction",
+            transaction.id,
+            current_user.id,
+            {
+                "from_account_id": from_account.id,
+                "to_account_id": to_account.id if to_account else None,
+                "amount": str(amount),
+            },
+        )
+        return transaction.id
 
-    to_account = None
-    if payload.to_account_id is not None:
-        to_account = db.execute(
-            select(Account)
-            .where(Account.id == payload.to_account_id, Account.is_deleted.is_(False), Account.is_active.is_(True))
-            .with_for_update()
-        ).scalar_one_or_none()
-        if not to_account:
-            raise AppError("Destination account not found", status_code=status.HTTP_404_NOT_FOUND)
-
-    amount = Decimal(payload.amount)
-    if from_account.balance < amount:
-        raise AppError("Insufficient balance", status_code=status.HTTP_400_BAD_REQUEST)
-
-    transaction = None
     try:
-        with db.begin_nested():
-            from_account.balance -= amount
-            if to_account:
-                to_account.balance += amount
-
-            reference = None
-            for _ in range(6):
-                candidate = generate_transaction_reference()
-                existing = db.execute(select(Transaction.id).where(Transaction.reference == candidate)).scalar_one_or_none()
-                if not existing:
-                    reference = candidate
-                    break
-            if not reference:
-                raise AppError("Failed to generate transaction reference", status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-            transaction = Transaction(
-                from_account_id=from_account.id,
-                to_account_id=to_account.id if to_account else None,
-                transaction_type=TransactionType.TRANSFER,
-                amount=amount,
-                description=payload.description,
-                external_bank_name=payload.external_bank_name,
-                status=TransactionStatus.SUCCESS,
-                reference=reference,
-            )
-            db.add(transaction)
-            db.flush()
-            log_action(
-                db,
-                "transfer",
-                "transaction",
-                transaction.id,
-                current_user.id,
-                {
-                    "from_account_id": from_account.id,
-                    "to_account_id": to_account.id if to_account else None,
-                    "amount": str(amount),
-                },
-            )
-        db.commit()
+        transaction_id = run_in_transaction(db, _apply, "transfer")
     except AppError:
-        db.rollback()
         raise
     except Exception as exc:
-        db.rollback()
-        raise AppError(f"Transfer failed: {exc}", status_code=status.HTTP_500_INTERNAL_SERVER_ERROR) from exc
+        logger.exception("Transfer from account %s failed", payload.from_account_id)
+        raise AppError("Transfer failed", status_code=status.HTTP_500_INTERNAL_SERVER_ERROR) from exc
 
-    return api_response("success", "Transaction successful", {"transaction_id": transaction.id})
+    return api_response("success", "Transaction successful", {"transaction_id": transaction_id})
 
 
 @router.get("/")
@@ -147,14 +148,23 @@ def list_transactions(
 
 @router.get("/{transaction_id}")
 def get_transaction(transaction_id: int, db: DbSession, current_user: User = Depends(get_current_user)):
-    txn = db.get(Transaction, transaction_id)
-    if not txn:
+    # Ownership is checked in the same statement rather than by loading every account id of the user.
+    owned = (
+        select(Account.id)
+        .where(
+            Account.user_id == current_user.id,
+            Account.is_deleted.is_(False),
+            Account.id.in_([Transaction.from_account_id, Transaction.to_account_id]),
+        )
+        .exists()
+    )
+    row = db.execute(select(Transaction, owned.label("owned")).where(Transaction.id == transaction_id)).first()
+    if not row:
         raise AppError("Transaction not found", status_code=status.HTTP_404_NOT_FOUND)
 
-    if not current_user.is_admin:
-        owned = _owned_account_ids(db, current_user.id)
-        if (txn.from_account_id not in owned) and (txn.to_account_id not in owned):
-            raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
+    txn, is_owner = row
+    if not current_user.is_admin and not is_owner:
+        raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
 
     return api_response("success", "Transaction fetched", {"transaction": TransactionOut.model_validate(txn).model_dump()})
 
@@ -1,13 +1,17 @@
-from fastapi import APIRouter, Depends, status
+import json
+
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 
 from app.core.dependencies import DbSession, get_admin_user, get_current_user
 from app.core.exceptions import AppError
 from app.core.response import api_response
 from app.core.security import hash_password
-from app.models import User
-from app.schemas import UserCreate, UserOut, UserUpdate
+from app.models import ImportRowStatus, User, UserImportJob
+from app.schemas import UserCreate, UserImportJobOut, UserImportResultOut, UserOut, UserUpdate
 from app.services.audit import log_action
+from app.services.user_import import create_import_job, iter_report, resumable_job, run_user_import
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -27,9 +31,7 @@ def register_user(payload: UserCreate, db: DbSession):
         is_admin=False,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
-
+    db.flush()
     log_action(db, "create", "user", user.id, user.id, {"email": user.email})
     db.commit()
 
@@ -58,6 +60,51 @@ def create_user(payload: UserCreate, db: DbSession, current_user: User = Depends
     return api_response("success", "User created", {"user_id": user.id})
 
 
+@router.post("/imports")
+def start_user_import(
+    background_tasks: BackgroundTasks,
+    db: DbSession,
+    current_user: User = Depends(get_admin_user),
+    file: UploadFile = File(...),
+):
+    job = create_import_job(db, file.file, file.filename, file.content_type, current_user.id)
+    background_tasks.add_task(run_user_import, job.id)
+    return api_response("success", "User import started", {"job": UserImportJobOut.model_validate(job).model_dump()})
+
+
+@router.get("/imports/{job_id}")
+def get_user_import(job_id: int, db: DbSession, _: User = Depends(get_admin_user)):
+    job = db.get(UserImportJob, job_id)
+    if not job:
+        raise AppError("Import job not found", status_code=status.HTTP_404_NOT_FOUND)
+    return api_response("success", "User import fetched", {"job": UserImportJobOut.model_validate(job).model_dump()})
+
+
+@router.post("/imports/{job_id}/resume")
+def resume_user_import(job_id: int, background_tasks: BackgroundTasks, db: DbSession, current_user: User = Depends(get_admin_user)):
+    job = resumable_job(db, job_id)
+    log_action(db, "resume", "user_import", job.id, current_user.id, {"processed_rows": job.processed_rows})
+    db.commit()
+    background_tasks.add_task(run_user_import, job.id)
+    return api_response("success", "User import resumed", {"job": UserImportJobOut.model_validate(job).model_dump()})
+
+
+@router.get("/imports/{job_id}/report")
+def user_import_report(
+    job_id: int,
+    db: DbSession,
+    _: User = Depends(get_admin_user),
+    row_status: ImportRowStatus | None = Query(default=None, alias="status"),
+):
+    if not db.get(UserImportJob, job_id):
+        raise AppError("Import job not found", status_code=status.HTTP_404_NOT_FOUND)
+    lines = (
+        json.dumps(UserImportResultOut.model_validate(result).model_dump(mode="json")) + "\n"
+        for result in iter_report(job_id, row_status)
+    )
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
 @router.get("/")
 def list_users(db: DbSession, _: User = Depends(get_admin_user)):
     users = db.execute(select(User).where(User.is_deleted.is_(False)).order_by(User.id.desc())).scalars().all()
@@ -5,10 +5,17 @@ from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 from app.models import (
     AccountType,
+    CardChannel,
     CardStatus,
     DepositStatus,
     DepositType,
+    FundOrderStatus,
     FundTradeType,
+    ImportJobStatus,
+    ImportRowStatus,
+    SipExecutionStatus,
+    SipFrequency,
+    SipStatus,
     TransactionStatus,
     TransactionType,
 )
@@ -33,6 +40,32 @@ class UserCreate(BaseModel):
     is_admin: bool = False
 
 
+class UserImportJobOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    filename: str
+    file_format: str
+    status: ImportJobStatus
+    processed_rows: int
+    created_count: int
+    skipped_count: int
+    failed_count: int
+    error: str | None
+    created_at: datetime
+    completed_at: datetime | None
+
+
+class UserImportResultOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    line: int
+    email: str | None
+    status: ImportRowStatus
+    user_id: int | None
+    error: str | None
+
+
 class UserUpdate(BaseModel):
     name: str | None = Field(default=None, min_length=2, max_length=120)
     contact: str | None = Field(default=None, min_length=5, max_length=30)
@@ -65,6 +98,12 @@ class AccountUpdate(BaseModel):
     is_active: bool | None = None
 
 
+class AccountBulkStatusUpdate(BaseModel):
+    is_active: bool
+    user_id: int | None = None
+    account_ids: list[int] | None = Field(default=None, max_length=10_000)
+
+
 class AccountOut(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -117,6 +156,10 @@ class DebitCardCreate(BaseModel):
     account_id: int
 
 
+class DebitCardBulkCreate(BaseModel):
+    account_ids: list[int] = Field(min_length=1, max_length=100_000)
+
+
 class DebitCardOut(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -126,12 +169,32 @@ class DebitCardOut(BaseModel):
     status: CardStatus
     activation_date: datetime | None
     expiry_date: date
+    daily_limit: Decimal
 
 
 class DebitCardStatusUpdate(BaseModel):
     status: CardStatus
 
 
+class DebitCardBulkStatusUpdate(BaseModel):
+    status: CardStatus
+    user_id: int | None = None
+    account_ids: list[int] | None = Field(default=None, max_length=10_000)
+    card_ids: list[int] | None = Field(default=None, max_length=10_000)
+    expiry_before: date | None = None
+
+
+class DebitCardLimitUpdate(BaseModel):
+    daily_limit: Decimal = Field(gt=Decimal("0"), max_digits=14, decimal_places=2)
+
+
+class CardAuthorizationRequest(BaseModel):
+    card_number: str = Field(min_length=12, max_length=20)
+    amount: Decimal = Field(gt=Decimal("0"), max_digits=14, decimal_places=2)
+    channel: CardChannel
+    merchant: str | None = Field(default=None, max_length=120)
+
+
 class DebitCardActivateRequest(BaseModel):
     card_id: int
     otp: str = Field(min_length=6, max_length=6)
@@ -154,9 +217,85 @@ class MutualFundOut(BaseModel):
     name: str
     symbol: str
     nav: Decimal
+    nav_version: int
     is_active: bool
 
 
+class NavRecord(BaseModel):
+    fund_id: int | None = None
+    symbol: str | None = Field(default=None, max_length=40)
+    nav: Decimal = Field(gt=Decimal("0"), max_digits=12, decimal_places=4)
+    nav_date: date | None = None
+
+
+class MutualFundOrderOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    user_id: int
+    account_id: int
+    fund_id: int
+    order_type: FundTradeType
+    amount: Decimal | None
+    units: Decimal | None
+    status: FundOrderStatus
+    batch_id: str | None
+    trade_id: int | None
+    executed_nav: Decimal | None
+    executed_units: Decimal | None
+    executed_amount: Decimal | None
+    failure_reason: str | None
+    created_at: datetime
+
+
+class SipCreate(BaseModel):
+    account_id: int
+    fund_id: int
+    amount: Decimal = Field(gt=Decimal("0"), max_digits=14, decimal_places=2)
+    frequency: SipFrequency
+    start_date: date | None = None
+
+
+class SipInstructionOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    user_id: int
+    account_id: int
+    fund_id: int
+    amount: Decimal
+    frequency: SipFrequency
+    start_date: date
+    next_run_date: date
+    last_run_date: date | None
+    status: SipStatus
+    created_at: datetime
+
+
+class SipExecutionOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    instruction_id: int
+    run_date: date
+    batch_id: str
+    status: SipExecutionStatus
+    amount: Decimal
+    trade_id: int | None
+    units: Decimal | None
+    nav: Decimal | None
+    failure_reason: str | None
+    created_at: datetime
+
+
+class MutualFundNavOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    fund_id: int
+    nav_date: date
+    nav: Decimal
+
+
 class FundTradeRequest(BaseModel):
     account_id: int
     fund_id: int
@@ -189,6 +328,7 @@ class MutualFundTradeOut(BaseModel):
     fund_id: int
     trade_type: FundTradeType
     nav: Decimal
+    nav_version: int | None
     units: Decimal
     amount: Decimal
     created_at: datetime
@@ -202,6 +342,48 @@ class DepositCreate(BaseModel):
     interest_rate: Decimal = Field(gt=Decimal("0"), le=Decimal("100"))
 
 
+class DepositQuoteRequest(BaseModel):
+    deposit_type: DepositType
+    term_months: int = Field(ge=1, le=360)
+    amount: Decimal = Field(gt=Decimal("0"))
+    interest_rate: Decimal = Field(gt=Decimal("0"), le=Decimal("100"))
+
+
+class DepositInstallmentOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    number: int
+    due_date: date
+    amount: Decimal
+
+
+class DepositCancellationPointOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    month: int
+    cancelled_on: date
+    principal: Decimal
+    interest: Decimal
+    penalty: Decimal
+    payout: Decimal
+
+
+class DepositQuoteOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    deposit_type: DepositType
+    term_months: int
+    amount: Decimal
+    interest_rate: Decimal
+    start_date: date
+    maturity_date: date
+    principal: Decimal
+    interest: Decimal
+    maturity_amount: Decimal
+    installments: list[DepositInstallmentOut]
+    cancellation: list[DepositCancellationPointOut]
+
+
 class DepositOut(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -215,11 +397,20 @@ class DepositOut(BaseModel):
     start_date: date
     maturity_date: date
     penalty_amount: Decimal
+    installments_paid: int
+    installments_missed: int
+    next_installment_date: date | None
+    accrued_interest: Decimal
+    accrued_through: date | None
     cancelled_at: datetime | None
+    payout_amount: Decimal | None
+    matured_at: datetime | None
 
 
 class DepositCancelResponse(BaseModel):
     deposit_id: int
+    status: DepositStatus
+    interest: Decimal
     penalty: Decimal
 
 
@@ -233,3 +424,13 @@ class AuditLogOut(BaseModel):
     entity_id: int | None
     details: dict
     created_at: datetime
+
+
+class OutboxEventOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    event_type: str
+    account_id: int | None
+    payload: dict
+    created_at: datetime
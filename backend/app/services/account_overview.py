@@ -0,0 +1,54 @@
+from typing import Any
+
+from fastapi import status
+from sqlalchemy import select, union_all
+from sqlalchemy.orm import Session, selectinload
+
+from app.core.exceptions import AppError
+from app.models import Account, Deposit, DepositStatus, MutualFundHolding, Transaction, User
+from app.schemas import AccountOut, DebitCardOut, DepositOut, TransactionOut
+from app.services.portfolio import value_holdings
+
+
+def _recent_transactions(db: Session, account_id: int, limit: int) -> list[Transaction]:
+    # Each side is a bounded walk down its (account_id, id) index; OR-ing them instead would
+    # sort every transaction the account ever had.
+    sides = [
+        select(Transaction.id).where(column == account_id).order_by(Transaction.id.desc()).limit(limit).subquery()
+        for column in (Transaction.from_account_id, Transaction.to_account_id)
+    ]
+    recent_ids = union_all(*(select(side.c.id) for side in sides)).subquery()
+    stmt = select(Transaction).where(Transaction.id.in_(select(recent_ids.c.id))).order_by(Transaction.id.desc()).limit(limit)
+    return list(db.execute(stmt).scalars())
+
+
+def account_overview(db: Session, account_id: int, current_user: User, transaction_limit: int) -> dict[str, Any]:
+    """Everything the account page shows, in a fixed number of queries.
+
+    The account comes back with its cards, active deposits and open holdings (plus their funds)
+    through ``selectinload``, so each collection is one ``IN`` query however many rows it has.
+    """
+    account = db.execute(
+        select(Account)
+        .where(Account.id == account_id)
+        .options(
+            selectinload(Account.debit_cards),
+            selectinload(Account.deposits.and_(Deposit.status == DepositStatus.ACTIVE)),
+            selectinload(Account.fund_holdings.and_(MutualFundHolding.units > 0)).selectinload(MutualFundHolding.fund),
+        )
+    ).scalar_one_or_none()
+    if not account or account.is_deleted:
+        raise AppError("Account not found", status_code=status.HTTP_404_NOT_FOUND)
+    if not current_user.is_admin and account.user_id != current_user.id:
+        raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
+
+    cards = sorted(account.debit_cards, key=lambda card: card.id, reverse=True)
+    deposits = sorted(account.deposits, key=lambda deposit: deposit.id, reverse=True)
+    holdings = sorted(account.fund_holdings, key=lambda holding: holding.fund_id)
+    return {
+        "account": AccountOut.model_validate(account).model_dump(),
+        "debit_cards": [DebitCardOut.model_validate(card).model_dump() for card in cards],
+        "deposits": [DepositOut.model_validate(deposit).model_dump() for deposit in deposits],
+        "holdings": value_holdings(holdings),
+        "transactions": [TransactionOut.model_validate(txn).model_dump() for txn in _recent_transactions(db, account.id, transaction_limit)],
+    }
@@ -1,8 +1,24 @@
+from collections.abc import Sequence
 from typing import Any
 
+from sqlalchemy import event, insert
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.core.database import SessionLocal
 from app.models import AuditLog
+from app.services.audit_writer import AuditWriter, build_record
+
+_PENDING_KEY = "audit_pending"
+
+audit_writer = AuditWriter(
+    spool_dir=settings.audit_spool_dir,
+    batch_size=settings.audit_batch_size,
+    flush_interval_ms=settings.audit_flush_interval_ms,
+    max_pending=settings.audit_max_pending,
+    enqueue_timeout_ms=settings.audit_enqueue_timeout_ms,
+    fsync=settings.audit_spool_fsync,
+)
 
 
 def log_action(
@@ -13,12 +29,53 @@ def log_action(
     user_id: int | None,
     details: dict[str, Any] | None = None,
 ) -> None:
-    db.add(
-        AuditLog(
-            action=action,
-            entity=entity,
-            entity_id=entity_id,
-            user_id=user_id,
-            details=details or {},
+    if settings.audit_mode == "sync":
+        db.add(
+            AuditLog(
+                action=action,
+                entity=entity,
+                entity_id=entity_id,
+                user_id=user_id,
+                details=details or {},
+            )
         )
-    )
+        return
+
+    audit_writer.reserve(1)
+    db.info.setdefault(_PENDING_KEY, []).append(build_record(action, entity, entity_id, user_id, details))
+
+
+def log_actions(
+    db: Session,
+    action: str,
+    entity: str,
+    entity_ids: Sequence[int],
+    user_id: int | None,
+    details: dict[str, Any] | None = None,
+) -> None:
+    """Bulk variant of ``log_action``: one record per entity, written with a single INSERT."""
+    if not entity_ids:
+        return
+    records = [build_record(action, entity, entity_id, user_id, details) for entity_id in entity_ids]
+    if settings.audit_mode == "sync":
+        db.execute(insert(AuditLog), records)
+        return
+
+    audit_writer.reserve(len(records))
+    db.info.setdefault(_PENDING_KEY, []).extend(records)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _enqueue_committed(session: Session) -> None:
+    records = session.info.pop(_PENDING_KEY, None)
+    if records:
+        audit_writer.enqueue(records, reserved=len(records))
+
+
+@event.listens_for(SessionLocal, "after_transaction_end")
+def _discard_uncommitted(session: Session, transaction) -> None:
+    if transaction.parent is not None:
+        return
+    records = session.info.pop(_PENDING_KEY, None)
+    if records:
+        audit_writer.release(len(records))
@@ -0,0 +1,208 @@
+import gzip
+import json
+import logging
+import os
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Engine, delete, select
+
+from app.core.config import settings
+from app.models import AuditLog, SearchToken
+from app.services.file_lock import try_lock
+from app.services.search import AUDIT_LOG
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = (AuditLog.id, AuditLog.user_id, AuditLog.action, AuditLog.entity, AuditLog.entity_id, AuditLog.details, AuditLog.created_at)
+
+
+def _utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _month_key(value: datetime) -> str:
+    return f"{value.year:04d}-{value.month:02d}"
+
+
+def _months_between(start: datetime, end: datetime) -> list[str]:
+    months = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def _write_durably(handle, data: bytes | str) -> None:
+    handle.write(data)
+    handle.flush()
+    os.fsync(handle.fileno())
+
+
+class AuditArchive:
+    """Monthly, append-only archive of cold audit rows.
+
+    ``audit-YYYY-MM.seg`` holds gzip blocks of JSON lines and ``audit-YYYY-MM.idx`` holds one
+    line per block with its byte range, id range and time range, so reads only decompress
+    the blocks that overlap the requested window.
+    """
+
+    def __init__(self, root: str | Path, batch_size: int = 1000):
+        self.root = Path(root)
+        self.batch_size = batch_size
+
+    def _segment_path(self, month: str) -> Path:
+        return self.root / f"audit-{month}.seg"
+
+    def _index_path(self, month: str) -> Path:
+        return self.root / f"audit-{month}.idx"
+
+    def _state_path(self) -> Path:
+        return self.root / "pending.json"
+
+    def read_index(self, month: str) -> list[dict[str, Any]]:
+        path = self._index_path(month)
+        if not path.exists():
+            return []
+        with open(path, "r", encoding="utf-8") as handle:
+            return [json.loads(line) for line in handle if line.strip()]
+
+    def months(self) -> list[str]:
+        return sorted(path.stem.removeprefix("audit-") for path in self.root.glob("audit-*.idx"))
+
+    def archive(self, engine: Engine, cutoff: datetime, max_batches: int | None = None) -> int:
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / "archive.lock", "a+") as lock_handle:
+            if not try_lock(lock_handle):
+                logger.info("Audit archive already running elsewhere; skipping")
+                return 0
+
+            self._recover(engine)
+            archived = 0
+            batches = 0
+            while max_batches is None or batches < max_batches:
+                with engine.connect() as conn:
+                    rows = conn.execute(
+                        select(*_COLUMNS).where(AuditLog.created_at < cutoff).order_by(AuditLog.id).limit(self.batch_size)
+                    ).all()
+                if not rows:
+                    break
+                self._archive_batch(engine, rows)
+                archived += len(rows)
+                batches += 1
+            return archived
+
+    def _archive_batch(self, engine: Engine, rows) -> None:
+        by_month: dict[str, list[dict[str, Any]]] = {}
+        for row in rows:
+            record = dict(row._mapping)
+            record["created_at"] = _utc(record["created_at"]).isoformat()
+            by_month.setdefault(_month_key(_utc(row.created_at)), []).append(record)
+
+        blocks = []
+        for month, records in by_month.items():
+            segment = self._segment_path(month)
+            offset = segment.stat().st_size if segment.exists() else 0
+            blocks.append({"month": month, "offset": offset, "ids": [record["id"] for record in records]})
+
+        # The pending state lets the next run finish or undo a batch interrupted by a crash.
+        with open(self._state_path(), "w", encoding="utf-8") as handle:
+            _write_durably(handle, json.dumps({"blocks": blocks}))
+
+        for block, records in zip(blocks, by_month.values()):
+            payload = gzip.compress("\n".join(json.dumps(record, default=str) for record in records).encode("utf-8"))
+            with open(self._segment_path(block["month"]), "ab") as handle:
+                _write_durably(handle, payload)
+            entry = {
+                "offset": block["offset"],
+                "length": len(payload),
+                "count": len(records),
+                "min_id": records[0]["id"],
+                "max_id": records[-1]["id"],
+                "min_ts": min(record["created_at"] for record in records),
+                "max_ts": max(record["created_at"] for record in records),
+            }
+            with open(self._index_path(block["month"]), "a", encoding="utf-8") as handle:
+                _write_durably(handle, json.dumps(entry) + "\n")
+
+        self._delete_archived(engine, [row.id for row in rows])
+        self._state_path().unlink()
+
+    def _recover(self, engine: Engine) -> None:
+        state_path = self._state_path()
+        if not state_path.exists():
+            return
+
+        state = json.loads(state_path.read_text(encoding="utf-8") or '{"blocks": []}')
+        archived_ids = []
+        for block in state["blocks"]:
+            offsets = {entry["offset"] for entry in self.read_index(block["month"])}
+            if block["offset"] in offsets:
+                archived_ids.extend(block["ids"])
+                continue
+            segment = self._segment_path(block["month"])
+            if segment.exists():
+                with open(segment, "r+b") as handle:
+                    handle.truncate(block["offset"])
+        self._delete_archived(engine, archived_ids)
+        state_path.unlink()
+        logger.info("Recovered interrupted audit archive batch (%s rows already archived)", len(archived_ids))
+
+    def _delete_archived(self, engine: Engine, ids: list[int]) -> None:
+        for start in range(0, len(ids), 500):
+            with engine.begin() as conn:
+                conn.execute(delete(AuditLog).where(AuditLog.id.in_(ids[start:start + 500])))
+                conn.execute(delete(SearchToken).where(SearchToken.source == AUDIT_LOG, SearchToken.source_id.in_(ids[start:start + 500])))
+
+    def _blocks(self, lower: datetime | None, upper: datetime | None) -> Iterator[tuple[str, dict[str, Any]]]:
+        months = self.months()
+        if lower or upper:
+            wanted = set(_months_between(lower or datetime(1970, 1, 1), upper or datetime.now(timezone.utc)))
+            months = [month for month in months if month in wanted]
+
+        for month in months:
+            for entry in self.read_index(month):
+                if lower and datetime.fromisoformat(entry["max_ts"]) < lower:
+                    continue
+                if upper and datetime.fromisoformat(entry["min_ts"]) > upper:
+                    continue
+                yield month, entry
+
+    def newest(self, date_from: datetime | None = None, date_to: datetime | None = None) -> datetime | None:
+        """Upper bound on the newest archived timestamp in the window, read from the indexes only."""
+        upper = _utc(date_to) if date_to else None
+        newest = None
+        for _, entry in self._blocks(_utc(date_from) if date_from else None, upper):
+            max_ts = datetime.fromisoformat(entry["max_ts"])
+            newest = max_ts if newest is None else max(newest, max_ts)
+        return min(newest, upper) if newest is not None and upper is not None else newest
+
+    def query(self, date_from: datetime | None = None, date_to: datetime | None = None) -> Iterator[dict[str, Any]]:
+        lower = _utc(date_from) if date_from else None
+        upper = _utc(date_to) if date_to else None
+
+        for month, entry in self._blocks(lower, upper):
+            with open(self._segment_path(month), "rb") as handle:
+                handle.seek(entry["offset"])
+                payload = gzip.decompress(handle.read(entry["length"]))
+            for line in payload.decode("utf-8").splitlines():
+                record = json.loads(line)
+                record["created_at"] = datetime.fromisoformat(record["created_at"])
+                if lower and record["created_at"] < lower:
+                    continue
+                if upper and record["created_at"] > upper:
+                    continue
+                yield record
+
+
+audit_archive = AuditArchive(settings.audit_archive_dir, settings.audit_archive_batch_size)
+
+
+def archive_expired_audit_logs(engine: Engine, max_batches: int | None = None) -> int:
+    cutoff = datetime.now(timezone.utc) - timedelta(days=settings.audit_retention_days)
+    return audit_archive.archive(engine, cutoff, max_batches=max_batches)
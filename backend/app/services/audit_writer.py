@@ -0,0 +1,272 @@
+"""Batched audit log pipeline.
+
+Durability guarantee (``AUDIT_MODE=batched``): audit records are captured in the request
+session and appended to this worker's spool file right after the business transaction
+commits, before the response is returned. With ``AUDIT_SPOOL_FSYNC=true`` the append is
+fsynced, so once a request has returned its audit records survive a process or host crash.
+A crash in the short window between the database commit and the spool append loses the
+records of the in-flight requests only.
+
+Spooled records are bulk-inserted in batches. The spool sequence number of the last inserted
+record is stored in ``audit_spool_checkpoints`` in the same transaction as the insert, so a
+restart replays exactly the records that were not yet inserted: no loss, no duplicates.
+Spool files left behind by dead workers are picked up by the next worker that starts.
+
+``AUDIT_MODE=sync`` writes audit rows inside the business transaction instead.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from fastapi import status
+from sqlalchemy import Engine, delete, insert, select, update
+
+from app.core.exceptions import AppError
+from app.models import AuditLog, AuditSpoolCheckpoint
+from app.services.file_lock import try_lock
+
+logger = logging.getLogger(__name__)
+
+
+def _serialize(record: dict[str, Any]) -> dict[str, Any]:
+    return {**record, "created_at": record["created_at"].isoformat()}
+
+
+def _line(record: dict[str, Any]) -> str:
+    return json.dumps(_serialize(record), separators=(",", ":")) + "\n"
+
+
+def _deserialize(record: dict[str, Any]) -> dict[str, Any]:
+    return {**record, "created_at": datetime.fromisoformat(record["created_at"])}
+
+
+class AuditWriter:
+    def __init__(
+        self,
+        spool_dir: str | Path,
+        batch_size: int = 500,
+        flush_interval_ms: int = 1000,
+        max_pending: int = 10_000,
+        enqueue_timeout_ms: int = 2000,
+        fsync: bool = True,
+    ):
+        self.spool_dir = Path(spool_dir)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_pending = max_pending
+        self.enqueue_timeout = enqueue_timeout_ms / 1000
+        self.fsync = fsync
+
+        self._engine: Engine | None = None
+        self._spool = None
+        self._spool_name = ""
+        self._seq = 0
+        self._pending: deque[dict[str, Any]] = deque()
+        self._reserved = 0
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def start(self, engine: Engine, background: bool = True) -> None:
+        if self._engine is not None:
+            return
+        self._engine = engine
+        self._stopping = False
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        self._spool_name = f"audit-{os.getpid()}-{time.time_ns()}.spool"
+        self._spool = open(self.spool_dir / self._spool_name, "a+", encoding="utf-8")
+        try_lock(self._spool)
+        self.recover_orphans()
+
+        if background:
+            self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        if self._engine is None:
+            return
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        try:
+            self.flush_all()
+        except Exception:
+            logger.exception("Final audit flush failed; records remain in %s", self._spool_name)
+            self._spool.close()
+        else:
+            self._spool.close()
+            (self.spool_dir / self._spool_name).unlink(missing_ok=True)
+            self._delete_checkpoint(self._spool_name)
+        self._spool = None
+        self._engine = None
+
+    def reserve(self, count: int) -> None:
+        # Backpressure is applied before the business transaction commits, so a saturated
+        # pipeline rejects the request instead of committing work it cannot audit.
+        deadline = time.monotonic() + self.enqueue_timeout
+        with self._cond:
+            while len(self._pending) + self._reserved + count > self.max_pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise AppError("Audit pipeline is saturated, please retry", status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+                self._cond.notify_all()
+                self._cond.wait(remaining)
+            self._reserved += count
+
+    def release(self, count: int) -> None:
+        with self._cond:
+            self._reserved = max(0, self._reserved - count)
+            self._cond.notify_all()
+
+    def enqueue(self, records: list[dict[str, Any]], reserved: int = 0) -> None:
+        with self._cond:
+            lines = []
+            for record in records:
+                self._seq += 1
+                record = {**record, "seq": self._seq}
+                lines.append(_line(record))
+                self._pending.append(record)
+            self._spool.write("".join(lines))
+            self._spool.flush()
+            if self.fsync:
+                os.fsync(self._spool.fileno())
+            self._reserved = max(0, self._reserved - reserved)
+            if len(self._pending) >= self.batch_size:
+                self._cond.notify_all()
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._cond:
+                batch = [self._pending[i] for i in range(min(self.batch_size, len(self._pending)))]
+            if not batch:
+                return 0
+
+            self._insert_batch(self._spool_name, batch)
+
+            with self._cond:
+                for _ in batch:
+                    self._pending.popleft()
+                self._compact()
+                self._cond.notify_all()
+            return len(batch)
+
+    def _compact(self) -> None:
+        """Drop the inserted records from the spool, so it never grows past ``max_pending``.
+
+        Called with ``_cond`` held. The remaining records are written to a locked temporary
+        file that atomically replaces the spool; a crash before the rename leaves the old spool,
+        which replays correctly against the checkpoint.
+        """
+        if not self._pending:
+            self._spool.truncate(0)
+            return
+        path = self.spool_dir / self._spool_name
+        staging = path.with_name(f"{path.name}.tmp")
+        spool = open(staging, "w+", encoding="utf-8")
+        try_lock(spool)
+        spool.write("".join(_line(record) for record in self._pending))
+        spool.flush()
+        if self.fsync:
+            os.fsync(spool.fileno())
+        os.replace(staging, path)
+        self._spool.close()
+        self._spool = spool
+
+    def flush_all(self) -> int:
+        total = 0
+        while True:
+            flushed = self.flush()
+            total += flushed
+            if flushed == 0:
+                return total
+
+    def recover_orphans(self) -> int:
+        # A compaction interrupted before its rename leaves a staging file next to the intact spool.
+        for path in self.spool_dir.glob("audit-*.spool.tmp"):
+            with open(path, "r", encoding="utf-8") as handle:
+                if try_lock(handle):
+                    path.unlink(missing_ok=True)
+        recovered = 0
+        for path in sorted(self.spool_dir.glob("audit-*.spool")):
+            if path.name == self._spool_name:
+                continue
+            with open(path, "r", encoding="utf-8") as handle:
+                if not try_lock(handle):
+                    continue
+                records = [_deserialize(json.loads(line)) for line in handle if line.strip()]
+                last_seq = self._checkpoint(path.name)
+                records = [record for record in records if record["seq"] > last_seq]
+                for start in range(0, len(records), self.batch_size):
+                    self._insert_batch(path.name, records[start:start + self.batch_size])
+                recovered += len(records)
+            path.unlink(missing_ok=True)
+            self._delete_checkpoint(path.name)
+            logger.info("Recovered %s audit records from %s", len(records), path.name)
+        return recovered
+
+    def _insert_batch(self, spool_name: str, batch: list[dict[str, Any]]) -> None:
+        rows = [{key: value for key, value in record.items() if key != "seq"} for record in batch]
+        with self._engine.begin() as conn:
+            conn.execute(insert(AuditLog), rows)
+            updated = conn.execute(
+                update(AuditSpoolCheckpoint)
+                .where(AuditSpoolCheckpoint.spool_name == spool_name)
+                .values(last_seq=batch[-1]["seq"])
+            )
+            if updated.rowcount == 0:
+                conn.execute(insert(AuditSpoolCheckpoint).values(spool_name=spool_name, last_seq=batch[-1]["seq"]))
+
+    def _checkpoint(self, spool_name: str) -> int:
+        with self._engine.connect() as conn:
+            stmt = select(AuditSpoolCheckpoint.last_seq).where(AuditSpoolCheckpoint.spool_name == spool_name)
+            return conn.execute(stmt).scalar_one_or_none() or 0
+
+    def _delete_checkpoint(self, spool_name: str) -> None:
+        with self._engine.begin() as conn:
+            conn.execute(delete(AuditSpoolCheckpoint).where(AuditSpoolCheckpoint.spool_name == spool_name))
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                if not self._stopping and len(self._pending) < self.batch_size:
+                    self._cond.wait(self.flush_interval)
+                if self._stopping:
+                    return
+            try:
+                while self.flush() == self.batch_size:
+                    pass
+            except Exception:
+                logger.exception("Audit flush failed; retrying in %.1fs", self.flush_interval)
+                time.sleep(self.flush_interval)
+
+
+def build_record(
+    action: str,
+    entity: str,
+    entity_id: int | None,
+    user_id: int | None,
+    details: dict[str, Any] | None,
+) -> dict[str, Any]:
+    return {
+        "action": action,
+        "entity": entity,
+        "entity_id": entity_id,
+        "user_id": user_id,
+        "details": details or {},
+        "created_at": datetime.now(timezone.utc),
+    }
@@ -0,0 +1,131 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from decimal import Decimal
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import Account
+from app.services.events import dispatcher
+
+_PENDING_KEY = "balance_cache_pending"
+
+
+@dataclass(frozen=True)
+class CachedBalance:
+    account_id: int
+    user_id: int
+    balance: Decimal
+    version: int
+    is_deleted: bool
+
+    @classmethod
+    def from_account(cls, account: Account) -> "CachedBalance":
+        return cls(
+            account_id=account.id,
+            user_id=account.user_id,
+            balance=Decimal(account.balance).quantize(Decimal("0.01")),
+            version=account.version,
+            is_deleted=account.is_deleted,
+        )
+
+
+class BalanceCache:
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[int, CachedBalance] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, account_id: int) -> CachedBalance | None:
+        with self._lock:
+            entry = self._entries.get(account_id)
+            if entry is not None:
+                self._entries.move_to_end(account_id)
+            return entry
+
+    def put(self, entry: CachedBalance) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            current = self._entries.get(entry.account_id)
+            if current is not None and current.version > entry.version:
+                return
+            self._entries[entry.account_id] = entry
+            self._entries.move_to_end(entry.account_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, account_id: int, below_version: int | None = None) -> None:
+        with self._lock:
+            current = self._entries.get(account_id)
+            if current is None:
+                return
+            if below_version is None or current.version < below_version:
+                del self._entries[account_id]
+
+    def invalidate_many(self, account_ids: Iterable[int]) -> None:
+        with self._lock:
+            for account_id in account_ids:
+                self._entries.pop(account_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+balance_cache = BalanceCache(settings.balance_cache_max_entries)
+
+
+def load_balance(db: Session, account_id: int) -> CachedBalance | None:
+    entry = balance_cache.get(account_id)
+    if entry is not None:
+        return entry
+
+    account = db.get(Account, account_id)
+    if account is None:
+        return None
+    entry = CachedBalance.from_account(account)
+    balance_cache.put(entry)
+    return entry
+
+
+def stage_balance(session: Session, entry: CachedBalance) -> None:
+    """Queue a write-through for a balance changed outside the ORM (e.g. a conditional UPDATE)."""
+    session.info.setdefault(_PENDING_KEY, {})[entry.account_id] = entry
+
+
+def invalidate_from_event(outbox_event) -> None:
+    # Keeps other workers coherent: every balance/account change is also an outbox event,
+    # and the dispatcher in each process replays them here.
+    version = outbox_event.payload.get("version")
+    if outbox_event.account_id is None or version is None:
+        return
+    balance_cache.invalidate(outbox_event.account_id, below_version=version)
+
+
+dispatcher.add_listener(invalidate_from_event)
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _collect_account_changes(session: Session, _) -> None:
+    changed = [obj for obj in (*session.new, *session.dirty) if isinstance(obj, Account)]
+    if not changed:
+        return
+    pending = session.info.setdefault(_PENDING_KEY, {})
+    for account in changed:
+        pending[account.id] = CachedBalance.from_account(account)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _write_through(session: Session) -> None:
+    for entry in session.info.pop(_PENDING_KEY, {}).values():
+        balance_cache.put(entry)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
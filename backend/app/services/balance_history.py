@@ -0,0 +1,67 @@
+"""End-of-bucket balances for an account, computed in one aggregate query.
+
+Every balance change is either a transaction (``from_account_id`` debits, ``to_account_id``
+credits) or a card hold. Flows are summed per bucket over ``(account_id, created_at, amount)``
+index range scans, and balances are rebuilt backwards from the current balance, so the work
+in Python and the payload depend only on the number of buckets.
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import ColumnElement, Integer, case, cast, func, literal, literal_column, select, union_all
+from sqlalchemy.orm import Session
+
+from app.models import Account, CardAuthorization, Transaction
+
+_CURRENT_BALANCE = -1
+
+
+def _utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def _bucket_index(dialect: str, column: Any, start: datetime, width: float) -> ColumnElement[int]:
+    # Rows are never before ``start``, so SQLite's truncating CAST is a floor; the others round.
+    if dialect == "sqlite":
+        return cast((func.julianday(column) - func.julianday(start)) * 86400 / width, Integer)
+    if dialect == "mysql":
+        return cast(func.floor(func.timestampdiff(literal_column("SECOND"), start, column) / width), Integer)
+    return cast(func.floor(func.extract("epoch", column - start) / width), Integer)
+
+
+def balance_history(db: Session, account: Account, start: datetime, end: datetime, buckets: int) -> dict[str, Any]:
+    start, end = _utc(start), _utc(end)
+    width = (end - start).total_seconds() / buckets
+    dialect = db.get_bind().dialect.name
+    # SQLite stores naive UTC timestamps, so its bounds are compared without an offset.
+    start_at, end_at = (start.replace(tzinfo=None), end.replace(tzinfo=None)) if dialect == "sqlite" else (start, end)
+
+    def _flows(model: Any, account_column: Any, amount: ColumnElement[Any]) -> Any:
+        # Everything after ``end`` lands in one extra bucket: it is only needed to walk back from
+        # the current balance, and must not fan out into one group per future bucket.
+        bucket = case((model.created_at >= end_at, buckets), else_=_bucket_index(dialect, model.created_at, start_at, width))
+        return select(bucket.label("bucket"), amount.label("amount")).where(account_column == account.id, model.created_at >= start_at)
+
+    # The current balance rides in the same statement so it and the flows come from one snapshot.
+    flows = union_all(
+        select(literal(_CURRENT_BALANCE).label("bucket"), Account.balance.label("amount")).where(Account.id == account.id),
+        _flows(Transaction, Transaction.to_account_id, Transaction.amount),
+        _flows(Transaction, Transaction.from_account_id, -Transaction.amount),
+        _flows(CardAuthorization, CardAuthorization.account_id, -CardAuthorization.amount),
+    ).subquery()
+    totals = {
+        row.bucket: Decimal(str(row.total))
+        for row in db.execute(select(flows.c.bucket, func.sum(flows.c.amount).label("total")).group_by(flows.c.bucket))
+    }
+
+    balance = totals.pop(_CURRENT_BALANCE) - totals.get(buckets, Decimal("0"))
+    opened_at = _utc(account.created_at)
+    points: list[dict[str, Any]] = []
+    for index in range(buckets - 1, -1, -1):
+        at = start + (end - start) * (index + 1) / buckets
+        points.append({"at": at, "balance": balance.quantize(Decimal("0.01")) if at >= opened_at else None})
+        balance -= totals.get(index, Decimal("0"))
+    points.reverse()
+    return {"account_id": account.id, "from": start, "to": end, "bucket_seconds": width, "points": points}
@@ -0,0 +1,148 @@
+import logging
+from collections.abc import Callable
+from datetime import date
+from typing import Any
+
+from fastapi import status
+from sqlalchemy import ColumnElement, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.exceptions import AppError
+from app.models import Account, CardStatus, DebitCard
+from app.services.audit import log_actions
+from app.services.balance_cache import balance_cache
+from app.services.card_state import card_state_cache
+from app.services.events import record_account_events, record_card_events
+from app.services.unit_of_work import run_in_transaction
+
+logger = logging.getLogger(__name__)
+
+ChunkWork = Callable[[Session, int, int], list[int]]
+
+
+def _run_chunks(work: ChunkWork, operation: str, chunk_size: int | None, on_commit: Callable[[list[int]], None]) -> int:
+    chunk_size = chunk_size or settings.bulk_status_chunk_size
+    updated = 0
+    after_id = 0
+    with SessionLocal() as db:
+        while True:
+            ids = run_in_transaction(db, lambda: work(db, after_id, chunk_size), operation)
+            if not ids:
+                break
+            on_commit(ids)
+            updated += len(ids)
+            after_id = ids[-1]
+    return updated
+
+
+def _require_filters(filters: list[ColumnElement[bool]]) -> None:
+    if not filters:
+        raise AppError("At least one filter is required", status_code=status.HTTP_400_BAD_REQUEST)
+
+
+def set_card_status(
+    target: CardStatus,
+    *,
+    user_id: int | None = None,
+    account_ids: list[int] | None = None,
+    card_ids: list[int] | None = None,
+    expiry_before: date | None = None,
+    actor_id: int | None = None,
+    chunk_size: int | None = None,
+) -> dict[str, Any]:
+    """Move every card matching all given filters to ``target`` with one UPDATE per chunk.
+
+    Re-enabling only applies to disabled cards that were activated before, so a bulk unblock
+    never skips OTP activation.
+    """
+    if target not in {CardStatus.ACTIVE, CardStatus.DISABLED}:
+        raise AppError("Only active/disabled states are allowed", status_code=status.HTTP_400_BAD_REQUEST)
+
+    filters: list[ColumnElement[bool]] = []
+    if user_id is not None:
+        filters.append(DebitCard.account_id.in_(select(Account.id).where(Account.user_id == user_id)))
+    if account_ids:
+        filters.append(DebitCard.account_id.in_(account_ids))
+    if card_ids:
+        filters.append(DebitCard.id.in_(card_ids))
+    if expiry_before is not None:
+        filters.append(DebitCard.expiry_date < expiry_before)
+    _require_filters(filters)
+    if target == CardStatus.ACTIVE:
+        filters += [DebitCard.status == CardStatus.DISABLED, DebitCard.activation_date.is_not(None)]
+    else:
+        filters.append(DebitCard.status != target)
+
+    def _chunk(db: Session, after_id: int, limit: int) -> list[int]:
+        ids = list(
+            db.execute(
+                select(DebitCard.id).where(*filters, DebitCard.id > after_id).order_by(DebitCard.id).limit(limit).with_for_update()
+            ).scalars()
+        )
+        if not ids:
+            return ids
+        db.execute(
+            update(DebitCard).where(DebitCard.id.in_(ids)).values(status=target).execution_options(synchronize_session=False)
+        )
+        cards = db.execute(
+            select(DebitCard.id, DebitCard.account_id, DebitCard.status, DebitCard.daily_limit, Account.user_id)
+            .join(Account, Account.id == DebitCard.account_id)
+            .where(DebitCard.id.in_(ids))
+        ).all()
+        record_card_events(db, cards)
+        log_actions(db, "bulk_update", "debit_card", ids, actor_id, {"status": target.value})
+        return ids
+
+    def _invalidate(ids: list[int]) -> None:
+        for card_id in ids:
+            card_state_cache.invalidate(card_id)
+
+    updated = _run_chunks(_chunk, "bulk_card_status", chunk_size, _invalidate)
+    logger.info("Bulk card status %s: %s cards updated", target.value, updated)
+    return {"status": target.value, "updated": updated}
+
+
+def set_account_active(
+    is_active: bool,
+    *,
+    user_id: int | None = None,
+    account_ids: list[int] | None = None,
+    actor_id: int | None = None,
+    chunk_size: int | None = None,
+) -> dict[str, Any]:
+    """Freeze or unfreeze every non-deleted account matching all given filters."""
+    filters: list[ColumnElement[bool]] = []
+    if user_id is not None:
+        filters.append(Account.user_id == user_id)
+    if account_ids:
+        filters.append(Account.id.in_(account_ids))
+    _require_filters(filters)
+    filters += [Account.is_deleted.is_(False), Account.is_active.is_(not is_active)]
+
+    def _chunk(db: Session, after_id: int, limit: int) -> list[int]:
+        ids = list(
+            db.execute(
+                select(Account.id).where(*filters, Account.id > after_id).order_by(Account.id).limit(limit).with_for_update()
+            ).scalars()
+        )
+        if not ids:
+            return ids
+        # Bulk UPDATEs bypass the ORM version counter, so it is bumped here explicitly.
+        db.execute(
+            update(Account)
+            .where(Account.id.in_(ids))
+            .values(is_active=is_active, version=Account.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        accounts = db.execute(
+            select(Account.id, Account.user_id, Account.version, Account.is_active, Account.is_deleted).where(Account.id.in_(ids))
+        ).all()
+        record_account_events(db, accounts)
+        log_actions(db, "bulk_update", "account", ids, actor_id, {"is_active": is_active})
+        return ids
+
+    updated = _run_chunks(_chunk, "bulk_account_status", chunk_size, balance_cache.invalidate_many)
+    logger.info("Bulk account is_active=%s: %s accounts updated", is_active, updated)
+    return {"is_active": is_active, "updated": updated}
@@ -0,0 +1,113 @@
+from datetime import date
+from decimal import Decimal
+
+from fastapi import status
+from sqlalchemy import case, select, update
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import AppError
+from app.core.metrics import CARD_AUTHORIZATIONS
+from app.models import Account, CardAuthorization, CardChannel, CardStatus, DebitCard
+from app.services.balance_cache import CachedBalance, stage_balance
+from app.services.card_state import CardState, card_state_cache, load_card_state
+from app.services.events import record_card_hold_event
+from app.services.unit_of_work import run_in_transaction
+from app.services.utils import generate_authorization_reference
+
+
+def _check_card(state: CardState | None, amount: Decimal, today: date) -> CardState:
+    if state is None:
+        raise AppError("Card not found", status_code=status.HTTP_404_NOT_FOUND)
+    if state.status != CardStatus.ACTIVE:
+        raise AppError("Card is not active", status_code=status.HTTP_403_FORBIDDEN)
+    if state.expiry_date < today:
+        raise AppError("Card has expired", status_code=status.HTTP_403_FORBIDDEN)
+    if amount > state.daily_limit:
+        raise AppError("Daily limit exceeded", status_code=status.HTTP_402_PAYMENT_REQUIRED)
+    return state
+
+
+def _reserve_daily_limit(db: Session, state: CardState, amount: Decimal, today: date) -> None:
+    spent = case((DebitCard.spent_on == today, DebitCard.spent_today + amount), else_=amount)
+    reserved = db.execute(
+        update(DebitCard)
+        .where(DebitCard.id == state.card_id, DebitCard.status == CardStatus.ACTIVE, spent <= DebitCard.daily_limit)
+        .values(spent_today=spent, spent_on=today)
+        .execution_options(synchronize_session=False)
+    )
+    if reserved.rowcount:
+        return
+
+    # The cached state was stale or the limit is used up; either way the slow path is fine here.
+    card_state_cache.invalidate(state.card_id)
+    current = db.execute(select(DebitCard.status).where(DebitCard.id == state.card_id)).scalar_one_or_none()
+    if current != CardStatus.ACTIVE:
+        raise AppError("Card is not active", status_code=status.HTTP_403_FORBIDDEN)
+    raise AppError("Daily limit exceeded", status_code=status.HTTP_402_PAYMENT_REQUIRED)
+
+
+def _hold_funds(db: Session, state: CardState, amount: Decimal) -> tuple[Decimal, int]:
+    stmt = (
+        update(Account)
+        .where(
+            Account.id == state.account_id,
+            Account.is_active.is_(True),
+            Account.is_deleted.is_(False),
+            Account.balance >= amount,
+        )
+        .values(balance=Account.balance - amount, version=Account.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if db.get_bind().dialect.update_returning:
+        row = db.execute(stmt.returning(Account.balance, Account.version)).one_or_none()
+    else:
+        row = None
+        if db.execute(stmt).rowcount:
+            row = db.execute(select(Account.balance, Account.version).where(Account.id == state.account_id)).one()
+    if row is None:
+        raise AppError("Insufficient funds", status_code=status.HTTP_402_PAYMENT_REQUIRED)
+    return Decimal(row.balance).quantize(Decimal("0.01")), row.version
+
+
+def _place_hold(
+    db: Session, state: CardState, amount: Decimal, channel: CardChannel, merchant: str | None, today: date
+) -> tuple[CardAuthorization, Decimal]:
+    _reserve_daily_limit(db, state, amount, today)
+    balance, version = _hold_funds(db, state, amount)
+
+    authorization = CardAuthorization(
+        card_id=state.card_id,
+        account_id=state.account_id,
+        amount=amount,
+        channel=channel,
+        merchant=merchant,
+        reference=generate_authorization_reference(),
+    )
+    db.add(authorization)
+    db.flush()
+    record_card_hold_event(db, authorization, state.user_id, balance, version)
+    stage_balance(db, CachedBalance(state.account_id, state.user_id, balance, version, False))
+    return authorization, balance
+
+
+def authorize_card(
+    db: Session, card_number: str, amount: Decimal, channel: CardChannel, merchant: str | None = None
+) -> tuple[CardAuthorization, Decimal]:
+    """Authorize a POS/ATM debit and hold the funds on the card's account.
+
+    Card status, expiry and limit come from the in-process card-state cache. The write side
+    is two conditional UPDATEs (daily spend, account balance) plus the authorization and outbox
+    rows in one short transaction; it deliberately skips the generic audit log, since the
+    ``card_authorizations`` row is the record of the hold.
+    """
+    today = date.today()
+    try:
+        state = _check_card(load_card_state(db, card_number), amount, today)
+        result = run_in_transaction(
+            db, lambda: _place_hold(db, state, amount, channel, merchant, today), "card_authorization"
+        )
+    except AppError:
+        CARD_AUTHORIZATIONS.inc(channel=channel.value, outcome="declined")
+        raise
+    CARD_AUTHORIZATIONS.inc(channel=channel.value, outcome="approved")
+    return result
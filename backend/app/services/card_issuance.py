@@ -0,0 +1,154 @@
+import logging
+import threading
+from collections.abc import Iterator
+from datetime import date
+from typing import Any
+
+from fastapi import status
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.exceptions import AppError
+from app.core.security import hash_passwords
+from app.models import Account, CardStatus, DebitCard, NumberSequence
+from app.services.audit import log_action
+from app.services.unit_of_work import run_in_transaction
+from app.services.utils import generate_otp, luhn_check_digit
+
+logger = logging.getLogger(__name__)
+
+CARD_BIN = "521234"
+CARD_SEQUENCE = "debit_card_pan"
+_SEQUENCE_LIMIT = 10**9
+
+
+def card_number_from_sequence(value: int) -> str:
+    payload = f"{CARD_BIN}{value:09d}"
+    return payload + luhn_check_digit(payload)
+
+
+def card_expiry(today: date | None = None) -> date:
+    today = today or date.today()
+    return date(today.year + 5, today.month, min(today.day, 28))
+
+
+def _reserve_block(db: Session, size: int) -> tuple[int, int]:
+    updated = db.execute(
+        update(NumberSequence).where(NumberSequence.name == CARD_SEQUENCE).values(next_value=NumberSequence.next_value + size)
+    )
+    if updated.rowcount == 0:
+        db.execute(insert(NumberSequence).values(name=CARD_SEQUENCE, next_value=1 + size))
+    end = db.execute(select(NumberSequence.next_value).where(NumberSequence.name == CARD_SEQUENCE)).scalar_one()
+    return end - size, end
+
+
+class CardNumberAllocator:
+    """Hands out Luhn-valid PANs from blocks reserved on the ``number_sequences`` table.
+
+    Each block is reserved in its own short transaction, so numbers are unique across workers
+    without probing the unique index. Numbers from a block that is never used (a failed
+    insert, a restart) are simply skipped.
+    """
+
+    def __init__(self, block_size: int):
+        self.block_size = block_size
+        self._next = 0
+        self._end = 0
+        self._lock = threading.Lock()
+
+    def allocate(self, count: int) -> list[str]:
+        numbers: list[str] = []
+        with self._lock:
+            while len(numbers) < count:
+                if self._next >= self._end:
+                    size = max(self.block_size, count - len(numbers))
+                    with SessionLocal() as db:
+                        self._next, self._end = run_in_transaction(db, lambda: _reserve_block(db, size), "card_number_block")
+                    if self._end > _SEQUENCE_LIMIT:
+                        raise AppError("Card number range exhausted", status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+                take = min(self._end - self._next, count - len(numbers))
+                numbers.extend(card_number_from_sequence(value) for value in range(self._next, self._next + take))
+                self._next += take
+        return numbers
+
+
+card_number_allocator = CardNumberAllocator(settings.card_number_block_size)
+
+
+def _issue_chunk(db: Session, account_ids: list[int], actor_id: int | None) -> list[dict[str, Any]]:
+    usable = set(
+        db.execute(select(Account.id).where(Account.id.in_(set(account_ids)), Account.is_deleted.is_(False))).scalars()
+    )
+    valid = [account_id for account_id in account_ids if account_id in usable]
+    numbers = card_number_allocator.allocate(len(valid))
+    otps = [generate_otp() for _ in valid]
+    # Hashing is the expensive part, so it happens before the write transaction opens.
+    otp_hashes = hash_passwords(otps)
+    expiry = card_expiry()
+
+    def _insert() -> dict[str, int]:
+        if not valid:
+            return {}
+        db.execute(
+            insert(DebitCard),
+            [
+                {
+                    "account_id": account_id,
+                    "card_number": number,
+                    "status": CardStatus.PENDING,
+                    "otp_hash": otp_hash,
+                    "expiry_date": expiry,
+                }
+                for account_id, number, otp_hash in zip(valid, numbers, otp_hashes)
+            ],
+        )
+        card_ids = dict(db.execute(select(DebitCard.card_number, DebitCard.id).where(DebitCard.card_number.in_(numbers))).all())
+        log_action(
+            db,
+            "bulk_create",
+            "debit_card",
+            None,
+            actor_id,
+            {"issued": len(valid), "first_card_id": min(card_ids.values()), "last_card_id": max(card_ids.values())},
+        )
+        return card_ids
+
+    card_ids = run_in_transaction(db, _insert, "card_issuance")
+
+    issued = iter(zip(numbers, otps))
+    results = []
+    for account_id in account_ids:
+        if account_id not in usable:
+            results.append({"account_id": account_id, "status": "failed", "error": "Account not found"})
+            continue
+        number, otp = next(issued)
+        results.append(
+            {"account_id": account_id, "status": "issued", "card_id": card_ids[number], "card_number": number, "otp": otp}
+        )
+    return results
+
+
+def issue_cards(account_ids: list[int], actor_id: int | None = None, chunk_size: int | None = None) -> Iterator[dict[str, Any]]:
+    """Issue one pending card per entry of ``account_ids``, yielding a result per entry.
+
+    Each chunk commits on its own before its results are yielded, so a consumer that stops
+    early has only been told about cards that exist. The response is already streaming when a
+    chunk fails, so the failure is reported as a ``failed`` line for every account not yet issued.
+    """
+    chunk_size = chunk_size or settings.card_issue_chunk_size
+    issued = 0
+    with SessionLocal() as db:
+        for start in range(0, len(account_ids), chunk_size):
+            try:
+                results = _issue_chunk(db, account_ids[start : start + chunk_size], actor_id)
+            except Exception as exc:
+                logger.exception("Bulk card issuance failed after %s of %s accounts", start, len(account_ids))
+                db.rollback()
+                error = exc.message if isinstance(exc, AppError) else "Card issuance failed"
+                yield from ({"account_id": account_id, "status": "failed", "error": error} for account_id in account_ids[start:])
+                break
+            issued += sum(1 for result in results if result["status"] == "issued")
+            yield from results
+    logger.info("Bulk card issuance: %s of %s cards issued", issued, len(account_ids))
@@ -0,0 +1,121 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import Account, CardStatus, DebitCard
+from app.services.events import CARD_UPDATED, dispatcher
+
+_PENDING_KEY = "card_state_pending"
+
+
+@dataclass(frozen=True)
+class CardState:
+    card_id: int
+    account_id: int
+    user_id: int
+    status: CardStatus
+    expiry_date: date
+    daily_limit: Decimal
+
+
+class CardStateCache:
+    """LRU of card number -> authorization-relevant card fields.
+
+    Only the slowly-changing fields are cached; the daily spend and the account balance are
+    checked by the conditional UPDATEs of the authorization itself.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CardState] = OrderedDict()
+        self._numbers: dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, card_number: str) -> CardState | None:
+        with self._lock:
+            entry = self._entries.get(card_number)
+            if entry is not None:
+                self._entries.move_to_end(card_number)
+            return entry
+
+    def put(self, card_number: str, entry: CardState) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[card_number] = entry
+            self._entries.move_to_end(card_number)
+            self._numbers[entry.card_id] = card_number
+            while len(self._entries) > self.max_entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._numbers.pop(evicted.card_id, None)
+
+    def invalidate(self, card_id: int) -> None:
+        with self._lock:
+            card_number = self._numbers.pop(card_id, None)
+            if card_number is not None:
+                self._entries.pop(card_number, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._numbers.clear()
+
+
+card_state_cache = CardStateCache(settings.card_state_cache_max_entries)
+
+
+def load_card_state(db: Session, card_number: str) -> CardState | None:
+    entry = card_state_cache.get(card_number)
+    if entry is not None:
+        return entry
+
+    row = db.execute(
+        select(
+            DebitCard.id,
+            DebitCard.account_id,
+            Account.user_id,
+            DebitCard.status,
+            DebitCard.expiry_date,
+            DebitCard.daily_limit,
+        )
+        .join(Account, Account.id == DebitCard.account_id)
+        .where(DebitCard.card_number == card_number)
+    ).one_or_none()
+    if row is None:
+        return None
+    entry = CardState(*row)
+    card_state_cache.put(card_number, entry)
+    return entry
+
+
+def invalidate_from_event(outbox_event) -> None:
+    if outbox_event.event_type == CARD_UPDATED:
+        card_state_cache.invalidate(outbox_event.payload["card_id"])
+
+
+dispatcher.add_listener(invalidate_from_event)
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _collect_card_changes(session: Session, _) -> None:
+    changed = [obj.id for obj in (*session.dirty, *session.deleted) if isinstance(obj, DebitCard)]
+    if changed:
+        session.info.setdefault(_PENDING_KEY, set()).update(changed)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    for card_id in session.info.pop(_PENDING_KEY, ()):
+        card_state_cache.invalidate(card_id)
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
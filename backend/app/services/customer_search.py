@@ -0,0 +1,142 @@
+"""Prefix search over customers by name, email, contact or account number.
+
+Users carry normalized copies of name, email and contact (``search_*``), each indexed together
+with ``id``. A search is a range scan ``prefix <= column < next(prefix)`` ordered by
+``(column, id)`` and continued with a keyset cursor, so a page costs the same however many
+customers exist.
+"""
+
+import base64
+import binascii
+import json
+import logging
+import re
+import unicodedata
+
+from fastapi import status
+from sqlalchemy import Engine, and_, bindparam, event, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import AppError
+from app.models import Account, User
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ("name", "email", "contact", "account_number")
+
+_NAME_JUNK = re.compile(r"[^a-z0-9 ]+")
+_SPACES = re.compile(r"\s+")
+_NON_DIGITS = re.compile(r"\D+")
+_BACKFILL_BATCH = 1000
+
+
+def normalize_name(value: str) -> str:
+    ascii_only = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+    return _SPACES.sub(" ", _NAME_JUNK.sub(" ", ascii_only.lower())).strip()
+
+
+def normalize_email(value: str) -> str:
+    return value.strip().lower()
+
+
+def normalize_contact(value: str) -> str:
+    return _NON_DIGITS.sub("", value)
+
+
+def search_columns(name: str, email: str, contact: str) -> dict[str, str]:
+    return {"search_name": normalize_name(name), "search_email": normalize_email(email), "search_contact": normalize_contact(contact)}
+
+
+@event.listens_for(User, "before_insert")
+@event.listens_for(User, "before_update")
+def _sync_search_columns(_mapper, _connection, user: User) -> None:
+    for key, value in search_columns(user.name, user.email, user.contact).items():
+        setattr(user, key, value)
+
+
+def backfill_search_columns(engine: Engine) -> int:
+    """Fill ``search_*`` for users created before the columns existed."""
+    users = User.__table__
+    filled = 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                select(users.c.id, users.c.name, users.c.email, users.c.contact)
+                .where(users.c.search_name.is_(None))
+                .limit(_BACKFILL_BATCH)
+            ).all()
+            if not rows:
+                break
+            conn.execute(
+                update(users)
+                .where(users.c.id == bindparam("user_id"))
+                .values(
+                    search_name=bindparam("name_key"),
+                    search_email=bindparam("email_key"),
+                    search_contact=bindparam("contact_key"),
+                ),
+                [
+                    {
+                        "user_id": row.id,
+                        "name_key": normalize_name(row.name),
+                        "email_key": normalize_email(row.email),
+                        "contact_key": normalize_contact(row.contact),
+                    }
+                    for row in rows
+                ],
+            )
+        filled += len(rows)
+    if filled:
+        logger.info("Backfilled customer search columns for %s users", filled)
+    return filled
+
+
+def _prefix_end(prefix: str) -> str:
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def encode_cursor(key: str, row_id: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps([key, row_id]).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[str, int]:
+    try:
+        key, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError, TypeError) as exc:
+        raise AppError("Invalid cursor", status_code=status.HTTP_400_BAD_REQUEST) from exc
+    if not isinstance(key, str) or not isinstance(row_id, int):
+        raise AppError("Invalid cursor", status_code=status.HTTP_400_BAD_REQUEST)
+    return key, row_id
+
+
+def search_customers(
+    db: Session, field: str, query: str, cursor: str | None = None, limit: int = 20
+) -> tuple[list[tuple[User, Account | None]], str | None]:
+    if field == "account_number":
+        column, key_id, prefix = Account.account_number, Account.id, normalize_contact(query)
+        stmt = (
+            select(User, Account)
+            .join(Account, Account.user_id == User.id)
+            .where(Account.is_deleted.is_(False), User.is_deleted.is_(False))
+        )
+    else:
+        column = {"name": User.search_name, "email": User.search_email, "contact": User.search_contact}[field]
+        normalize = {"name": normalize_name, "email": normalize_email, "contact": normalize_contact}[field]
+        key_id, prefix = User.id, normalize(query)
+        stmt = select(User).where(User.is_deleted.is_(False))
+    if not prefix:
+        raise AppError("Search query has nothing to match on", status_code=status.HTTP_400_BAD_REQUEST)
+
+    stmt = stmt.where(column >= prefix, column < _prefix_end(prefix))
+    if cursor:
+        last_key, last_id = _decode_cursor(cursor)
+        stmt = stmt.where(or_(column > last_key, and_(column == last_key, key_id > last_id)))
+    rows = db.execute(stmt.order_by(column, key_id).limit(limit + 1)).all()
+
+    hits = [(row[0], row[1] if field == "account_number" else None) for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        user, account = hits[-1]
+        last = account if account is not None else user
+        next_cursor = encode_cursor(getattr(last, column.key), last.id)
+    return hits, next_cursor
@@ -0,0 +1,67 @@
+import logging
+from datetime import date
+from typing import Any
+
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import Deposit, DepositStatus
+from app.services.audit import log_action
+from app.services.deposit_math import accrued_interest
+from app.services.unit_of_work import run_in_transaction
+
+logger = logging.getLogger(__name__)
+
+
+def _accrue_chunk(db: Session, as_of: date, after_id: int, limit: int, actor_id: int | None):
+    deposits = list(
+        db.execute(
+            select(Deposit)
+            .where(
+                Deposit.status == DepositStatus.ACTIVE,
+                Deposit.id > after_id,
+                or_(Deposit.accrued_through.is_(None), Deposit.accrued_through < as_of),
+            )
+            .order_by(Deposit.id)
+            .limit(limit)
+            .with_for_update()
+        ).scalars()
+    )
+    if not deposits:
+        return None, {}
+
+    # The cumulative value is recomputed from the schedule rather than incremented, so a
+    # repeated or skipped day never drifts.
+    for deposit in deposits:
+        deposit.accrued_interest = accrued_interest(deposit, as_of)
+        deposit.accrued_through = as_of
+
+    counts = {"accrued": len(deposits)}
+    log_action(db, "accrue", "deposit", None, actor_id, {"as_of": as_of.isoformat(), "last_id": deposits[-1].id, **counts})
+    return deposits[-1].id, counts
+
+
+def accrue_deposits(as_of: date | None = None, actor_id: int | None = None, chunk_size: int | None = None) -> dict[str, Any]:
+    """Bring every active deposit's ``accrued_interest`` up to ``as_of``. Chunks commit
+    independently; deposits already accrued through ``as_of`` are skipped, so an interrupted run
+    is resumed by running it again."""
+    as_of = as_of or date.today()
+    chunk_size = chunk_size or settings.deposit_accrual_chunk_size
+    summary = {"as_of": as_of.isoformat(), "accrued": 0}
+
+    after_id = 0
+    while True:
+        with SessionLocal() as db:
+            last_id, counts = run_in_transaction(
+                db, lambda: _accrue_chunk(db, as_of, after_id, chunk_size, actor_id), "deposit_accrual"
+            )
+        if last_id is None:
+            break
+        after_id = last_id
+        for key, value in counts.items():
+            summary[key] += value
+
+    logger.info("Deposit accrual for %s: %s", as_of, summary)
+    return summary
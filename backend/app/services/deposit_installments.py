@@ -0,0 +1,167 @@
+import logging
+from datetime import date
+from typing import Any
+
+from sqlalchemy import Engine, bindparam, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import (
+    Account,
+    Deposit,
+    DepositStatus,
+    DepositType,
+    Transaction,
+    TransactionStatus,
+    TransactionType,
+)
+from app.services.audit import log_action
+from app.services.deposit_math import accrued_interest, installment_date
+from app.services.events import record_balance_event
+from app.services.unit_of_work import lock_accounts, run_in_transaction
+from app.services.utils import generate_transaction_reference
+
+logger = logging.getLogger(__name__)
+
+_BACKFILL_BATCH = 1000
+
+
+def next_installment_date(deposit: Deposit) -> date | None:
+    """Due date of the next unpaid installment, or ``None`` once the schedule is complete."""
+    if deposit.deposit_type != DepositType.RECURRING or deposit.installments_paid >= deposit.term_months:
+        return None
+    return installment_date(deposit.start_date, deposit.installments_paid)
+
+
+def backfill_installment_schedules(engine: Engine, as_of: date | None = None) -> int:
+    """Set ``next_installment_date`` on active recurring deposits created before installments
+    were collected. A deposit whose next installment is already overdue is not charged for it:
+    its remaining installments are recorded as missed and it keeps the ones already paid."""
+    as_of = as_of or date.today()
+    deposits = Deposit.__table__
+    filled = 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                select(deposits.c.id, deposits.c.start_date, deposits.c.term_months, deposits.c.installments_paid)
+                .where(
+                    deposits.c.status == DepositStatus.ACTIVE,
+                    deposits.c.deposit_type == DepositType.RECURRING,
+                    deposits.c.next_installment_date.is_(None),
+                    deposits.c.installments_missed == 0,
+                    deposits.c.installments_paid < deposits.c.term_months,
+                )
+                .limit(_BACKFILL_BATCH)
+            ).all()
+            if not rows:
+                break
+            params = []
+            for row in rows:
+                due = installment_date(row.start_date, row.installments_paid)
+                overdue = due < as_of
+                params.append(
+                    {
+                        "deposit_id": row.id,
+                        "due": None if overdue else due,
+                        "missed": row.term_months - row.installments_paid if overdue else 0,
+                    }
+                )
+            conn.execute(
+                update(deposits)
+                .where(deposits.c.id == bindparam("deposit_id"))
+                .values(next_installment_date=bindparam("due"), installments_missed=bindparam("missed")),
+                params,
+            )
+        filled += len(rows)
+    if filled:
+        logger.info("Backfilled installment schedules for %s recurring deposits", filled)
+    return filled
+
+
+def _collect_chunk(db: Session, as_of: date, after_id: int, limit: int, actor_id: int | None):
+    deposits = list(
+        db.execute(
+            select(Deposit)
+            .where(
+                Deposit.status == DepositStatus.ACTIVE,
+                Deposit.next_installment_date <= as_of,
+                Deposit.id > after_id,
+            )
+            .order_by(Deposit.id)
+            .limit(limit)
+            .with_for_update()
+        ).scalars()
+    )
+    if not deposits:
+        return None, {}
+
+    accounts = lock_accounts(db, [deposit.account_id for deposit in deposits])
+    counts = {"collected": 0, "short": 0, "missed": 0}
+    transactions: list[Transaction] = []
+    debited: dict[int, Transaction] = {}
+    for deposit in deposits:
+        # An installment can be collected until the next one falls due (or the deposit matures).
+        # After that it is missed and the schedule stops, so a run never debits more than one
+        # installment per deposit and never catches up on overdue ones.
+        if as_of >= installment_date(deposit.start_date, deposit.installments_paid + 1):
+            deposit.installments_missed = deposit.term_months - deposit.installments_paid
+            deposit.next_installment_date = None
+            counts["missed"] += 1
+            continue
+
+        account: Account | None = accounts.get(deposit.account_id)
+        if not account or account.is_deleted or not account.is_active or account.balance < deposit.amount:
+            counts["short"] += 1
+            continue
+
+        account.balance -= deposit.amount
+        deposit.installments_paid += 1
+        deposit.next_installment_date = next_installment_date(deposit)
+        if deposit.accrued_through is not None:
+            deposit.accrued_interest = accrued_interest(deposit, deposit.accrued_through)
+        transaction = Transaction(
+            from_account_id=account.id,
+            to_account_id=None,
+            transaction_type=TransactionType.DEPOSIT_CREATE,
+            amount=deposit.amount,
+            description=f"Recurring deposit {deposit.id} installment {deposit.installments_paid}/{deposit.term_months}",
+            status=TransactionStatus.SUCCESS,
+            reference=generate_transaction_reference(),
+        )
+        transactions.append(transaction)
+        debited[account.id] = transaction
+        counts["collected"] += 1
+
+    db.add_all(transactions)
+    db.flush()
+    for account_id, transaction in debited.items():
+        record_balance_event(db, accounts[account_id], transaction)
+
+    log_action(db, "collect", "deposit", None, actor_id, {"as_of": as_of.isoformat(), "last_id": deposits[-1].id, **counts})
+    return deposits[-1].id, counts
+
+
+def collect_installments(as_of: date | None = None, actor_id: int | None = None, chunk_size: int | None = None) -> dict[str, Any]:
+    """Debit the recurring installments due on or before ``as_of``, at most one per deposit. An
+    installment the account cannot cover is retried on later runs until the next one falls due.
+    Chunks commit independently and collected deposits move their due date forward, so an
+    interrupted run is resumed by running it again."""
+    as_of = as_of or date.today()
+    chunk_size = chunk_size or settings.deposit_installment_chunk_size
+    summary = {"as_of": as_of.isoformat(), "collected": 0, "short": 0, "missed": 0}
+
+    after_id = 0
+    while True:
+        with SessionLocal() as db:
+            last_id, counts = run_in_transaction(
+                db, lambda: _collect_chunk(db, as_of, after_id, chunk_size, actor_id), "deposit_installments"
+            )
+        if last_id is None:
+            break
+        after_id = last_id
+        for key, value in counts.items():
+            summary[key] += value
+
+    logger.info("Deposit installment collection for %s: %s", as_of, summary)
+    return summary
@@ -0,0 +1,100 @@
+"""Deposit interest in integer cents.
+
+Interest is simple interest: an installment earns ``amount * rate% * months / 12`` for the
+months it stays invested, rounded half-up to the cent. A fixed deposit is a single installment
+for the whole term; a recurring deposit adds one installment of ``amount`` per month. Before
+maturity, each installment's interest accrues linearly by day. Amounts are handled as
+integer cents and rates as integer hundredths of a percent, so results do not depend on
+Decimal context precision.
+"""
+
+from datetime import date
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Protocol
+
+from app.models import DepositType
+from app.services.utils import calculate_maturity_date
+
+_CENTS = Decimal("0.01")
+EARLY_EXIT_PENALTY_RATE = Decimal("0.01")
+# cents * (rate in hundredths of a percent) * months / _TERM_DIVISOR = interest in cents
+_TERM_DIVISOR = 100 * 100 * 12
+
+
+class DepositTerms(Protocol):
+    deposit_type: DepositType
+    term_months: int
+    amount: Decimal
+    interest_rate: Decimal
+    start_date: date
+    maturity_date: date
+    installments_paid: int
+
+
+def to_cents(amount: Decimal) -> int:
+    return int(Decimal(amount).quantize(_CENTS, rounding=ROUND_HALF_UP) * 100)
+
+
+def from_cents(cents: int) -> Decimal:
+    return (Decimal(cents) / 100).quantize(_CENTS)
+
+
+def rate_units(interest_rate: Decimal) -> int:
+    return int(Decimal(interest_rate).quantize(_CENTS) * 100)
+
+
+def divide_half_up(numerator: int, denominator: int) -> int:
+    return (2 * numerator + denominator) // (2 * denominator)
+
+
+def installment_date(start_date: date, index: int) -> date:
+    return start_date if index == 0 else calculate_maturity_date(start_date, index)
+
+
+def installment_count(deposit: DepositTerms) -> int:
+    return deposit.term_months if deposit.deposit_type == DepositType.RECURRING else 1
+
+
+def principal_paid(deposit: DepositTerms) -> Decimal:
+    return from_cents(to_cents(deposit.amount) * deposit.installments_paid)
+
+
+def accrual_factors(deposit: DepositTerms, as_of: date) -> list[tuple[int, int]]:
+    """Per paid installment, the ``(numerator, denominator)`` of the interest earned per cent of
+    ``amount`` up to ``as_of``. They do not depend on ``amount``, so they can be computed once
+    for a set of terms and applied to any amount with :func:`interest_cents`."""
+    rate = rate_units(deposit.interest_rate)
+    factors = []
+    for index in range(deposit.installments_paid):
+        paid_on = installment_date(deposit.start_date, index)
+        span = (deposit.maturity_date - paid_on).days
+        if span <= 0:
+            continue
+        elapsed = min(max((as_of - paid_on).days, 0), span)
+        months = deposit.term_months - index if deposit.deposit_type == DepositType.RECURRING else deposit.term_months
+        factors.append((rate * months * elapsed, _TERM_DIVISOR * span))
+    return factors
+
+
+def interest_cents(amount_cents: int, factors: list[tuple[int, int]]) -> int:
+    """Interest for an installment of ``amount_cents``, each installment rounded half-up to the cent."""
+    return sum(divide_half_up(amount_cents * numerator, denominator) for numerator, denominator in factors)
+
+
+def accrued_interest_cents(deposit: DepositTerms, as_of: date) -> int:
+    """Interest earned by the paid installments up to ``as_of`` (capped at maturity)."""
+    return interest_cents(to_cents(deposit.amount), accrual_factors(deposit, as_of))
+
+
+def accrued_interest(deposit: DepositTerms, as_of: date) -> Decimal:
+    return from_cents(accrued_interest_cents(deposit, as_of))
+
+
+def maturity_payout(deposit: DepositTerms) -> tuple[Decimal, Decimal]:
+    """Return ``(interest, payout)`` for a deposit held to maturity."""
+    interest = accrued_interest_cents(deposit, deposit.maturity_date)
+    return from_cents(interest), from_cents(to_cents(deposit.amount) * deposit.installments_paid + interest)
+
+
+def early_exit_penalty(principal: Decimal) -> Decimal:
+    return (principal * EARLY_EXIT_PENALTY_RATE).quantize(_CENTS, rounding=ROUND_HALF_UP)
@@ -0,0 +1,129 @@
+import logging
+from datetime import date, datetime, timezone
+from typing import Any
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import (
+    Account,
+    Deposit,
+    DepositStatus,
+    JobCheckpoint,
+    Transaction,
+    TransactionStatus,
+    TransactionType,
+)
+from app.services.audit import log_action
+from app.services.deposit_math import maturity_payout
+from app.services.events import record_balance_event
+from app.services.unit_of_work import lock_accounts, run_in_transaction
+from app.services.utils import generate_transaction_reference
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_NAME = "deposit_maturity"
+
+
+def _load_checkpoint(db: Session, run_key: str) -> JobCheckpoint:
+    checkpoint = db.get(JobCheckpoint, CHECKPOINT_NAME, with_for_update=True)
+    if checkpoint is None:
+        checkpoint = JobCheckpoint(name=CHECKPOINT_NAME, run_key=run_key, position={}, processed=0)
+        db.add(checkpoint)
+    elif checkpoint.run_key != run_key:
+        checkpoint.run_key, checkpoint.position, checkpoint.processed = run_key, {}, 0
+    return checkpoint
+
+
+def mature_deposit(deposit: Deposit, account: Account, matured_at: datetime) -> Transaction:
+    """Credit ``deposit``'s maturity payout to its locked ``account`` and mark it matured.
+    Returns the ``deposit_maturity`` transaction, which the caller adds and flushes."""
+    interest, payout = maturity_payout(deposit)
+    account.balance += payout
+    deposit.status = DepositStatus.MATURED
+    deposit.accrued_interest = interest
+    deposit.accrued_through = deposit.maturity_date
+    deposit.payout_amount = payout
+    deposit.matured_at = matured_at
+    deposit.next_installment_date = None
+    return Transaction(
+        from_account_id=None,
+        to_account_id=account.id,
+        transaction_type=TransactionType.DEPOSIT_MATURITY,
+        amount=payout,
+        description=f"Deposit {deposit.id} matured (interest: {interest})",
+        status=TransactionStatus.SUCCESS,
+        reference=generate_transaction_reference(),
+    )
+
+
+def _mature_chunk(db: Session, as_of: date, chunk_size: int, actor_id: int | None) -> int:
+    checkpoint = _load_checkpoint(db, as_of.isoformat())
+    stmt = select(Deposit).where(Deposit.status == DepositStatus.ACTIVE, Deposit.maturity_date <= as_of)
+    if checkpoint.position:
+        last_date = date.fromisoformat(checkpoint.position["maturity_date"])
+        stmt = stmt.where(
+            or_(
+                Deposit.maturity_date > last_date,
+                and_(Deposit.maturity_date == last_date, Deposit.id > checkpoint.position["id"]),
+            )
+        )
+    deposits = list(
+        db.execute(stmt.order_by(Deposit.maturity_date, Deposit.id).limit(chunk_size).with_for_update()).scalars()
+    )
+    if not deposits:
+        # The run is complete; the next one starts from the beginning of the index range.
+        checkpoint.position = {}
+        return 0
+
+    accounts = lock_accounts(db, [deposit.account_id for deposit in deposits])
+    matured_at = datetime.now(timezone.utc)
+    transactions = []
+    credited: dict[int, Transaction] = {}
+    for deposit in deposits:
+        account = accounts[deposit.account_id]
+        transaction = mature_deposit(deposit, account, matured_at)
+        transactions.append(transaction)
+        credited[account.id] = transaction
+
+    db.add_all(transactions)
+    db.flush()
+    for account_id, transaction in credited.items():
+        record_balance_event(db, accounts[account_id], transaction)
+
+    last = deposits[-1]
+    checkpoint.position = {"maturity_date": last.maturity_date.isoformat(), "id": last.id}
+    checkpoint.processed += len(deposits)
+    log_action(
+        db,
+        "mature",
+        "deposit",
+        None,
+        actor_id,
+        {"as_of": as_of.isoformat(), "deposits": len(deposits), "accounts": len(credited), "last_id": last.id},
+    )
+    return len(deposits)
+
+
+def mature_deposits(as_of: date | None = None, actor_id: int | None = None, chunk_size: int | None = None) -> dict[str, Any]:
+    """Pay out every active deposit whose maturity date is on or before ``as_of``.
+
+    Each chunk credits principal plus interest, marks the deposits matured and advances the
+    ``job_checkpoints`` position in one transaction, so an interrupted run resumes after the
+    last committed chunk. Only active deposits are selected, so re-running a run never pays a
+    deposit twice.
+    """
+    as_of = as_of or date.today()
+    chunk_size = chunk_size or settings.deposit_maturity_chunk_size
+    matured = 0
+    while True:
+        with SessionLocal() as db:
+            count = run_in_transaction(db, lambda: _mature_chunk(db, as_of, chunk_size, actor_id), "deposit_maturity")
+        if not count:
+            break
+        matured += count
+
+    logger.info("Deposit maturity run for %s: %s matured", as_of, matured)
+    return {"as_of": as_of.isoformat(), "matured": matured}
@@ -0,0 +1,167 @@
+from dataclasses import dataclass, replace
+from datetime import date
+from decimal import Decimal
+from functools import lru_cache
+
+from app.core.config import settings
+from app.models import DepositType
+from app.services.deposit_math import (
+    accrual_factors,
+    early_exit_penalty,
+    from_cents,
+    installment_count,
+    installment_date,
+    interest_cents,
+    principal_paid,
+    to_cents,
+)
+from app.services.utils import calculate_maturity_date
+
+# Accrual factors do not depend on the amount; projections are cached on one cent and scaled.
+_UNIT = Decimal("0.01")
+
+
+@dataclass(frozen=True)
+class _Terms:
+    deposit_type: DepositType
+    term_months: int
+    amount: Decimal
+    interest_rate: Decimal
+    start_date: date
+    maturity_date: date
+    installments_paid: int
+
+
+@dataclass(frozen=True)
+class Installment:
+    number: int
+    due_date: date
+    amount: Decimal
+
+
+@dataclass(frozen=True)
+class CancellationPoint:
+    month: int
+    cancelled_on: date
+    principal: Decimal
+    interest: Decimal
+    penalty: Decimal
+    payout: Decimal
+
+
+@dataclass(frozen=True)
+class DepositQuote:
+    deposit_type: DepositType
+    term_months: int
+    amount: Decimal
+    interest_rate: Decimal
+    start_date: date
+    maturity_date: date
+    principal: Decimal
+    interest: Decimal
+    maturity_amount: Decimal
+    installments: tuple[Installment, ...]
+    cancellation: tuple[CancellationPoint, ...]
+
+
+@dataclass(frozen=True)
+class _Point:
+    month: int
+    cancelled_on: date
+    installments_paid: int
+    factors: tuple[tuple[int, int], ...]
+
+
+@dataclass(frozen=True)
+class _Schedule:
+    maturity_date: date
+    due_dates: tuple[date, ...]
+    points: tuple[_Point, ...]
+
+
+@lru_cache(maxsize=settings.deposit_quote_cache_size)
+def _schedule(deposit_type: DepositType, term_months: int, interest_rate: Decimal, start_date: date) -> _Schedule:
+    """The amount-independent part of a projection: installment dates and, per cancellation
+    point, the accrual factors ``cancel_deposit`` and ``mature_deposits`` would apply."""
+    terms = _Terms(
+        deposit_type=deposit_type,
+        term_months=term_months,
+        amount=_UNIT,
+        interest_rate=interest_rate,
+        start_date=start_date,
+        maturity_date=calculate_maturity_date(start_date, term_months),
+        installments_paid=1,
+    )
+    count = installment_count(terms)
+    points = []
+    for month in range(1, term_months):
+        # Cancelled on the day the next installment falls due, after it has been collected.
+        on = calculate_maturity_date(start_date, month)
+        paid = replace(terms, installments_paid=min(month + 1, count))
+        points.append(_Point(month, on, paid.installments_paid, tuple(accrual_factors(paid, on))))
+    full = replace(terms, installments_paid=count)
+    points.append(_Point(term_months, full.maturity_date, count, tuple(accrual_factors(full, full.maturity_date))))
+
+    return _Schedule(
+        maturity_date=full.maturity_date,
+        due_dates=tuple(installment_date(start_date, index) for index in range(count)),
+        points=tuple(points),
+    )
+
+
+def quote_deposit(
+    deposit_type: DepositType,
+    term_months: int,
+    amount: Decimal,
+    interest_rate: Decimal,
+    start_date: date | None = None,
+) -> DepositQuote:
+    """Project a deposit without touching the database.
+
+    The schedule is memoized per (deposit type, term, rate, start date) and scaled to ``amount``
+    here: interest is linear in the installment amount, and the factors are applied with the
+    same per-installment rounding as accrual, so every amount shares one cache entry. The start
+    date only changes once a day, so repeated product-page quotes are cache hits.
+    """
+    rate = Decimal(interest_rate).quantize(Decimal("0.01"))
+    start_date = start_date or date.today()
+    schedule = _schedule(deposit_type, term_months, rate, start_date)
+    amount_cents = to_cents(amount)
+    terms = _Terms(
+        deposit_type=deposit_type,
+        term_months=term_months,
+        amount=from_cents(amount_cents),
+        interest_rate=rate,
+        start_date=start_date,
+        maturity_date=schedule.maturity_date,
+        installments_paid=1,
+    )
+
+    cancellation = []
+    for point in schedule.points:
+        principal = principal_paid(replace(terms, installments_paid=point.installments_paid))
+        interest = from_cents(interest_cents(amount_cents, point.factors))
+        # As in cancel_deposit: the penalty applies before maturity, and on the maturity date the
+        # deposit is paid out like mature_deposits does.
+        penalty = early_exit_penalty(principal) if point.cancelled_on < schedule.maturity_date else Decimal("0.00")
+        payout = principal + interest - penalty
+        cancellation.append(CancellationPoint(point.month, point.cancelled_on, principal, interest, penalty, payout))
+    at_maturity = cancellation[-1]
+
+    return DepositQuote(
+        deposit_type=deposit_type,
+        term_months=term_months,
+        amount=terms.amount,
+        interest_rate=rate,
+        start_date=start_date,
+        maturity_date=schedule.maturity_date,
+        principal=at_maturity.principal,
+        interest=at_maturity.interest,
+        maturity_amount=at_maturity.payout,
+        installments=tuple(Installment(index + 1, due, terms.amount) for index, due in enumerate(schedule.due_dates)),
+        cancellation=tuple(cancellation),
+    )
+
+
+def quote_cache_info():
+    return _schedule.cache_info()
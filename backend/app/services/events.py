@@ -0,0 +1,331 @@
+import asyncio
+import logging
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from time import monotonic
+from typing import Any
+
+from sqlalchemy import delete, event, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import Account, CardAuthorization, DebitCard, MutualFundOrder, OutboxEvent, Transaction
+
+logger = logging.getLogger(__name__)
+
+BALANCE_UPDATED = "balance.updated"
+ACCOUNT_UPDATED = "account.updated"
+FUND_ORDER_UPDATED = "fund_order.updated"
+CARD_UPDATED = "card.updated"
+
+_PENDING_KEY = "outbox_pending"
+
+
+def _record(db: Session, event_type: str, user_id: int, account_id: int | None, payload: dict[str, Any]) -> None:
+    db.add(OutboxEvent(event_type=event_type, user_id=user_id, account_id=account_id, payload=payload))
+    db.info[_PENDING_KEY] = True
+
+
+def _record_many(db: Session, rows: list[dict[str, Any]]) -> None:
+    if rows:
+        db.execute(insert(OutboxEvent), rows)
+        db.info[_PENDING_KEY] = True
+
+
+def record_balance_event(db: Session, account: Account, transaction: Transaction | None = None) -> None:
+    payload: dict[str, Any] = {"account_id": account.id, "balance": str(account.balance), "version": account.version}
+    if transaction is not None:
+        payload.update(
+            {
+                "transaction_id": transaction.id,
+                "transaction_type": transaction.transaction_type.value,
+                "amount": str(transaction.amount),
+            }
+        )
+    _record(db, BALANCE_UPDATED, account.user_id, account.id, payload)
+
+
+def _account_payload(account: Any) -> dict[str, Any]:
+    return {
+        "account_id": account.id,
+        "version": account.version,
+        "is_active": account.is_active,
+        "is_deleted": account.is_deleted,
+    }
+
+
+def record_account_event(db: Session, account: Account) -> None:
+    _record(db, ACCOUNT_UPDATED, account.user_id, account.id, _account_payload(account))
+
+
+def record_account_events(db: Session, accounts: Sequence[Any]) -> None:
+    """Bulk variant of ``record_account_event`` for rows exposing the same attributes."""
+    _record_many(
+        db,
+        [
+            {"event_type": ACCOUNT_UPDATED, "user_id": account.user_id, "account_id": account.id, "payload": _account_payload(account)}
+            for account in accounts
+        ],
+    )
+
+
+def record_card_hold_event(
+    db: Session, authorization: CardAuthorization, user_id: int, balance: Decimal, version: int
+) -> None:
+    payload = {
+        "account_id": authorization.account_id,
+        "balance": str(balance),
+        "version": version,
+        "authorization_id": authorization.id,
+        "card_id": authorization.card_id,
+        "amount": str(authorization.amount),
+    }
+    _record(db, BALANCE_UPDATED, user_id, authorization.account_id, payload)
+
+
+def _card_payload(card: Any) -> dict[str, Any]:
+    return {"card_id": card.id, "status": card.status.value, "daily_limit": str(card.daily_limit)}
+
+
+def record_card_event(db: Session, card: DebitCard, user_id: int) -> None:
+    _record(db, CARD_UPDATED, user_id, card.account_id, _card_payload(card))
+
+
+def record_card_events(db: Session, cards: Sequence[Any]) -> None:
+    """Bulk variant of ``record_card_event``; each row also carries the owner's ``user_id``."""
+    _record_many(
+        db,
+        [
+            {"event_type": CARD_UPDATED, "user_id": card.user_id, "account_id": card.account_id, "payload": _card_payload(card)}
+            for card in cards
+        ],
+    )
+
+
+def record_fund_order_event(db: Session, order: MutualFundOrder) -> None:
+    payload = {
+        "order_id": order.id,
+        "status": order.status.value,
+        "fund_id": order.fund_id,
+        "trade_id": order.trade_id,
+        "executed_units": str(order.executed_units) if order.executed_units is not None else None,
+        "executed_amount": str(order.executed_amount) if order.executed_amount is not None else None,
+        "failure_reason": order.failure_reason,
+    }
+    _record(db, FUND_ORDER_UPDATED, order.user_id, order.account_id, payload)
+
+
+def fetch_events(db: Session, user_id: int, is_admin: bool, after_id: int, limit: int) -> list[OutboxEvent]:
+    stmt = select(OutboxEvent).where(OutboxEvent.id > after_id)
+    if not is_admin:
+        stmt = stmt.where(OutboxEvent.user_id == user_id)
+    return list(db.execute(stmt.order_by(OutboxEvent.id).limit(limit)).scalars().all())
+
+
+def fetch_events_by_id(db: Session, user_id: int, is_admin: bool, event_ids: Sequence[int]) -> list[OutboxEvent]:
+    stmt = select(OutboxEvent).where(OutboxEvent.id.in_(event_ids))
+    if not is_admin:
+        stmt = stmt.where(OutboxEvent.user_id == user_id)
+    return list(db.execute(stmt.order_by(OutboxEvent.id)).scalars().all())
+
+
+@dataclass(eq=False)
+class Subscription:
+    user_id: int
+    is_admin: bool
+    queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=settings.event_subscriber_queue_size))
+
+
+class EventDispatcher:
+    # Ids are allocated before commit, so on PostgreSQL/MySQL a lower id can become visible
+    # after a higher one. Ids skipped over are kept as gaps and re-read on every poll until they
+    # show up or are older than ``event_gap_timeout_seconds`` (the transaction rolled back).
+    # Gaps that were filled are remembered for the same window, so a stream resuming from a
+    # higher Last-Event-ID can re-read them.
+    max_gaps = 10_000
+
+    def __init__(self, batch_size: int = 500):
+        self.batch_size = batch_size
+        self._subscriptions: set[Subscription] = set()
+        self._listeners: list[Callable[[OutboxEvent], None]] = []
+        self._last_id = 0
+        self._gaps: dict[int, float] = {}
+        self._late: dict[int, float] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._last_prune: datetime | None = None
+
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    def late_ids(self, up_to: int) -> list[int]:
+        """Ids at or below ``up_to`` that were dispatched out of order within the gap window."""
+        return sorted(event_id for event_id in self._late if event_id <= up_to)
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._last_id, recent_ids = await asyncio.to_thread(self._initial_position)
+        # Ids missing from the recent window may belong to transactions still in flight.
+        if recent_ids:
+            present = set(recent_ids)
+            self._add_gaps((event_id for event_id in range(min(recent_ids), self._last_id) if event_id not in present), monotonic())
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._loop = None
+        for subscription in list(self._subscriptions):
+            self._close(subscription)
+
+    def notify(self) -> None:
+        loop, wakeup = self._loop, self._wakeup
+        if loop is not None and wakeup is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(wakeup.set)
+
+    def add_listener(self, listener: Callable[[OutboxEvent], None]) -> None:
+        self._listeners.append(listener)
+
+    def subscribe(self, user_id: int, is_admin: bool) -> Subscription:
+        subscription = Subscription(user_id=user_id, is_admin=is_admin)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    def _close(self, subscription: Subscription) -> None:
+        # A closed subscriber gets a None sentinel; the client reconnects with Last-Event-ID
+        # and replays whatever it missed from the outbox table.
+        self._subscriptions.discard(subscription)
+        while not subscription.queue.empty():
+            subscription.queue.get_nowait()
+        subscription.queue.put_nowait(None)
+
+    def _initial_position(self) -> tuple[int, list[int]]:
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.event_gap_timeout_seconds)
+        with SessionLocal() as session:
+            last_id = session.execute(select(func.max(OutboxEvent.id))).scalar_one() or 0
+            recent_ids = session.execute(select(OutboxEvent.id).where(OutboxEvent.created_at >= cutoff)).scalars().all()
+        return last_id, list(recent_ids)
+
+    def _add_gaps(self, event_ids: Any, seen_at: float) -> None:
+        for event_id in event_ids:
+            self._gaps[event_id] = seen_at
+        if len(self._gaps) > self.max_gaps:
+            logger.warning("Tracking more than %s outbox id gaps; dropping the oldest", self.max_gaps)
+            for event_id in sorted(self._gaps)[: len(self._gaps) - self.max_gaps]:
+                del self._gaps[event_id]
+
+    def _add_late(self, event_id: int, dispatched_at: float) -> None:
+        self._late[event_id] = dispatched_at
+        if len(self._late) > self.max_gaps:
+            del self._late[min(self._late)]
+
+    def _expire_gaps(self) -> None:
+        expired_before = monotonic() - settings.event_gap_timeout_seconds
+        for ids in (self._gaps, self._late):
+            for event_id in [event_id for event_id, seen_at in ids.items() if seen_at < expired_before]:
+                del ids[event_id]
+
+    def _fetch_ids(self, event_ids: list[int]) -> list[OutboxEvent]:
+        events: list[OutboxEvent] = []
+        with SessionLocal() as session:
+            for start in range(0, len(event_ids), self.batch_size):
+                chunk = event_ids[start : start + self.batch_size]
+                events.extend(session.execute(select(OutboxEvent).where(OutboxEvent.id.in_(chunk))).scalars().all())
+        return sorted(events, key=lambda outbox_event: outbox_event.id)
+
+    def _fetch_since(self, after_id: int) -> list[OutboxEvent]:
+        with SessionLocal() as session:
+            stmt = select(OutboxEvent).where(OutboxEvent.id > after_id).order_by(OutboxEvent.id).limit(self.batch_size)
+            return list(session.execute(stmt).scalars().all())
+
+    def _prune(self) -> None:
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=settings.event_retention_hours)
+        with SessionLocal() as session:
+            session.execute(delete(OutboxEvent).where(OutboxEvent.created_at < cutoff))
+            session.commit()
+
+    def dispatch(self, events: list[OutboxEvent]) -> None:
+        now = monotonic()
+        for outbox_event in events:
+            if self._gaps.pop(outbox_event.id, None) is None:
+                if outbox_event.id <= self._last_id:
+                    continue
+                # Nothing is known below the first id seen, so only later skips are gaps.
+                if self._last_id:
+                    self._add_gaps(range(self._last_id + 1, outbox_event.id), now)
+                self._last_id = outbox_event.id
+            else:
+                self._add_late(outbox_event.id, now)
+            for listener in self._listeners:
+                try:
+                    listener(outbox_event)
+                except Exception:
+                    logger.exception("Event listener %r failed", listener)
+            for subscription in list(self._subscriptions):
+                if not subscription.is_admin and subscription.user_id != outbox_event.user_id:
+                    continue
+                try:
+                    subscription.queue.put_nowait(outbox_event)
+                except asyncio.QueueFull:
+                    logger.warning("Dropping slow event subscriber for user %s", subscription.user_id)
+                    self._close(subscription)
+
+    async def _run(self) -> None:
+        interval = settings.event_poll_interval_ms / 1000
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                self._expire_gaps()
+                if self._gaps:
+                    self.dispatch(await asyncio.to_thread(self._fetch_ids, sorted(self._gaps)))
+                after_id = self._last_id
+                while True:
+                    events = await asyncio.to_thread(self._fetch_since, after_id)
+                    self.dispatch(events)
+                    if len(events) < self.batch_size:
+                        break
+                    after_id = events[-1].id
+
+                now = datetime.now(timezone.utc)
+                if self._last_prune is None or now - self._last_prune > timedelta(hours=1):
+                    self._last_prune = now
+                    await asyncio.to_thread(self._prune)
+            except Exception:
+                logger.exception("Event dispatcher iteration failed")
+
+
+dispatcher = EventDispatcher()
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _notify_dispatcher(session: Session) -> None:
+    if session.info.pop(_PENDING_KEY, False):
+        dispatcher.notify()
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
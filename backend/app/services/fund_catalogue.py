@@ -0,0 +1,118 @@
+import threading
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Mapping
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import CacheVersion, MutualFund
+
+CATALOGUE_CACHE = "fund_catalogue"
+
+_PENDING_KEY = "fund_catalogue_changed"
+
+
+@dataclass(frozen=True)
+class FundSnapshot:
+    id: int
+    name: str
+    symbol: str
+    nav: Decimal
+    nav_version: int
+    is_active: bool
+
+
+@dataclass(frozen=True)
+class CatalogueSnapshot:
+    version: int
+    funds: Mapping[int, FundSnapshot]
+    active: tuple[FundSnapshot, ...]
+
+
+class FundCatalogue:
+    """Immutable in-process snapshot of ``mutual_funds``.
+
+    Admin mutations bump the ``fund_catalogue`` row in ``cache_versions`` in their own
+    transaction. The worker that made the change reloads on its next read; other workers
+    notice the new version within ``FUND_CATALOGUE_CHECK_INTERVAL_MS``.
+    """
+
+    def __init__(self, check_interval_ms: int):
+        self.check_interval = check_interval_ms / 1000
+        self._snapshot: CatalogueSnapshot | None = None
+        self._checked_at = 0.0
+        self._stale = True
+        self._lock = threading.Lock()
+
+    def get(self, db: Session) -> CatalogueSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None and not self._stale and time.monotonic() - self._checked_at < self.check_interval:
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and not self._stale and time.monotonic() - self._checked_at < self.check_interval:
+                return snapshot
+            version = self._current_version(db)
+            if snapshot is None or self._stale or snapshot.version != version:
+                snapshot = self._load(db, version)
+                self._snapshot = snapshot
+                self._stale = False
+            self._checked_at = time.monotonic()
+            return snapshot
+
+    def fund(self, db: Session, fund_id: int) -> FundSnapshot | None:
+        return self.get(db).funds.get(fund_id)
+
+    def invalidate(self) -> None:
+        self._stale = True
+
+    def mark_changed(self, db: Session) -> None:
+        updated = db.execute(
+            update(CacheVersion).where(CacheVersion.name == CATALOGUE_CACHE).values(version=CacheVersion.version + 1)
+        )
+        if updated.rowcount == 0:
+            db.execute(insert(CacheVersion).values(name=CATALOGUE_CACHE, version=1))
+        db.info[_PENDING_KEY] = True
+
+    def _current_version(self, db: Session) -> int:
+        return db.execute(select(CacheVersion.version).where(CacheVersion.name == CATALOGUE_CACHE)).scalar_one_or_none() or 0
+
+    def _load(self, db: Session, version: int) -> CatalogueSnapshot:
+        rows = db.execute(
+            select(
+                MutualFund.id,
+                MutualFund.name,
+                MutualFund.symbol,
+                MutualFund.nav,
+                MutualFund.nav_version,
+                MutualFund.is_active,
+            ).order_by(MutualFund.id)
+        ).all()
+        funds = {
+            row.id: FundSnapshot(row.id, row.name, row.symbol, Decimal(row.nav), row.nav_version, row.is_active) for row in rows
+        }
+        return CatalogueSnapshot(
+            version=version,
+            funds=MappingProxyType(funds),
+            active=tuple(fund for fund in funds.values() if fund.is_active),
+        )
+
+
+fund_catalogue = FundCatalogue(settings.fund_catalogue_check_interval_ms)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _swap_after_commit(session: Session) -> None:
+    if session.info.pop(_PENDING_KEY, False):
+        fund_catalogue.invalidate()
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,228 @@
+"""Set-based settlement of mutual fund trades.
+
+Used by the order book and SIP executors. A call settles many requests inside the caller's
+transaction: accounts are locked once, every holding and account row is changed once no
+matter how many requests touch it, and trades and transactions are inserted in batches.
+With ``net=True`` the fills of one account in one fund are also netted into a single trade
+and cash transaction.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_HALF_UP
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import (
+    Account,
+    FundTradeType,
+    MutualFundHolding,
+    MutualFundTrade,
+    Transaction,
+    TransactionStatus,
+    TransactionType,
+)
+from app.services.events import record_balance_event
+from app.services.fund_catalogue import FundSnapshot, fund_catalogue
+from app.services.unit_of_work import lock_accounts
+from app.services.utils import generate_transaction_reference
+
+_CENTS = Decimal("0.01")
+_UNITS = Decimal("0.0001")
+
+
+@dataclass
+class LedgerRequest:
+    key: int
+    account_id: int
+    fund_id: int
+    trade_type: FundTradeType
+    amount: Decimal | None = None
+    units: Decimal | None = None
+
+
+@dataclass
+class LedgerResult:
+    key: int
+    executed: bool
+    reason: str | None = None
+    trade_type: FundTradeType | None = None
+    nav: Decimal | None = None
+    units: Decimal | None = None
+    amount: Decimal | None = None
+    trade: MutualFundTrade | None = None
+    transaction: Transaction | None = None
+
+
+def _trade_rows(account: Account, fund: FundSnapshot, trade_type: FundTradeType, units: Decimal, amount: Decimal, fills: int = 1):
+    netted = f" (net of {fills} orders)" if fills > 1 else ""
+    trade = MutualFundTrade(
+        user_id=account.user_id,
+        account_id=account.id,
+        fund_id=fund.id,
+        trade_type=trade_type,
+        nav=fund.nav,
+        nav_version=fund.nav_version,
+        units=units,
+        amount=amount,
+    )
+    if trade_type == FundTradeType.BUY:
+        transaction = Transaction(
+            from_account_id=account.id,
+            to_account_id=None,
+            transaction_type=TransactionType.MUTUAL_FUND_BUY,
+            amount=amount,
+            description=f"Mutual fund buy{netted}: {fund.symbol}",
+            status=TransactionStatus.SUCCESS,
+            reference=generate_transaction_reference(),
+        )
+    else:
+        transaction = Transaction(
+            from_account_id=None,
+            to_account_id=account.id,
+            transaction_type=TransactionType.MUTUAL_FUND_SELL,
+            amount=amount,
+            description=f"Mutual fund sell{netted}: {fund.symbol}",
+            status=TransactionStatus.SUCCESS,
+            reference=generate_transaction_reference(),
+        )
+    return trade, transaction
+
+
+def _net_rows(account: Account, fund: FundSnapshot, fills: list[LedgerResult]) -> tuple[MutualFundTrade | None, Transaction | None]:
+    """One trade for the net units and one transaction for the net cash of a (account, fund) pair.
+
+    Every fill is priced at the same NAV, so the two nets agree in sign except when buys and
+    sells cross to within rounding; cash decides the side then. Fully crossed fills need no rows.
+    """
+    net_units = sum((fill.units if fill.trade_type == FundTradeType.BUY else -fill.units for fill in fills), Decimal("0"))
+    cash_out = sum((fill.amount if fill.trade_type == FundTradeType.BUY else -fill.amount for fill in fills), Decimal("0"))
+    if not net_units and not cash_out:
+        return None, None
+    side = FundTradeType.BUY if (cash_out or net_units) > 0 else FundTradeType.SELL
+    trade, transaction = _trade_rows(account, fund, side, abs(net_units), abs(cash_out), len(fills))
+    return trade, transaction if cash_out else None
+
+
+def settle(db: Session, requests: Iterable[LedgerRequest], net: bool = False) -> dict[int, LedgerResult]:
+    """Settle requests per account: sells first, so their proceeds can fund buys, then buys,
+    each side in request order. A request that cannot be filled is rejected on its own.
+
+    Each result carries the request's own fill at the NAV. With ``net`` the results of one
+    (account, fund) pair share a single netted trade and transaction, which are ``None`` when
+    the fills cancel out."""
+    by_account: dict[int, list[LedgerRequest]] = defaultdict(list)
+    for request in requests:
+        by_account[request.account_id].append(request)
+    if not by_account:
+        return {}
+
+    fund_ids = {request.fund_id for items in by_account.values() for request in items}
+    accounts = lock_accounts(db, list(by_account))
+    # NAVs come from the catalogue snapshot; each trade records the nav_version it used.
+    funds = fund_catalogue.get(db).funds
+    holdings = {
+        (holding.account_id, holding.fund_id): holding
+        for holding in db.execute(
+            select(MutualFundHolding).where(
+                MutualFundHolding.account_id.in_(list(by_account)), MutualFundHolding.fund_id.in_(fund_ids)
+            )
+        ).scalars()
+    }
+
+    results: dict[int, LedgerResult] = {}
+    fills: dict[tuple[int, int], list[LedgerResult]] = defaultdict(list)
+    touched_accounts: list[Account] = []
+    touched_holdings: set[tuple[int, int]] = set()
+
+    for account_id, items in by_account.items():
+        account = accounts.get(account_id)
+        if not account or account.is_deleted or not account.is_active:
+            for request in items:
+                results[request.key] = LedgerResult(request.key, False, "Account not found")
+            continue
+
+        starting_balance = account.balance
+        sells = [request for request in items if request.trade_type == FundTradeType.SELL]
+        buys = [request for request in items if request.trade_type == FundTradeType.BUY]
+
+        for request in sells:
+            fund = funds.get(request.fund_id)
+            holding = holdings.get((account_id, request.fund_id))
+            units = Decimal(request.units).quantize(_UNITS, rounding=ROUND_HALF_UP)
+            if not fund:
+                results[request.key] = LedgerResult(request.key, False, "Mutual fund not found")
+                continue
+            if not holding or holding.units < units:
+                results[request.key] = LedgerResult(request.key, False, "Insufficient holding units")
+                continue
+
+            amount = (units * fund.nav).quantize(_CENTS, rounding=ROUND_HALF_UP)
+            holding.units = (holding.units - units).quantize(_UNITS, rounding=ROUND_HALF_UP)
+            account.balance += amount
+            touched_holdings.add((account_id, fund.id))
+            results[request.key] = LedgerResult(request.key, True, nav=fund.nav, units=units, amount=amount, trade_type=FundTradeType.SELL)
+            fills[(account_id, fund.id)].append(results[request.key])
+
+        for request in buys:
+            fund = funds.get(request.fund_id)
+            amount = Decimal(request.amount).quantize(_CENTS, rounding=ROUND_HALF_UP)
+            if not fund or not fund.is_active:
+                results[request.key] = LedgerResult(request.key, False, "Mutual fund not found")
+                continue
+            if account.balance < amount:
+                results[request.key] = LedgerResult(request.key, False, "Insufficient account balance")
+                continue
+            units = (amount / fund.nav).quantize(_UNITS, rounding=ROUND_HALF_UP)
+            if units <= 0:
+                results[request.key] = LedgerResult(request.key, False, "Amount is below one unit increment")
+                continue
+
+            account.balance -= amount
+            holding = holdings.get((account_id, fund.id))
+            if not holding:
+                holding = MutualFundHolding(
+                    user_id=account.user_id,
+                    account_id=account.id,
+                    fund_id=fund.id,
+                    units=units,
+                    average_nav=fund.nav,
+                )
+                holdings[(account_id, fund.id)] = holding
+                db.add(holding)
+            else:
+                total_cost = (holding.units * holding.average_nav) + amount
+                new_units = (holding.units + units).quantize(_UNITS, rounding=ROUND_HALF_UP)
+                holding.average_nav = (total_cost / new_units).quantize(_UNITS, rounding=ROUND_HALF_UP)
+                holding.units = new_units
+            touched_holdings.add((account_id, fund.id))
+            results[request.key] = LedgerResult(request.key, True, nav=fund.nav, units=units, amount=amount, trade_type=FundTradeType.BUY)
+            fills[(account_id, fund.id)].append(results[request.key])
+
+        if account.balance != starting_balance:
+            touched_accounts.append(account)
+
+    for key in touched_holdings:
+        holding = holdings[key]
+        if holding.units <= Decimal("0.0000") and holding.id is not None:
+            db.delete(holding)
+
+    rows: list[MutualFundTrade | Transaction] = []
+    for (account_id, fund_id), pair_fills in fills.items():
+        account, fund = accounts[account_id], funds[fund_id]
+        if net:
+            trade, transaction = _net_rows(account, fund, pair_fills)
+            for fill in pair_fills:
+                fill.trade, fill.transaction = trade, transaction
+            rows.extend(row for row in (trade, transaction) if row is not None)
+            continue
+        for fill in pair_fills:
+            fill.trade, fill.transaction = _trade_rows(account, fund, fill.trade_type, fill.units, fill.amount)
+            rows.extend((fill.trade, fill.transaction))
+    db.add_all(rows)
+    db.flush()
+    for account in touched_accounts:
+        record_balance_event(db, account)
+    return results
@@ -0,0 +1,143 @@
+import csv
+from collections import defaultdict
+from collections.abc import Iterator
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from itertools import islice
+from typing import Any, BinaryIO
+
+from fastapi import status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from sqlalchemy import bindparam, delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.core.exceptions import AppError
+from app.models import MutualFund, MutualFundNav
+from app.schemas import NavRecord
+from app.services.record_files import iter_records
+
+MAX_REPORTED_ERRORS = 100
+_CHUNK_SIZE = 500
+
+
+def today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+def _error(line: int, loc: tuple, message: str) -> dict[str, Any]:
+    return {"loc": ["file", line, *loc], "msg": message, "type": "value_error"}
+
+
+def _parse_records(stream: BinaryIO, file_format: str, max_rows: int, errors: list[dict[str, Any]]) -> Iterator[tuple[int, NavRecord]]:
+    rows = 0
+    try:
+        for line, raw in iter_records(stream, file_format):
+            rows += 1
+            if rows > max_rows:
+                raise AppError(f"NAV file exceeds {max_rows} rows", status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+            try:
+                record = NavRecord.model_validate(raw)
+            except ValidationError as exc:
+                errors.extend(_error(line, item["loc"], item["msg"]) for item in exc.errors())
+                continue
+            if record.fund_id is None and not record.symbol:
+                errors.append(_error(line, (), "fund_id or symbol is required"))
+                continue
+            yield line, record
+    except (UnicodeDecodeError, ValueError, csv.Error) as exc:
+        raise AppError(f"Unreadable NAV file: {exc}", status_code=status.HTTP_400_BAD_REQUEST) from exc
+
+
+def _chunks(values: list[int]) -> Iterator[list[int]]:
+    for start in range(0, len(values), _CHUNK_SIZE):
+        yield values[start:start + _CHUNK_SIZE]
+
+
+def _write_history(db: Session, navs: dict[tuple[int, date], Decimal]) -> None:
+    fund_ids_by_date: dict[date, list[int]] = defaultdict(list)
+    for fund_id, nav_date in navs:
+        fund_ids_by_date[nav_date].append(fund_id)
+    for nav_date, fund_ids in fund_ids_by_date.items():
+        for chunk in _chunks(fund_ids):
+            db.execute(delete(MutualFundNav).where(MutualFundNav.nav_date == nav_date, MutualFundNav.fund_id.in_(chunk)))
+    db.execute(
+        insert(MutualFundNav.__table__),
+        [{"fund_id": fund_id, "nav_date": nav_date, "nav": nav} for (fund_id, nav_date), nav in navs.items()],
+    )
+
+
+def import_nav_file(db: Session, stream: BinaryIO, file_format: str, max_rows: int) -> dict[str, Any]:
+    """Validate and write a NAV upload in chunks of ``_CHUNK_SIZE`` records.
+
+    Records are streamed from the file; only the (fund, date) keys seen so far and each fund's
+    newest NAV stay in memory. History is written as chunks validate, inside the caller's
+    transaction: an invalid row anywhere raises once the whole file has been read, and the
+    caller's rollback discards what was written.
+    """
+    fund_ids_by_symbol = dict(db.execute(select(MutualFund.symbol, MutualFund.id)).all())
+    known_ids = set(fund_ids_by_symbol.values())
+    # Read before anything is written, so the upload's own rows do not count as already known.
+    latest_known = dict(db.execute(select(MutualFundNav.fund_id, func.max(MutualFundNav.nav_date)).group_by(MutualFundNav.fund_id)).all())
+    default_date = today()
+
+    parse_errors: list[dict[str, Any]] = []
+    errors: list[dict[str, Any]] = []
+    seen: set[tuple[int, date]] = set()
+    newest: dict[int, tuple[date, Decimal]] = {}
+    records = _parse_records(stream, file_format, max_rows, parse_errors)
+    while chunk := list(islice(records, _CHUNK_SIZE)):
+        navs: dict[tuple[int, date], Decimal] = {}
+        for line, record in chunk:
+            fund_id = record.fund_id if record.fund_id is not None else fund_ids_by_symbol.get(record.symbol.upper())
+            if fund_id is None or fund_id not in known_ids:
+                errors.append(_error(line, (), "Unknown fund"))
+                continue
+            key = (fund_id, record.nav_date or default_date)
+            if key in seen:
+                errors.append(_error(line, (), "Duplicate NAV for fund and date"))
+                continue
+            seen.add(key)
+            navs[key] = record.nav
+            if fund_id not in newest or key[1] > newest[fund_id][0]:
+                newest[fund_id] = (key[1], record.nav)
+        # Once the upload is known to fail, the rest of the file is only validated.
+        if navs and not parse_errors and not errors:
+            _write_history(db, navs)
+
+    if parse_errors or errors:
+        raise RequestValidationError((parse_errors or errors)[:MAX_REPORTED_ERRORS])
+    if not seen:
+        raise AppError("NAV file has no records", status_code=status.HTTP_400_BAD_REQUEST)
+
+    # A backfilled older date goes to history only; the fund's current NAV follows its latest date.
+    current = {
+        fund_id: nav for fund_id, (nav_date, nav) in newest.items() if nav_date >= latest_known.get(fund_id, nav_date)
+    }
+    if current:
+        funds = MutualFund.__table__
+        db.execute(
+            update(funds)
+            .where(funds.c.id == bindparam("fund_id"))
+            .values(nav=bindparam("new_nav"), nav_version=funds.c.nav_version + 1, updated_at=func.now()),
+            [{"fund_id": fund_id, "new_nav": nav} for fund_id, nav in current.items()],
+        )
+
+    return {
+        "records": len(seen),
+        "funds_updated": len(current),
+        "nav_dates": sorted({nav_date.isoformat() for _, nav_date in seen}),
+    }
+
+
+def record_nav(db: Session, fund_id: int, nav: Decimal, nav_date: date | None = None) -> None:
+    _write_history(db, {(fund_id, nav_date or today()): nav})
+
+
+def nav_history(db: Session, fund_id: int, date_from: date | None, date_to: date | None) -> list[MutualFundNav]:
+    stmt = select(MutualFundNav).where(MutualFundNav.fund_id == fund_id)
+    if date_from:
+        stmt = stmt.where(MutualFundNav.nav_date >= date_from)
+    if date_to:
+        stmt = stmt.where(MutualFundNav.nav_date <= date_to)
+    return list(db.execute(stmt.order_by(MutualFundNav.nav_date.desc())).scalars().all())
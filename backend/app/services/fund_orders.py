@@ -0,0 +1,140 @@
+import logging
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any
+from uuid import uuid4
+
+from fastapi import status
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.exceptions import AppError
+from app.models import Account, FundOrderStatus, FundTradeType, MutualFundOrder, User
+from app.services.audit import log_action
+from app.services.events import record_fund_order_event
+from app.services.fund_catalogue import fund_catalogue
+from app.services.fund_ledger import LedgerRequest, settle
+from app.services.unit_of_work import run_in_transaction
+
+logger = logging.getLogger(__name__)
+
+
+def place_order(
+    db: Session,
+    current_user: User,
+    account_id: int,
+    fund_id: int,
+    order_type: FundTradeType,
+    amount: Decimal | None = None,
+    units: Decimal | None = None,
+) -> MutualFundOrder:
+    account = db.get(Account, account_id)
+    if not account or account.is_deleted or not account.is_active:
+        raise AppError("Account not found", status_code=status.HTTP_404_NOT_FOUND)
+    if not current_user.is_admin and account.user_id != current_user.id:
+        raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
+
+    fund = fund_catalogue.fund(db, fund_id)
+    if not fund or (order_type == FundTradeType.BUY and not fund.is_active):
+        raise AppError("Mutual fund not found", status_code=status.HTTP_404_NOT_FOUND)
+
+    order = MutualFundOrder(
+        user_id=account.user_id,
+        account_id=account.id,
+        fund_id=fund.id,
+        order_type=order_type,
+        amount=Decimal(amount).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP) if amount is not None else None,
+        units=Decimal(units).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP) if units is not None else None,
+        status=FundOrderStatus.PENDING,
+    )
+    db.add(order)
+    db.flush()
+    record_fund_order_event(db, order)
+    log_action(
+        db,
+        f"order_{order_type.value}",
+        "mutual_fund",
+        fund.id,
+        current_user.id,
+        {"order_id": order.id, "account_id": account.id, "amount": str(order.amount), "units": str(order.units)},
+    )
+    return order
+
+
+def _execute_chunk(db: Session, account_ids: list[int], batch_id: str, actor_id: int | None) -> tuple[int, int]:
+    orders = list(
+        db.execute(
+            select(MutualFundOrder)
+            .where(MutualFundOrder.status == FundOrderStatus.PENDING, MutualFundOrder.account_id.in_(account_ids))
+            .order_by(MutualFundOrder.id)
+            .with_for_update()
+        ).scalars()
+    )
+    if not orders:
+        return 0, 0
+
+    results = settle(
+        db,
+        [
+            LedgerRequest(order.id, order.account_id, order.fund_id, order.order_type, amount=order.amount, units=order.units)
+            for order in orders
+        ],
+        net=True,
+    )
+
+    executed = 0
+    for order in orders:
+        result = results[order.id]
+        order.batch_id = batch_id
+        if result.executed:
+            executed += 1
+            order.status = FundOrderStatus.EXECUTED
+            order.trade_id = result.trade.id if result.trade is not None else None
+            order.executed_nav = result.nav
+            order.executed_units = result.units
+            order.executed_amount = result.amount
+        else:
+            order.status = FundOrderStatus.REJECTED
+            order.failure_reason = result.reason
+        record_fund_order_event(db, order)
+
+    log_action(
+        db,
+        "execute_orders",
+        "mutual_fund",
+        None,
+        actor_id,
+        {"batch_id": batch_id, "orders": len(orders), "executed": executed, "rejected": len(orders) - executed},
+    )
+    return executed, len(orders) - executed
+
+
+def execute_pending_orders(actor_id: int | None = None, chunk_size: int | None = None) -> dict[str, Any]:
+    """Run one NAV cut-off: every pending order is settled at the fund's current NAV.
+
+    Orders are processed in chunks of accounts, one transaction per chunk, so an interrupted
+    run leaves the remaining orders pending for the next cut-off.
+    """
+    chunk_size = chunk_size or settings.fund_order_chunk_size
+    batch_id = uuid4().hex
+    with SessionLocal() as db:
+        account_ids = list(
+            db.execute(
+                select(MutualFundOrder.account_id)
+                .where(MutualFundOrder.status == FundOrderStatus.PENDING)
+                .distinct()
+                .order_by(MutualFundOrder.account_id)
+            ).scalars()
+        )
+
+    summary = {"batch_id": batch_id, "accounts": len(account_ids), "executed": 0, "rejected": 0}
+    for start in range(0, len(account_ids), chunk_size):
+        chunk = account_ids[start:start + chunk_size]
+        with SessionLocal() as db:
+            executed, rejected = run_in_transaction(db, lambda: _execute_chunk(db, chunk, batch_id, actor_id), "fund_order_batch")
+        summary["executed"] += executed
+        summary["rejected"] += rejected
+
+    logger.info("Fund order cut-off %s: %s executed, %s rejected", batch_id, summary["executed"], summary["rejected"])
+    return summary
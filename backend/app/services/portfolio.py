@@ -0,0 +1,156 @@
+from collections import defaultdict
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.models import MutualFund, MutualFundHolding
+
+_CENTS = Decimal("0.01")
+_UNITS = Decimal("0.0001")
+
+
+def _money(value: Decimal) -> Decimal:
+    return value.quantize(_CENTS, rounding=ROUND_HALF_UP)
+
+
+def _ratio(part: Decimal, total: Decimal) -> Decimal:
+    if not total:
+        return Decimal("0.0000")
+    return (part / total).quantize(_UNITS, rounding=ROUND_HALF_UP)
+
+
+def _valuation(market_value: Decimal, cost: Decimal, total_value: Decimal) -> dict[str, Decimal]:
+    market_value, cost = _money(market_value), _money(cost)
+    return {
+        "market_value": market_value,
+        "cost": cost,
+        "unrealized_pnl": market_value - cost,
+        "unrealized_pnl_pct": _ratio(market_value - cost, cost),
+        "allocation": _ratio(market_value, total_value),
+    }
+
+
+def user_portfolio(db: Session, user_id: int) -> dict[str, Any]:
+    rows = db.execute(
+        select(
+            MutualFundHolding.account_id,
+            MutualFundHolding.fund_id,
+            MutualFund.symbol,
+            MutualFundHolding.units,
+            MutualFundHolding.average_nav,
+            MutualFund.nav,
+        )
+        .join(MutualFund, MutualFund.id == MutualFundHolding.fund_id)
+        .where(MutualFundHolding.user_id == user_id, MutualFundHolding.units > 0)
+        .order_by(MutualFundHolding.account_id, MutualFundHolding.fund_id)
+    ).all()
+
+    positions = []
+    by_account: dict[int, list[Decimal]] = defaultdict(lambda: [Decimal("0"), Decimal("0")])
+    by_fund: dict[int, list[Any]] = {}
+    total_value = total_cost = Decimal("0")
+    for row in rows:
+        market_value = row.units * row.nav
+        cost = row.units * row.average_nav
+        positions.append((row, market_value, cost))
+        total_value += market_value
+        total_cost += cost
+        by_account[row.account_id][0] += market_value
+        by_account[row.account_id][1] += cost
+        fund = by_fund.setdefault(row.fund_id, [row.symbol, Decimal("0"), Decimal("0"), Decimal("0")])
+        fund[1] += row.units
+        fund[2] += market_value
+        fund[3] += cost
+
+    return {
+        "user_id": user_id,
+        "totals": _valuation(total_value, total_cost, total_value),
+        "positions": [
+            {
+                "account_id": row.account_id,
+                "fund_id": row.fund_id,
+                "symbol": row.symbol,
+                "units": row.units,
+                "nav": row.nav,
+                "average_nav": row.average_nav,
+                **_valuation(market_value, cost, total_value),
+            }
+            for row, market_value, cost in positions
+        ],
+        "by_account": [
+            {"account_id": account_id, **_valuation(value, cost, total_value)}
+            for account_id, (value, cost) in by_account.items()
+        ],
+        "by_fund": [
+            {"fund_id": fund_id, "symbol": symbol, "units": units, **_valuation(value, cost, total_value)}
+            for fund_id, (symbol, units, value, cost) in by_fund.items()
+        ],
+    }
+
+
+def firm_summary(db: Session) -> dict[str, Any]:
+    # Grouping by fund needs only the covering (fund_id, units, average_nav) index; the market
+    # value is then one multiplication per fund instead of one per holding.
+    totals = (
+        select(
+            MutualFundHolding.fund_id,
+            func.count().label("positions"),
+            func.sum(MutualFundHolding.units).label("units"),
+            func.sum(MutualFundHolding.units * MutualFundHolding.average_nav).label("cost"),
+        )
+        .where(MutualFundHolding.units > 0)
+        .group_by(MutualFundHolding.fund_id)
+        .subquery()
+    )
+    rows = db.execute(
+        select(MutualFund.id, MutualFund.symbol, MutualFund.nav, totals.c.positions, totals.c.units, totals.c.cost)
+        .join(totals, totals.c.fund_id == MutualFund.id)
+        .order_by(MutualFund.id)
+    ).all()
+
+    funds = []
+    for row in rows:
+        units = Decimal(str(row.units)).quantize(_UNITS)
+        funds.append((row, units, units * row.nav, Decimal(str(row.cost))))
+    total_value = sum((value for _, _, value, _ in funds), Decimal("0"))
+    total_cost = sum((cost for _, _, _, cost in funds), Decimal("0"))
+
+    return {
+        "positions": sum(row.positions for row, *_ in funds),
+        "totals": _valuation(total_value, total_cost, total_value),
+        "by_fund": [
+            {
+                "fund_id": row.id,
+                "symbol": row.symbol,
+                "nav": row.nav,
+                "positions": row.positions,
+                "units": units,
+                **_valuation(value, cost, total_value),
+            }
+            for row, units, value, cost in funds
+        ],
+    }
+
+
+def value_holdings(holdings: list[MutualFundHolding]) -> dict[str, Any]:
+    """Value already-loaded holdings (with ``fund`` loaded) at the current NAV."""
+    positions = [(holding, holding.units * holding.fund.nav, holding.units * holding.average_nav) for holding in holdings]
+    total_value = sum((value for _, value, _ in positions), Decimal("0"))
+    total_cost = sum((cost for _, _, cost in positions), Decimal("0"))
+    return {
+        "totals": _valuation(total_value, total_cost, total_value),
+        "positions": [
+            {
+                "holding_id": holding.id,
+                "fund_id": holding.fund_id,
+                "symbol": holding.fund.symbol,
+                "units": holding.units,
+                "nav": holding.fund.nav,
+                "average_nav": holding.average_nav,
+                **_valuation(value, cost, total_value),
+            }
+            for holding, value, cost in positions
+        ],
+    }
@@ -0,0 +1,46 @@
+import csv
+import io
+import json
+from collections.abc import Iterator
+from typing import Any, BinaryIO
+
+
+def _iter_csv(stream: BinaryIO) -> Iterator[tuple[int, Any]]:
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    try:
+        reader = csv.DictReader(text_stream)
+        for row in reader:
+            yield reader.line_num, {key: value for key, value in row.items() if key and value not in (None, "")}
+    finally:
+        text_stream.detach()
+
+
+def _iter_ndjson(stream: BinaryIO) -> Iterator[tuple[int, Any]]:
+    for line_number, line in enumerate(stream, start=1):
+        if line.strip():
+            yield line_number, json.loads(line)
+
+
+def _iter_json(stream: BinaryIO) -> Iterator[tuple[int, Any]]:
+    document = json.load(stream)
+    items = document.get("items", []) if isinstance(document, dict) else document
+    if not isinstance(items, list):
+        raise ValueError("Expected a JSON array of records")
+    yield from enumerate(items, start=1)
+
+
+_READERS = {"csv": _iter_csv, "json": _iter_json, "ndjson": _iter_ndjson}
+
+
+def iter_records(stream: BinaryIO, file_format: str) -> Iterator[tuple[int, Any]]:
+    """Yield ``(line or position, raw record)`` pairs from a CSV, JSON or NDJSON upload."""
+    return _READERS[file_format](stream)
+
+
+def detect_format(filename: str | None, content_type: str | None) -> str:
+    suffix = (filename or "").rsplit(".", 1)[-1].lower()
+    if suffix in ("ndjson", "jsonl") or content_type == "application/x-ndjson":
+        return "ndjson"
+    if suffix == "json" or content_type == "application/json":
+        return "json"
+    return "csv"
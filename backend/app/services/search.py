@@ -0,0 +1,292 @@
+import json
+import logging
+import re
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from time import monotonic
+from typing import Any
+
+from sqlalchemy import Engine, column, delete, event, func, insert, inspect, literal_column, select, table, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import AuditLog, SearchIndexCheckpoint, SearchToken, Transaction
+
+logger = logging.getLogger(__name__)
+
+AUDIT_LOG = "audit_log"
+TRANSACTION = "transaction"
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+_MAX_TOKEN_LENGTH = 64
+
+_MODELS = {AUDIT_LOG: AuditLog, TRANSACTION: Transaction}
+_FTS_COLUMNS = {
+    AUDIT_LOG: ("audit_logs_fts", ("action", "entity", "details")),
+    TRANSACTION: ("transactions_fts", ("description", "reference", "external_bank_name")),
+}
+
+
+def tokenize(value: str) -> list[str]:
+    return [token[:_MAX_TOKEN_LENGTH] for token in _TOKEN_PATTERN.findall(value.lower())]
+
+
+def _document(source: str, row: Any) -> str:
+    if source == AUDIT_LOG:
+        return f"{row.action} {row.entity} {json.dumps(row.details or {})}"
+    return f"{row.description} {row.reference} {row.external_bank_name or ''}"
+
+
+def _token_rows(source: str, row: Any) -> list[dict[str, Any]]:
+    counts = Counter(tokenize(_document(source, row)))
+    return [{"source": source, "source_id": row.id, "token": token, "hits": hits} for token, hits in counts.items()]
+
+
+def _fts5_available(engine: Engine) -> bool:
+    with engine.connect() as conn:
+        options = {row[0] for row in conn.execute(text("PRAGMA compile_options"))}
+    return "ENABLE_FTS5" in options
+
+
+def _create_fts_table(conn, source: str) -> None:
+    fts, columns = _FTS_COLUMNS[source]
+    base = _MODELS[source].__tablename__
+    names = ", ".join(columns)
+    new_values = ", ".join(f"new.{name}" for name in columns)
+    old_values = ", ".join(f"old.{name}" for name in columns)
+    remove = f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old_values});"
+    add = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values});"
+
+    exists = conn.execute(text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": fts}).first()
+    conn.execute(text(f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({names}, content='{base}', content_rowid='id')"))
+    conn.execute(text(f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {base} BEGIN {add} END"))
+    conn.execute(text(f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {base} BEGIN {remove} END"))
+    conn.execute(text(f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE ON {base} BEGIN {remove} {add} END"))
+    if not exists:
+        conn.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+        logger.info("Built full-text index %s", fts)
+
+
+class SearchIndex:
+    """Full-text search over audit log details and transaction descriptions.
+
+    On SQLite with FTS5 the index is a set of external-content FTS5 tables kept in sync by
+    triggers. Elsewhere rows are tokenized into ``search_tokens`` by an incremental indexer
+    that follows the id checkpoint in ``search_index_checkpoints``; it runs at startup and on
+    the ``search_index`` schedule, so new rows become searchable within one interval.
+    """
+
+    # Ids are allocated before commit, so on PostgreSQL/MySQL a lower id can become visible
+    # after a higher one. Ids a batch skipped over are kept as gaps and re-read on every run
+    # until they show up or are older than ``search_index_gap_timeout_seconds``.
+    max_gaps = 10_000
+
+    def __init__(self, backend: str | None = None, batch_size: int = 1000):
+        self.backend = backend
+        self.batch_size = batch_size
+        self._gaps: dict[str, dict[int, float]] = {source: {} for source in _MODELS}
+        self._seeded = False
+
+    def setup(self, engine: Engine) -> None:
+        requested = settings.search_backend
+        if requested != "tokens" and engine.dialect.name == "sqlite" and _fts5_available(engine):
+            with engine.begin() as conn:
+                for source in _FTS_COLUMNS:
+                    _create_fts_table(conn, source)
+            self.backend = "fts5"
+            return
+
+        if requested == "fts5":
+            logger.warning("FTS5 is not available for %s; using the token index", engine.dialect.name)
+        self.backend = "tokens"
+        self.sync(engine)
+
+    def search(self, db: Session, source: str, query: str, filters=(), offset: int = 0, limit: int = 20) -> list[tuple[Any, float]]:
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+        model = _MODELS[source]
+
+        if self.backend == "fts5":
+            fts = _FTS_COLUMNS[source][0]
+            fts_table = table(fts, column("rowid"))
+            rank = func.bm25(literal_column(fts))
+            match = " ".join(f'"{token}"' for token in tokens)
+            stmt = (
+                select(model, (-rank).label("score"))
+                .join(fts_table, fts_table.c.rowid == model.id)
+                .where(literal_column(fts).op("MATCH")(match))
+                .order_by(rank, model.id.desc())
+            )
+        else:
+            # New rows are picked up by the background sync job, never on the request path.
+            matches = (
+                select(SearchToken.source_id, func.sum(SearchToken.hits).label("score"))
+                .where(SearchToken.source == source, SearchToken.token.in_(tokens))
+                .group_by(SearchToken.source_id)
+                .having(func.count() == len(tokens))
+                .subquery()
+            )
+            stmt = select(model, matches.c.score).join(matches, matches.c.source_id == model.id).order_by(matches.c.score.desc(), model.id.desc())
+
+        rows = db.execute(stmt.where(*filters).offset(offset).limit(limit)).all()
+        return [(row[0], float(row[1])) for row in rows]
+
+    def sync(self, engine: Engine, max_batches: int | None = None) -> int:
+        if self.backend != "tokens":
+            return 0
+        if not self._seeded:
+            self._seeded = True
+            for source in _MODELS:
+                self._seed_gaps(engine, source)
+        indexed = 0
+        for source in _MODELS:
+            indexed += self._index_gaps(engine, source)
+            batches = 0
+            while max_batches is None or batches < max_batches:
+                count, done = self._index_batch(engine, source)
+                indexed += count
+                batches += 1
+                if done:
+                    break
+        return indexed
+
+    def _add_gaps(self, source: str, ids: Iterable[int], seen_at: float) -> None:
+        gaps = self._gaps[source]
+        for source_id in ids:
+            gaps[source_id] = seen_at
+        if len(gaps) > self.max_gaps:
+            logger.warning("Tracking more than %s %s id gaps; dropping the oldest", self.max_gaps, source)
+            for source_id in sorted(gaps)[: len(gaps) - self.max_gaps]:
+                del gaps[source_id]
+
+    def _seed_gaps(self, engine: Engine, source: str) -> None:
+        # Unindexed ids just below the checkpoint may belong to transactions that were still in
+        # flight when an earlier process advanced it.
+        model = _MODELS[source]
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.search_index_gap_timeout_seconds)
+        with engine.connect() as conn:
+            checkpoint = conn.execute(
+                select(SearchIndexCheckpoint.last_id).where(SearchIndexCheckpoint.source == source)
+            ).scalar_one_or_none()
+            if not checkpoint:
+                return
+            first = conn.execute(select(func.min(model.id)).where(model.created_at >= cutoff, model.id <= checkpoint)).scalar_one()
+            if first is None:
+                return
+            indexed_ids = set(
+                conn.execute(
+                    select(SearchToken.source_id.distinct()).where(
+                        SearchToken.source == source, SearchToken.source_id.between(first, checkpoint)
+                    )
+                ).scalars()
+            )
+        self._add_gaps(source, (source_id for source_id in range(first, checkpoint + 1) if source_id not in indexed_ids), monotonic())
+
+    def _index_gaps(self, engine: Engine, source: str) -> int:
+        gaps = self._gaps[source]
+        expired_before = monotonic() - settings.search_index_gap_timeout_seconds
+        for source_id in [source_id for source_id, seen_at in gaps.items() if seen_at < expired_before]:
+            del gaps[source_id]
+        if not gaps:
+            return 0
+
+        model = _MODELS[source]
+        ids = sorted(gaps)
+        rows = []
+        indexed_ids: set[int] = set()
+        with engine.connect() as conn:
+            for start in range(0, len(ids), self.batch_size):
+                chunk = ids[start : start + self.batch_size]
+                rows.extend(conn.execute(select(model.__table__).where(model.id.in_(chunk))).all())
+                indexed_ids.update(
+                    conn.execute(
+                        select(SearchToken.source_id.distinct()).where(SearchToken.source == source, SearchToken.source_id.in_(chunk))
+                    ).scalars()
+                )
+        if not rows:
+            return 0
+
+        token_rows = [token for row in rows if row.id not in indexed_ids for token in _token_rows(source, row)]
+        if token_rows:
+            try:
+                with engine.begin() as conn:
+                    conn.execute(insert(SearchToken), token_rows)
+            except IntegrityError:
+                logger.info("Search index gaps for %s were written concurrently; rechecking next run", source)
+                return 0
+        for row in rows:
+            gaps.pop(row.id, None)
+        return len({token["source_id"] for token in token_rows})
+
+    def _index_batch(self, engine: Engine, source: str) -> tuple[int, bool]:
+        model = _MODELS[source]
+        with engine.connect() as conn:
+            checkpoint = conn.execute(
+                select(SearchIndexCheckpoint.last_id).where(SearchIndexCheckpoint.source == source)
+            ).scalar_one_or_none()
+            start = checkpoint or 0
+            rows = conn.execute(select(model.__table__).where(model.id > start).order_by(model.id).limit(self.batch_size)).all()
+            if not rows:
+                return 0, True
+            indexed_ids = set(
+                conn.execute(
+                    select(SearchToken.source_id.distinct()).where(
+                        SearchToken.source == source, SearchToken.source_id.between(rows[0].id, rows[-1].id)
+                    )
+                ).scalars()
+            )
+
+        token_rows = [token for row in rows if row.id not in indexed_ids for token in _token_rows(source, row)]
+        last_id = max(rows[-1].id, checkpoint or 0)
+        try:
+            with engine.begin() as conn:
+                if token_rows:
+                    conn.execute(insert(SearchToken), token_rows)
+                if checkpoint is None:
+                    conn.execute(insert(SearchIndexCheckpoint).values(source=source, last_id=last_id))
+                else:
+                    conn.execute(
+                        update(SearchIndexCheckpoint)
+                        .where(SearchIndexCheckpoint.source == source, SearchIndexCheckpoint.last_id == checkpoint)
+                        .values(last_id=last_id)
+                    )
+        except IntegrityError:
+            logger.info("Search index batch for %s was written concurrently; skipping", source)
+            return 0, True
+
+        # Nothing is known below the first row of the very first batch, so only later skips are gaps.
+        row_ids = {row.id for row in rows}
+        lower = start + 1 if checkpoint else rows[0].id
+        self._add_gaps(source, (source_id for source_id in range(lower, rows[-1].id) if source_id not in row_ids), monotonic())
+        new_rows = len({token["source_id"] for token in token_rows})
+        return new_rows, len(rows) < self.batch_size or last_id == checkpoint
+
+
+search_index = SearchIndex(batch_size=settings.search_index_batch_size)
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _reindex_changed_transactions(session: Session, _) -> None:
+    # The FTS5 triggers cover updates and deletes; the token index needs them applied here.
+    if search_index.backend != "tokens":
+        return
+    changed = [
+        obj
+        for obj in session.dirty
+        if isinstance(obj, Transaction)
+        and any(inspect(obj).attrs[name].history.has_changes() for name in _FTS_COLUMNS[TRANSACTION][1])
+    ]
+    deleted = [obj.id for obj in session.deleted if isinstance(obj, Transaction)]
+    ids = [obj.id for obj in changed] + deleted
+    if not ids:
+        return
+
+    conn = session.connection()
+    conn.execute(delete(SearchToken).where(SearchToken.source == TRANSACTION, SearchToken.source_id.in_(ids)))
+    token_rows = [token for obj in changed for token in _token_rows(TRANSACTION, obj)]
+    if token_rows:
+        conn.execute(insert(SearchToken), token_rows)
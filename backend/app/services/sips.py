@@ -0,0 +1,182 @@
+import calendar
+import logging
+from datetime import date, timedelta
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any
+from uuid import uuid4
+
+from fastapi import status
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.exceptions import AppError
+from app.models import (
+    Account,
+    FundTradeType,
+    SipExecution,
+    SipExecutionStatus,
+    SipFrequency,
+    SipInstruction,
+    SipStatus,
+    User,
+)
+from app.services.audit import log_action
+from app.services.fund_catalogue import fund_catalogue
+from app.services.fund_ledger import LedgerRequest, settle
+from app.services.fund_navs import today
+from app.services.unit_of_work import run_in_transaction
+
+logger = logging.getLogger(__name__)
+
+
+def next_run_after(instruction: SipInstruction, after: date) -> date:
+    """First scheduled date strictly after ``after``. Monthly plans keep the start date's day,
+    clamped to the length of shorter months."""
+    current = instruction.next_run_date
+    while current <= after:
+        if instruction.frequency == SipFrequency.WEEKLY:
+            current += timedelta(days=7)
+            continue
+        year, month = (current.year + 1, 1) if current.month == 12 else (current.year, current.month + 1)
+        day = min(instruction.start_date.day, calendar.monthrange(year, month)[1])
+        current = date(year, month, day)
+    return current
+
+
+def create_sip(
+    db: Session,
+    current_user: User,
+    account_id: int,
+    fund_id: int,
+    amount: Decimal,
+    frequency: SipFrequency,
+    start_date: date | None = None,
+) -> SipInstruction:
+    account = db.get(Account, account_id)
+    if not account or account.is_deleted or not account.is_active:
+        raise AppError("Account not found", status_code=status.HTTP_404_NOT_FOUND)
+    if not current_user.is_admin and account.user_id != current_user.id:
+        raise AppError("Insufficient permissions", status_code=status.HTTP_403_FORBIDDEN)
+
+    fund = fund_catalogue.fund(db, fund_id)
+    if not fund or not fund.is_active:
+        raise AppError("Mutual fund not found", status_code=status.HTTP_404_NOT_FOUND)
+
+    start_date = start_date or today()
+    if start_date < today():
+        raise AppError("SIP start date cannot be in the past", status_code=status.HTTP_400_BAD_REQUEST)
+
+    instruction = SipInstruction(
+        user_id=account.user_id,
+        account_id=account.id,
+        fund_id=fund.id,
+        amount=Decimal(amount).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP),
+        frequency=frequency,
+        start_date=start_date,
+        next_run_date=start_date,
+        status=SipStatus.ACTIVE,
+    )
+    db.add(instruction)
+    db.flush()
+    log_action(
+        db,
+        "create_sip",
+        "mutual_fund",
+        fund.id,
+        current_user.id,
+        {"sip_id": instruction.id, "account_id": account.id, "amount": str(instruction.amount), "frequency": frequency.value},
+    )
+    return instruction
+
+
+def _execute_chunk(db: Session, run_date: date, after_id: int, limit: int, batch_id: str, actor_id: int | None):
+    # Locked rows are re-checked against next_run_date, so a concurrent or restarted run skips
+    # instructions another run has already advanced.
+    instructions = list(
+        db.execute(
+            select(SipInstruction)
+            .where(
+                SipInstruction.status == SipStatus.ACTIVE,
+                SipInstruction.next_run_date <= run_date,
+                SipInstruction.id > after_id,
+            )
+            .order_by(SipInstruction.id)
+            .limit(limit)
+            .with_for_update()
+        ).scalars()
+    )
+    if not instructions:
+        return None, 0, 0
+
+    results = settle(
+        db,
+        [
+            LedgerRequest(instruction.id, instruction.account_id, instruction.fund_id, FundTradeType.BUY, amount=instruction.amount)
+            for instruction in instructions
+        ],
+    )
+
+    executions = []
+    executed = 0
+    for instruction in instructions:
+        result = results[instruction.id]
+        execution = SipExecution(
+            instruction_id=instruction.id,
+            run_date=instruction.next_run_date,
+            batch_id=batch_id,
+            amount=instruction.amount,
+        )
+        if result.executed:
+            executed += 1
+            execution.status = SipExecutionStatus.EXECUTED
+            execution.trade_id = result.trade.id
+            execution.units = result.units
+            execution.nav = result.nav
+        else:
+            execution.status = SipExecutionStatus.FAILED
+            execution.failure_reason = result.reason
+        executions.append(execution)
+        instruction.last_run_date = instruction.next_run_date
+        instruction.next_run_date = next_run_after(instruction, run_date)
+    db.add_all(executions)
+
+    log_action(
+        db,
+        "execute_sips",
+        "mutual_fund",
+        None,
+        actor_id,
+        {"batch_id": batch_id, "instructions": len(instructions), "executed": executed, "failed": len(instructions) - executed},
+    )
+    return instructions[-1].id, executed, len(instructions) - executed
+
+
+def run_due_sips(run_date: date | None = None, actor_id: int | None = None, chunk_size: int | None = None) -> dict[str, Any]:
+    """Execute every active instruction due on or before ``run_date``.
+
+    Each chunk settles its purchases, records one execution row per instruction and advances
+    ``next_run_date`` in a single transaction. A run that stops part-way leaves the rest due,
+    and the next run picks them up without repeating committed chunks. Missed periods are not
+    back-filled: a late instruction runs once and moves to its next date after ``run_date``.
+    """
+    run_date = run_date or today()
+    chunk_size = chunk_size or settings.sip_chunk_size
+    batch_id = uuid4().hex
+    summary = {"batch_id": batch_id, "run_date": run_date.isoformat(), "executed": 0, "failed": 0}
+
+    after_id = 0
+    while True:
+        with SessionLocal() as db:
+            last_id, executed, failed = run_in_transaction(
+                db, lambda: _execute_chunk(db, run_date, after_id, chunk_size, batch_id, actor_id), "sip_batch"
+            )
+        if last_id is None:
+            break
+        after_id = last_id
+        summary["executed"] += executed
+        summary["failed"] += failed
+
+    logger.info("SIP run %s for %s: %s executed, %s failed", batch_id, run_date, summary["executed"], summary["failed"])
+    return summary
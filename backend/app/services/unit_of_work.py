@@ -0,0 +1,123 @@
+import logging
+import random
+import time
+from collections.abc import Callable, Iterable
+from typing import TypeVar
+
+from fastapi import status
+from sqlalchemy import select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+from app.core.config import settings
+from app.core.exceptions import AppError
+from app.core.metrics import DB_TRANSACTION_RETRIES, DB_TRANSACTION_RETRY_EXHAUSTED
+from app.models import Account
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEADLOCK = "deadlock"
+SERIALIZATION = "serialization"
+BUSY = "busy"
+
+_SQLSTATE_REASONS = {
+    "40P01": DEADLOCK,
+    "40001": SERIALIZATION,
+    "55P03": BUSY,
+}
+
+_MYSQL_ERRNO_REASONS = {
+    1213: DEADLOCK,
+    1205: BUSY,
+}
+
+_MESSAGE_REASONS = (
+    ("database is locked", BUSY),
+    ("database table is locked", BUSY),
+    ("database is busy", BUSY),
+    ("deadlock", DEADLOCK),
+    ("could not serialize access", SERIALIZATION),
+)
+
+
+def classify_db_error(exc: BaseException) -> str | None:
+    if isinstance(exc, StaleDataError):
+        return SERIALIZATION
+    if not isinstance(exc, DBAPIError):
+        return None
+
+    orig = exc.orig
+    sqlstate = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    if sqlstate in _SQLSTATE_REASONS:
+        return _SQLSTATE_REASONS[sqlstate]
+
+    args = getattr(orig, "args", ())
+    if args and isinstance(args[0], int) and args[0] in _MYSQL_ERRNO_REASONS:
+        return _MYSQL_ERRNO_REASONS[args[0]]
+
+    message = str(orig).lower()
+    for needle, reason in _MESSAGE_REASONS:
+        if needle in message:
+            return reason
+    return None
+
+
+def _backoff_delay(attempt: int) -> float:
+    ceiling = min(settings.db_retry_max_delay_ms, settings.db_retry_base_delay_ms * (2 ** (attempt - 1)))
+    return random.uniform(0, ceiling) / 1000
+
+
+def _begin_write_transaction(db: Session) -> None:
+    # SQLite takes the write lock lazily on the first UPDATE, so two writers that both
+    # read first can deadlock on the lock upgrade. BEGIN IMMEDIATE queues them instead.
+    if db.get_bind().dialect.name != "sqlite":
+        return
+    dbapi_connection = db.connection().connection.dbapi_connection
+    if not dbapi_connection.in_transaction:
+        db.execute(text("BEGIN IMMEDIATE"))
+
+
+def lock_accounts(db: Session, account_ids: Iterable[int]) -> dict[int, Account]:
+    ids = sorted({account_id for account_id in account_ids if account_id is not None})
+    if not ids:
+        return {}
+
+    stmt = (
+        select(Account)
+        .where(Account.id.in_(ids))
+        .order_by(Account.id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    return {account.id: account for account in db.execute(stmt).scalars().all()}
+
+
+def run_in_transaction(db: Session, work: Callable[[], T], operation: str) -> T:
+    attempts = settings.db_retry_attempts
+    for attempt in range(1, attempts + 1):
+        try:
+            _begin_write_transaction(db)
+            result = work()
+            db.commit()
+            return result
+        except AppError:
+            db.rollback()
+            raise
+        except Exception as exc:
+            db.rollback()
+            reason = classify_db_error(exc)
+            if reason is None:
+                raise
+            if attempt == attempts:
+                DB_TRANSACTION_RETRY_EXHAUSTED.inc(operation=operation, reason=reason)
+                logger.warning("%s failed after %s attempts (%s): %s", operation, attempts, reason, exc)
+                raise AppError("Database is busy, please retry", status_code=status.HTTP_503_SERVICE_UNAVAILABLE) from exc
+
+            DB_TRANSACTION_RETRIES.inc(operation=operation, reason=reason)
+            logger.info("Retrying %s after %s (attempt %s/%s)", operation, reason, attempt, attempts)
+            time.sleep(_backoff_delay(attempt))
+
+    raise AssertionError("unreachable")
@@ -0,0 +1,182 @@
+import logging
+import shutil
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from fastapi import status
+from pydantic import ValidationError
+from sqlalchemy import and_, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.exceptions import AppError
+from app.core.security import hash_passwords
+from app.models import ImportJobStatus, ImportRowStatus, User, UserImportJob, UserImportResult
+from app.schemas import UserCreate
+from app.services.audit import log_action, log_actions
+from app.services.customer_search import search_columns
+from app.services.record_files import detect_format, iter_records
+from app.services.unit_of_work import run_in_transaction
+
+logger = logging.getLogger(__name__)
+
+REPORT_PAGE_SIZE = 1000
+
+
+def create_import_job(db: Session, upload: BinaryIO, filename: str | None, content_type: str | None, actor_id: int) -> UserImportJob:
+    file_format = detect_format(filename, content_type)
+    job = UserImportJob(created_by=actor_id, filename=filename or "", file_format=file_format, status=ImportJobStatus.PENDING)
+    db.add(job)
+    db.flush()
+
+    # The upload is kept on disk so a failed or interrupted run can be resumed from its checkpoint.
+    path = Path(settings.user_import_dir) / f"{job.id}.{file_format}"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as target:
+        shutil.copyfileobj(upload, target)
+    job.file_path = str(path)
+    log_action(db, "create", "user_import", job.id, actor_id, {"filename": job.filename})
+    db.commit()
+    return job
+
+
+def _stale_before() -> datetime:
+    return datetime.now(timezone.utc) - timedelta(minutes=settings.user_import_stale_minutes)
+
+
+def _claim(db: Session, job_id: int) -> bool:
+    stale_before = _stale_before()
+    claimed = db.execute(
+        update(UserImportJob)
+        .where(
+            UserImportJob.id == job_id,
+            or_(
+                UserImportJob.status.in_([ImportJobStatus.PENDING, ImportJobStatus.FAILED]),
+                and_(UserImportJob.status == ImportJobStatus.RUNNING, UserImportJob.updated_at < stale_before),
+            ),
+        )
+        .values(status=ImportJobStatus.RUNNING, error=None)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return bool(claimed.rowcount)
+
+
+def _result(line: int, email: str | None, row_status: ImportRowStatus, user_id: int | None = None, error: str | None = None) -> dict[str, Any]:
+    return {"line": line, "email": email, "status": row_status, "user_id": user_id, "error": error}
+
+
+def _import_chunk(db: Session, job: UserImportJob, rows: list[tuple[int, Any]]) -> None:
+    results: list[dict[str, Any]] = []
+    candidates: dict[str, tuple[int, UserCreate]] = {}
+    for line, raw in rows:
+        try:
+            payload = UserCreate.model_validate(raw)
+        except ValidationError as exc:
+            error = exc.errors()[0]
+            email = raw.get("email") if isinstance(raw, dict) else None
+            results.append(_result(line, email, ImportRowStatus.FAILED, error=f"{'.'.join(map(str, error['loc']))}: {error['msg']}"[:255]))
+            continue
+        if payload.email in candidates:
+            results.append(_result(line, payload.email, ImportRowStatus.SKIPPED, error="Duplicate email in file"))
+            continue
+        candidates[payload.email] = (line, payload)
+
+    existing = set(db.execute(select(User.email).where(User.email.in_(list(candidates)))).scalars()) if candidates else set()
+    for email in existing:
+        line, _ = candidates.pop(email)
+        results.append(_result(line, email, ImportRowStatus.SKIPPED, error="Email already exists"))
+
+    # Hashing dominates the run time, so it happens before the write transaction opens.
+    password_hashes = hash_passwords([payload.password for _, payload in candidates.values()])
+
+    def _write() -> None:
+        created: dict[str, int] = {}
+        if candidates:
+            db.execute(
+                insert(User),
+                [
+                    {
+                        "name": payload.name,
+                        "email": payload.email,
+                        "contact": payload.contact,
+                        "address": payload.address,
+                        "password_hash": password_hash,
+                        "is_admin": False,
+                        **search_columns(payload.name, payload.email, payload.contact),
+                    }
+                    for (_, payload), password_hash in zip(candidates.values(), password_hashes)
+                ],
+            )
+            created = dict(db.execute(select(User.email, User.id).where(User.email.in_(list(candidates)))).all())
+            log_actions(db, "import", "user", list(created.values()), job.created_by, {"job_id": job.id})
+
+        rows_out = results + [_result(line, email, ImportRowStatus.CREATED, user_id=created[email]) for email, (line, _) in candidates.items()]
+        db.execute(insert(UserImportResult), [{"job_id": job.id, **row} for row in rows_out])
+        job.processed_rows += len(rows)
+        job.created_count += len(candidates)
+        job.skipped_count += sum(1 for row in results if row["status"] == ImportRowStatus.SKIPPED)
+        job.failed_count += sum(1 for row in results if row["status"] == ImportRowStatus.FAILED)
+
+    run_in_transaction(db, _write, "user_import")
+
+
+def run_user_import(job_id: int, chunk_size: int | None = None) -> None:
+    """Import (or resume importing) a job's file in chunks.
+
+    Each chunk's users, per-row results and the job's ``processed_rows`` checkpoint commit
+    together, so a resumed run skips exactly the rows that were already imported.
+    """
+    chunk_size = chunk_size or settings.user_import_chunk_size
+    with SessionLocal() as db:
+        if not _claim(db, job_id):
+            logger.info("User import %s is already running or finished", job_id)
+            return
+        job = db.get(UserImportJob, job_id)
+        try:
+            with open(job.file_path, "rb") as stream:
+                records = islice(iter_records(stream, job.file_format), job.processed_rows, None)
+                while rows := list(islice(records, chunk_size)):
+                    _import_chunk(db, job, rows)
+            job.status = ImportJobStatus.COMPLETED
+            job.completed_at = datetime.now(timezone.utc)
+            db.commit()
+            logger.info("User import %s completed: %s rows", job_id, job.processed_rows)
+        except Exception as exc:
+            db.rollback()
+            logger.exception("User import %s failed after %s rows", job_id, job.processed_rows)
+            job.status = ImportJobStatus.FAILED
+            job.error = f"{type(exc).__name__}: {exc}"[:255]
+            db.commit()
+
+
+def resumable_job(db: Session, job_id: int) -> UserImportJob:
+    job = db.get(UserImportJob, job_id)
+    if not job:
+        raise AppError("Import job not found", status_code=status.HTTP_404_NOT_FOUND)
+    if job.status == ImportJobStatus.COMPLETED:
+        raise AppError("Import job already completed", status_code=status.HTTP_409_CONFLICT)
+    if job.status == ImportJobStatus.RUNNING:
+        updated_at = job.updated_at if job.updated_at.tzinfo else job.updated_at.replace(tzinfo=timezone.utc)
+        # A running job can only be taken over once its worker has stopped checkpointing.
+        if updated_at >= _stale_before():
+            raise AppError("Import job is still running", status_code=status.HTTP_409_CONFLICT)
+    return job
+
+
+def iter_report(job_id: int, row_status: ImportRowStatus | None = None) -> Iterator[UserImportResult]:
+    after_line = 0
+    while True:
+        with SessionLocal() as db:
+            stmt = select(UserImportResult).where(UserImportResult.job_id == job_id, UserImportResult.line > after_line)
+            if row_status is not None:
+                stmt = stmt.where(UserImportResult.status == row_status)
+            page = list(db.execute(stmt.order_by(UserImportResult.line).limit(REPORT_PAGE_SIZE)).scalars())
+        yield from page
+        if len(page) < REPORT_PAGE_SIZE:
+            return
+        after_line = page[-1].line
@@ -6,16 +6,26 @@ def generate_account_number() -> str:
     return f"{randbelow(10**12):012d}"
 
 
-def generate_card_number() -> str:
-    prefix = "521234"
-    suffix = f"{randbelow(10**9):09d}"
-    return f"{prefix}{suffix}"
+def luhn_check_digit(payload: str) -> str:
+    total = 0
+    for position, char in enumerate(reversed(payload)):
+        digit = int(char)
+        if position % 2 == 0:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        total += digit
+    return str((10 - total % 10) % 10)
 
 
 def generate_transaction_reference() -> str:
     return f"TXN{randbelow(10**12):012d}"
 
 
+def generate_authorization_reference() -> str:
+    return f"AUT{randbelow(10**12):012d}"
+
+
 def generate_otp() -> str:
     return f"{randbelow(10**6):06d}"
 
@@ -0,0 +1,101 @@
+"""Load-tests ``POST /debit-cards/authorize`` against a throwaway SQLite database.
+
+Run from the backend directory: ``python -m benchmarks.card_authorization --requests 5000 --concurrency 8``
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
+_DB_DIR = tempfile.mkdtemp(prefix="card-auth-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{(Path(_DB_DIR) / 'bench.db').as_posix()}"
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-123")
+os.environ.setdefault("AUDIT_MODE", "sync")
+os.environ["CARD_NETWORK_API_KEY"] = "benchmark-network-key"
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app.core.database import engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import CardStatus, DebitCard  # noqa: E402
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cards", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    with TestClient(app) as client:
+        register = client.post(
+            "/api/v1/users/register",
+            json={"name": "Bench Customer", "email": "bench@example.com", "contact": "1234567890", "address": "Bench Street", "password": "Password@123"},
+        )
+        register.raise_for_status()
+        login = client.post("/api/v1/auth/token", json={"email": "bench@example.com", "password": "Password@123"})
+        owner = {"Authorization": f"Bearer {login.json()['data']['access_token']}"}
+
+        account_ids = []
+        for _ in range(args.cards):
+            created = client.post(
+                "/api/v1/accounts/",
+                headers=owner,
+                json={"user_id": register.json()["data"]["user_id"], "account_type": "savings", "initial_deposit": 10_000_000},
+            )
+            created.raise_for_status()
+            account_ids.append(created.json()["data"]["account_id"])
+
+        card_numbers = [f"9{i:014d}" for i in range(args.cards)]
+        with engine.begin() as conn:
+            conn.execute(
+                insert(DebitCard),
+                [
+                    {
+                        "account_id": account_id,
+                        "card_number": number,
+                        "status": CardStatus.ACTIVE,
+                        "expiry_date": date(date.today().year + 5, 1, 1),
+                        "daily_limit": 10_000_000,
+                    }
+                    for account_id, number in zip(account_ids, card_numbers)
+                ],
+            )
+
+        headers = {"X-Network-Key": os.environ["CARD_NETWORK_API_KEY"]}
+
+        def _authorize(i: int) -> float:
+            started = time.perf_counter()
+            response = client.post(
+                "/api/v1/debit-cards/authorize",
+                headers=headers,
+                json={"card_number": card_numbers[i % args.cards], "amount": "1.00", "channel": "pos"},
+            )
+            elapsed = time.perf_counter() - started
+            response.raise_for_status()
+            return elapsed
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            latencies = sorted(pool.map(_authorize, range(args.requests)))
+        wall = time.perf_counter() - started
+
+    print(f"{args.requests} authorizations over {args.cards} cards, concurrency {args.concurrency}")
+    print(f"throughput: {args.requests / wall:.0f} req/s")
+    for label, fraction in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99)):
+        print(f"{label}: {_percentile(latencies, fraction) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Times a bulk NAV upload against a throwaway SQLite database.
+
+Run from the backend directory: ``python -m benchmarks.nav_upload --funds 10000``
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+_DB_DIR = tempfile.mkdtemp(prefix="nav-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{(Path(_DB_DIR) / 'bench.db').as_posix()}"
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-123")
+os.environ.setdefault("AUDIT_MODE", "sync")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app.core.database import engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import MutualFund  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--funds", type=int, default=10_000)
+    parser.add_argument("--days", type=int, default=3)
+    args = parser.parse_args()
+
+    with TestClient(app) as client:
+        with engine.begin() as conn:
+            conn.execute(
+                insert(MutualFund),
+                [{"name": f"Fund {i}", "symbol": f"BENCH{i:06d}", "nav": 10, "is_active": True} for i in range(args.funds)],
+            )
+        login = client.post("/api/v1/auth/token", json={"email": "admin@bankexample.com", "password": "Admin@12345"})
+        headers = {"Authorization": f"Bearer {login.json()['data']['access_token']}"}
+
+        for day in range(1, args.days + 1):
+            body = "symbol,nav,nav_date\n" + "".join(
+                f"BENCH{i:06d},{10 + i / 1000:.4f},2026-01-{day:02d}\n" for i in range(args.funds)
+            )
+            started = time.perf_counter()
+            response = client.post("/api/v1/mutual-funds/navs/upload", headers=headers, files={"file": ("navs.csv", body, "text/csv")})
+            elapsed = time.perf_counter() - started
+            response.raise_for_status()
+            print(f"day {day}: {args.funds} funds in {elapsed * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
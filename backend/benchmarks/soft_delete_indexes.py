@@ -0,0 +1,113 @@
+"""Times the hot soft-delete lookups with and without the live-row partial indexes.
+
+Builds a throwaway SQLite database with ``--accounts`` accounts spread over ``--accounts / 4`` users,
+``--deleted`` of them soft-deleted (at random, or the newest ids with ``--clustered``), then runs each lookup ``--lookups`` times before and after the
+partial indexes exist. Run from the backend directory:
+``python -m benchmarks.soft_delete_indexes --accounts 10000000``
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+_DB_DIR = tempfile.mkdtemp(prefix="soft-delete-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{(Path(_DB_DIR) / 'bench.db').as_posix()}"
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-123")
+
+from sqlalchemy import select, text  # noqa: E402
+from sqlalchemy.schema import DropIndex  # noqa: E402
+
+from app.core.database import engine  # noqa: E402
+from app.core.schema import apply_schema_compatibility  # noqa: E402
+from app.models import PARTIAL_INDEX_DIALECTS, Account, User  # noqa: E402
+
+_SEED_USERS = """
+WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < :users)
+INSERT INTO users (id, name, email, contact, address, password_hash, is_active, is_deleted, is_admin, created_at, updated_at)
+SELECT n, 'Bench ' || n, 'bench' || n || '@example.com', '5550000000', 'Bench Street', 'x', 1,
+       CASE WHEN :clustered THEN n > :users * (1000 - :deleted_per_mille) / 1000 ELSE abs(random()) % 1000 < :deleted_per_mille END,
+       0, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+FROM seq
+"""
+_SEED_ACCOUNTS = """
+WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < :accounts)
+INSERT INTO accounts (id, account_number, user_id, account_type, bank_name, ifsc_code, balance, is_active, is_deleted, version,
+                      created_at, updated_at)
+SELECT n, printf('%012d', n), 1 + (n - 1) % :users, 'SAVINGS', 'Demo Bank', 'DEMO0001234', 100, 1,
+       CASE WHEN :clustered THEN n > :accounts * (1000 - :deleted_per_mille) / 1000 ELSE abs(random()) % 1000 < :deleted_per_mille END,
+       1, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+FROM seq
+"""
+
+
+_LOOKUPS = {
+    "owned_accounts": lambda user_id: select(Account.id).where(Account.user_id == user_id, Account.is_deleted.is_(False)),
+    "user_accounts_page": lambda user_id: select(Account)
+    .where(Account.user_id == user_id, Account.is_deleted.is_(False))
+    .order_by(Account.id.desc()),
+    "admin_accounts_page": lambda _: select(Account).where(Account.is_deleted.is_(False)).order_by(Account.id.desc()).limit(100),
+    "users_page": lambda _: select(User).where(User.is_deleted.is_(False)).order_by(User.id.desc()).limit(100),
+    "login": lambda user_id: select(User.id).where(User.email == f"bench{user_id}@example.com", User.is_deleted.is_(False)),
+}
+
+
+def _run(label: str, users: int, lookups: int) -> None:
+    print(f"-- {label}")
+    with engine.connect() as conn:
+        for name, build in _LOOKUPS.items():
+            sql = build(users // 2).compile(engine, compile_kwargs={"literal_binds": True})
+            plan = " / ".join(row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"))
+            random.seed(0)
+            started = time.perf_counter()
+            for _ in range(lookups):
+                conn.execute(build(random.randint(1, users))).all()
+            per_lookup = (time.perf_counter() - started) / lookups
+            print(f"{name:<20} {per_lookup * 1000:8.3f} ms  {plan}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--accounts", type=int, default=10_000_000)
+    parser.add_argument("--deleted", type=float, default=0.3)
+    parser.add_argument("--lookups", type=int, default=2000)
+    # Soft deletes cluster in practice (closed cohorts, purged imports); this puts them all at the newest ids.
+    parser.add_argument("--clustered", action="store_true")
+    args = parser.parse_args()
+    users = max(1, args.accounts // 4)
+    partial = [
+        index
+        for table in (User.__table__, Account.__table__)
+        for index in table.indexes
+        if index.info.get("dialects") == PARTIAL_INDEX_DIALECTS
+    ]
+
+    apply_schema_compatibility(engine)
+    with engine.begin() as conn:
+        for index in partial:
+            conn.execute(DropIndex(index))
+        started = time.perf_counter()
+        params = {
+            "users": users,
+            "accounts": args.accounts,
+            "deleted_per_mille": int(args.deleted * 1000),
+            "clustered": args.clustered,
+        }
+        conn.execute(text(_SEED_USERS), params)
+        conn.execute(text(_SEED_ACCOUNTS), params)
+        conn.exec_driver_sql("ANALYZE")
+    print(f"seeded {users} users / {args.accounts} accounts ({args.deleted:.0%} deleted) in {time.perf_counter() - started:.1f}s")
+    _run("without partial indexes", users, args.lookups)
+
+    started = time.perf_counter()
+    apply_schema_compatibility(engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+    print(f"built partial indexes in {time.perf_counter() - started:.1f}s")
+    _run("with partial indexes", users, args.lookups)
+
+
+if __name__ == "__main__":
+    main()
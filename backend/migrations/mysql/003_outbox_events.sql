@@ -0,0 +1,15 @@
+START TRANSACTION;
+
+CREATE TABLE IF NOT EXISTS outbox_events (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    event_type VARCHAR(60) NOT NULL,
+    user_id BIGINT NOT NULL,
+    account_id BIGINT NULL,
+    payload JSON NOT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT fk_outbox_events_user FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+    CONSTRAINT fk_outbox_events_account FOREIGN KEY (account_id) REFERENCES accounts(id) ON DELETE SET NULL,
+    INDEX ix_outbox_events_user_id_id (user_id, id)
+) ENGINE=InnoDB;
+
+COMMIT;
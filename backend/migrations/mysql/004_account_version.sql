@@ -0,0 +1,6 @@
+START TRANSACTION;
+
+-- Row version used for optimistic concurrency and balance cache invalidation.
+ALTER TABLE accounts ADD COLUMN IF NOT EXISTS version INT NOT NULL DEFAULT 1;
+
+COMMIT;
@@ -0,0 +1,8 @@
+START TRANSACTION;
+
+CREATE TABLE IF NOT EXISTS audit_spool_checkpoints (
+    spool_name VARCHAR(120) PRIMARY KEY,
+    last_seq BIGINT NOT NULL
+) ENGINE=InnoDB;
+
+COMMIT;
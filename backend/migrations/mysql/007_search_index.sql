@@ -0,0 +1,18 @@
+START TRANSACTION;
+
+-- Token index used for full-text search where SQLite FTS5 is not available.
+CREATE TABLE IF NOT EXISTS search_tokens (
+    source VARCHAR(20) NOT NULL,
+    token VARCHAR(64) NOT NULL,
+    source_id INT NOT NULL,
+    hits INT NOT NULL DEFAULT 1,
+    PRIMARY KEY (source, token, source_id),
+    INDEX ix_search_tokens_source_source_id (source, source_id)
+) ENGINE=InnoDB;
+
+CREATE TABLE IF NOT EXISTS search_index_checkpoints (
+    source VARCHAR(20) PRIMARY KEY,
+    last_id BIGINT NOT NULL
+) ENGINE=InnoDB;
+
+COMMIT;
@@ -0,0 +1,14 @@
+START TRANSACTION;
+
+CREATE TABLE IF NOT EXISTS mutual_fund_navs (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    fund_id BIGINT NOT NULL,
+    nav_date DATE NOT NULL,
+    nav DECIMAL(12,4) NOT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uq_mutual_fund_navs_fund_date UNIQUE (fund_id, nav_date),
+    CONSTRAINT fk_mutual_fund_navs_fund FOREIGN KEY (fund_id) REFERENCES mutual_funds(id) ON DELETE CASCADE,
+    INDEX ix_mutual_fund_navs_nav_date (nav_date)
+) ENGINE=InnoDB;
+
+COMMIT;
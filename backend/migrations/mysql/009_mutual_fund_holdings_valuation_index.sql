@@ -0,0 +1,6 @@
+START TRANSACTION;
+
+-- Covering index for the firm-wide portfolio summary (grouped by fund).
+CREATE INDEX ix_mutual_fund_holdings_fund_valuation ON mutual_fund_holdings(fund_id, units, average_nav);
+
+COMMIT;
@@ -0,0 +1,28 @@
+START TRANSACTION;
+
+CREATE TABLE IF NOT EXISTS mutual_fund_orders (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    user_id BIGINT NOT NULL,
+    account_id BIGINT NOT NULL,
+    fund_id BIGINT NOT NULL,
+    order_type VARCHAR(20) NOT NULL,
+    amount DECIMAL(14,2) NULL,
+    units DECIMAL(14,4) NULL,
+    status VARCHAR(20) NOT NULL,
+    batch_id VARCHAR(40) NULL,
+    trade_id BIGINT NULL,
+    executed_nav DECIMAL(12,4) NULL,
+    executed_units DECIMAL(14,4) NULL,
+    executed_amount DECIMAL(14,2) NULL,
+    failure_reason VARCHAR(255) NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    CONSTRAINT fk_fund_orders_user FOREIGN KEY (user_id) REFERENCES users(id),
+    CONSTRAINT fk_fund_orders_account FOREIGN KEY (account_id) REFERENCES accounts(id),
+    CONSTRAINT fk_fund_orders_fund FOREIGN KEY (fund_id) REFERENCES mutual_funds(id),
+    CONSTRAINT fk_fund_orders_trade FOREIGN KEY (trade_id) REFERENCES mutual_fund_trades(id) ON DELETE SET NULL,
+    INDEX ix_mutual_fund_orders_user_id (user_id),
+    INDEX ix_mutual_fund_orders_status_account_id (status, account_id)
+) ENGINE=InnoDB;
+
+COMMIT;
@@ -0,0 +1,40 @@
+START TRANSACTION;
+
+CREATE TABLE IF NOT EXISTS sip_instructions (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    user_id BIGINT NOT NULL,
+    account_id BIGINT NOT NULL,
+    fund_id BIGINT NOT NULL,
+    amount DECIMAL(14,2) NOT NULL,
+    frequency VARCHAR(20) NOT NULL,
+    start_date DATE NOT NULL,
+    next_run_date DATE NOT NULL,
+    last_run_date DATE NULL,
+    status VARCHAR(20) NOT NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    CONSTRAINT fk_sip_instructions_user FOREIGN KEY (user_id) REFERENCES users(id),
+    CONSTRAINT fk_sip_instructions_account FOREIGN KEY (account_id) REFERENCES accounts(id),
+    CONSTRAINT fk_sip_instructions_fund FOREIGN KEY (fund_id) REFERENCES mutual_funds(id),
+    INDEX ix_sip_instructions_user_id (user_id),
+    INDEX ix_sip_instructions_status_next_run_date (status, next_run_date, id)
+) ENGINE=InnoDB;
+
+CREATE TABLE IF NOT EXISTS sip_executions (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    instruction_id BIGINT NOT NULL,
+    run_date DATE NOT NULL,
+    batch_id VARCHAR(40) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    amount DECIMAL(14,2) NOT NULL,
+    trade_id BIGINT NULL,
+    units DECIMAL(14,4) NULL,
+    nav DECIMAL(12,4) NULL,
+    failure_reason VARCHAR(255) NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT fk_sip_executions_instruction FOREIGN KEY (instruction_id) REFERENCES sip_instructions(id) ON DELETE CASCADE,
+    CONSTRAINT fk_sip_executions_trade FOREIGN KEY (trade_id) REFERENCES mutual_fund_trades(id) ON DELETE SET NULL,
+    CONSTRAINT uq_sip_executions_instruction_run_date UNIQUE (instruction_id, run_date)
+) ENGINE=InnoDB;
+
+COMMIT;
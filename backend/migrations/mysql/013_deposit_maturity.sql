@@ -0,0 +1,19 @@
+START TRANSACTION;
+
+ALTER TABLE deposits ADD COLUMN IF NOT EXISTS payout_amount DECIMAL(14,2) NULL;
+ALTER TABLE deposits ADD COLUMN IF NOT EXISTS matured_at DATETIME NULL;
+CREATE INDEX ix_deposits_status_maturity_date ON deposits(status, maturity_date, id);
+
+ALTER TABLE transactions DROP CHECK chk_txn_type;
+ALTER TABLE transactions ADD CONSTRAINT chk_txn_type
+    CHECK (transaction_type IN ('transfer', 'mutual_fund_buy', 'mutual_fund_sell', 'deposit_create', 'deposit_cancel', 'deposit_maturity', 'adjustment'));
+
+CREATE TABLE IF NOT EXISTS job_checkpoints (
+    name VARCHAR(60) PRIMARY KEY,
+    run_key VARCHAR(40) NOT NULL,
+    position JSON NOT NULL,
+    processed BIGINT NOT NULL DEFAULT 0,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB;
+
+COMMIT;
@@ -0,0 +1,7 @@
+START TRANSACTION;
+
+ALTER TABLE deposits ADD COLUMN IF NOT EXISTS installments_paid INT NOT NULL DEFAULT 1;
+ALTER TABLE deposits ADD COLUMN IF NOT EXISTS accrued_interest DECIMAL(14,2) NOT NULL DEFAULT 0;
+ALTER TABLE deposits ADD COLUMN IF NOT EXISTS accrued_through DATE NULL;
+
+COMMIT;
@@ -0,0 +1,22 @@
+START TRANSACTION;
+
+ALTER TABLE debit_cards ADD COLUMN IF NOT EXISTS daily_limit DECIMAL(14,2) NOT NULL DEFAULT 2000.00;
+ALTER TABLE debit_cards ADD COLUMN IF NOT EXISTS spent_today DECIMAL(14,2) NOT NULL DEFAULT 0.00;
+ALTER TABLE debit_cards ADD COLUMN IF NOT EXISTS spent_on DATE NULL;
+
+CREATE TABLE IF NOT EXISTS card_authorizations (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    card_id BIGINT NOT NULL,
+    account_id BIGINT NOT NULL,
+    amount DECIMAL(14,2) NOT NULL,
+    channel VARCHAR(20) NOT NULL,
+    merchant VARCHAR(120) NULL,
+    reference VARCHAR(40) NOT NULL UNIQUE,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT fk_card_authorizations_card FOREIGN KEY (card_id) REFERENCES debit_cards(id),
+    CONSTRAINT fk_card_authorizations_account FOREIGN KEY (account_id) REFERENCES accounts(id),
+    INDEX ix_card_authorizations_card_id (card_id),
+    INDEX ix_card_authorizations_account_id (account_id)
+) ENGINE=InnoDB;
+
+COMMIT;
@@ -0,0 +1,8 @@
+START TRANSACTION;
+
+CREATE TABLE IF NOT EXISTS number_sequences (
+    name VARCHAR(60) PRIMARY KEY,
+    next_value BIGINT NOT NULL
+) ENGINE=InnoDB;
+
+COMMIT;
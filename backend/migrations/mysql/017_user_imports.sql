@@ -0,0 +1,34 @@
+START TRANSACTION;
+
+CREATE TABLE IF NOT EXISTS user_import_jobs (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    created_by BIGINT NULL,
+    filename VARCHAR(255) NOT NULL DEFAULT '',
+    file_path VARCHAR(500) NOT NULL DEFAULT '',
+    file_format VARCHAR(10) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    processed_rows INT NOT NULL DEFAULT 0,
+    created_count INT NOT NULL DEFAULT 0,
+    skipped_count INT NOT NULL DEFAULT 0,
+    failed_count INT NOT NULL DEFAULT 0,
+    error VARCHAR(255) NULL,
+    completed_at DATETIME NULL,
+    created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    CONSTRAINT fk_user_import_jobs_created_by FOREIGN KEY (created_by) REFERENCES users(id) ON DELETE SET NULL
+) ENGINE=InnoDB;
+
+CREATE TABLE IF NOT EXISTS user_import_results (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    job_id BIGINT NOT NULL,
+    line INT NOT NULL,
+    email VARCHAR(255) NULL,
+    status VARCHAR(20) NOT NULL,
+    user_id BIGINT NULL,
+    error VARCHAR(255) NULL,
+    CONSTRAINT fk_user_import_results_job FOREIGN KEY (job_id) REFERENCES user_import_jobs(id) ON DELETE CASCADE,
+    CONSTRAINT fk_user_import_results_user FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE SET NULL,
+    CONSTRAINT uq_user_import_results_job_line UNIQUE (job_id, line)
+) ENGINE=InnoDB;
+
+COMMIT;
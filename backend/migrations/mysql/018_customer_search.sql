@@ -0,0 +1,16 @@
+START TRANSACTION;
+
+-- Normalized copies of name/email/contact for prefix search. Binary collation keeps
+-- "prefix <= value < next(prefix)" range scans in byte order.
+ALTER TABLE users ADD COLUMN IF NOT EXISTS search_name VARCHAR(120) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NULL;
+ALTER TABLE users ADD COLUMN IF NOT EXISTS search_email VARCHAR(255) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NULL;
+ALTER TABLE users ADD COLUMN IF NOT EXISTS search_contact VARCHAR(30) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NULL;
+
+CREATE INDEX ix_users_search_name_id ON users(search_name, id);
+CREATE INDEX ix_users_search_email_id ON users(search_email, id);
+CREATE INDEX ix_users_search_contact_id ON users(search_contact, id);
+
+-- Account number prefixes range-scan the existing unique index (digits only).
+-- Existing rows are backfilled by the application on startup.
+
+COMMIT;
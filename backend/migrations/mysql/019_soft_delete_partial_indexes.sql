@@ -0,0 +1,5 @@
+-- MySQL has no partial indexes; composite (is_deleted, id) indexes serve the same listings.
+-- InnoDB builds them online without blocking writes.
+
+CREATE INDEX ix_users_is_deleted_id ON users(is_deleted, id) ALGORITHM=INPLACE LOCK=NONE;
+CREATE INDEX ix_accounts_is_deleted_id ON accounts(is_deleted, id) ALGORITHM=INPLACE LOCK=NONE;
@@ -0,0 +1,4 @@
+-- Per-account transaction lookups walk these newest-first instead of scanning the table.
+
+CREATE INDEX ix_transactions_from_account_id_id ON transactions(from_account_id, id) ALGORITHM=INPLACE LOCK=NONE;
+CREATE INDEX ix_transactions_to_account_id_id ON transactions(to_account_id, id) ALGORITHM=INPLACE LOCK=NONE;
@@ -0,0 +1,6 @@
+-- Covering indexes for the balance-history aggregation: per-account flows in time order,
+-- summed without touching the table rows.
+
+CREATE INDEX ix_transactions_from_account_id_created_at ON transactions(from_account_id, created_at, amount) ALGORITHM=INPLACE LOCK=NONE;
+CREATE INDEX ix_transactions_to_account_id_created_at ON transactions(to_account_id, created_at, amount) ALGORITHM=INPLACE LOCK=NONE;
+CREATE INDEX ix_card_authorizations_account_id_created_at ON card_authorizations(account_id, created_at, amount) ALGORITHM=INPLACE LOCK=NONE;
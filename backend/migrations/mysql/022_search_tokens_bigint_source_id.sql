@@ -0,0 +1,6 @@
+-- search_tokens.source_id references BIGINT transaction and audit log ids.
+-- Changing a primary key column's type copies the table; the token index can be rebuilt from
+-- the source tables, so on a large index truncating it and resetting search_index_checkpoints
+-- first is the faster option.
+
+ALTER TABLE search_tokens MODIFY source_id BIGINT NOT NULL;
@@ -0,0 +1,9 @@
+-- Existing recurring deposits are given a next_installment_date by the application's startup
+-- backfill; installments that fell due before collection existed are not debited.
+START TRANSACTION;
+
+ALTER TABLE deposits ADD COLUMN IF NOT EXISTS next_installment_date DATE NULL;
+ALTER TABLE deposits ADD COLUMN IF NOT EXISTS installments_missed INT NOT NULL DEFAULT 0;
+CREATE INDEX ix_deposits_status_next_installment ON deposits(status, next_installment_date, id);
+
+COMMIT;
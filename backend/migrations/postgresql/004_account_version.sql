@@ -0,0 +1,6 @@
+BEGIN;
+
+-- Row version used for optimistic concurrency and balance cache invalidation.
+ALTER TABLE accounts ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1;
+
+COMMIT;
@@ -0,0 +1,6 @@
+BEGIN;
+
+-- Used by the audit archive job to find rows older than the retention window.
+CREATE INDEX IF NOT EXISTS ix_audit_logs_created_at ON audit_logs (created_at);
+
+COMMIT;
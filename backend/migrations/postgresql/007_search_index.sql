@@ -0,0 +1,19 @@
+BEGIN;
+
+-- Token index used for full-text search where SQLite FTS5 is not available.
+CREATE TABLE IF NOT EXISTS search_tokens (
+    source VARCHAR(20) NOT NULL,
+    token VARCHAR(64) NOT NULL,
+    source_id INTEGER NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (source, token, source_id)
+);
+
+CREATE INDEX IF NOT EXISTS ix_search_tokens_source_source_id ON search_tokens (source, source_id);
+
+CREATE TABLE IF NOT EXISTS search_index_checkpoints (
+    source VARCHAR(20) PRIMARY KEY,
+    last_id BIGINT NOT NULL
+);
+
+COMMIT;
@@ -0,0 +1,14 @@
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS mutual_fund_navs (
+    id BIGSERIAL PRIMARY KEY,
+    fund_id BIGINT NOT NULL REFERENCES mutual_funds(id) ON DELETE CASCADE,
+    nav_date DATE NOT NULL,
+    nav NUMERIC(12,4) NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    CONSTRAINT uq_mutual_fund_navs_fund_date UNIQUE (fund_id, nav_date)
+);
+
+CREATE INDEX IF NOT EXISTS ix_mutual_fund_navs_nav_date ON mutual_fund_navs(nav_date);
+
+COMMIT;
@@ -0,0 +1,25 @@
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS mutual_fund_orders (
+    id BIGSERIAL PRIMARY KEY,
+    user_id BIGINT NOT NULL REFERENCES users(id),
+    account_id BIGINT NOT NULL REFERENCES accounts(id),
+    fund_id BIGINT NOT NULL REFERENCES mutual_funds(id),
+    order_type VARCHAR(20) NOT NULL,
+    amount NUMERIC(14,2),
+    units NUMERIC(14,4),
+    status VARCHAR(20) NOT NULL,
+    batch_id VARCHAR(40),
+    trade_id BIGINT REFERENCES mutual_fund_trades(id) ON DELETE SET NULL,
+    executed_nav NUMERIC(12,4),
+    executed_units NUMERIC(14,4),
+    executed_amount NUMERIC(14,2),
+    failure_reason VARCHAR(255),
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS ix_mutual_fund_orders_user_id ON mutual_fund_orders(user_id);
+CREATE INDEX IF NOT EXISTS ix_mutual_fund_orders_status_account_id ON mutual_fund_orders(status, account_id);
+
+COMMIT;
@@ -0,0 +1,12 @@
+BEGIN;
+
+-- Version stamps polled by in-process caches (currently the mutual fund catalogue).
+CREATE TABLE IF NOT EXISTS cache_versions (
+    name VARCHAR(60) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0
+);
+
+ALTER TABLE mutual_funds ADD COLUMN IF NOT EXISTS nav_version INTEGER NOT NULL DEFAULT 1;
+ALTER TABLE mutual_fund_trades ADD COLUMN IF NOT EXISTS nav_version INTEGER;
+
+COMMIT;
@@ -0,0 +1,36 @@
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS sip_instructions (
+    id BIGSERIAL PRIMARY KEY,
+    user_id BIGINT NOT NULL REFERENCES users(id),
+    account_id BIGINT NOT NULL REFERENCES accounts(id),
+    fund_id BIGINT NOT NULL REFERENCES mutual_funds(id),
+    amount NUMERIC(14,2) NOT NULL,
+    frequency VARCHAR(20) NOT NULL,
+    start_date DATE NOT NULL,
+    next_run_date DATE NOT NULL,
+    last_run_date DATE,
+    status VARCHAR(20) NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS ix_sip_instructions_user_id ON sip_instructions(user_id);
+CREATE INDEX IF NOT EXISTS ix_sip_instructions_status_next_run_date ON sip_instructions(status, next_run_date, id);
+
+CREATE TABLE IF NOT EXISTS sip_executions (
+    id BIGSERIAL PRIMARY KEY,
+    instruction_id BIGINT NOT NULL REFERENCES sip_instructions(id) ON DELETE CASCADE,
+    run_date DATE NOT NULL,
+    batch_id VARCHAR(40) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    amount NUMERIC(14,2) NOT NULL,
+    trade_id BIGINT REFERENCES mutual_fund_trades(id) ON DELETE SET NULL,
+    units NUMERIC(14,4),
+    nav NUMERIC(12,4),
+    failure_reason VARCHAR(255),
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    CONSTRAINT uq_sip_executions_instruction_run_date UNIQUE (instruction_id, run_date)
+);
+
+COMMIT;
@@ -0,0 +1,19 @@
+BEGIN;
+
+ALTER TABLE deposits ADD COLUMN IF NOT EXISTS payout_amount NUMERIC(14,2);
+ALTER TABLE deposits ADD COLUMN IF NOT EXISTS matured_at TIMESTAMPTZ;
+CREATE INDEX IF NOT EXISTS ix_deposits_status_maturity_date ON deposits(status, maturity_date, id);
+
+ALTER TABLE transactions DROP CONSTRAINT IF EXISTS transactions_transaction_type_check;
+ALTER TABLE transactions ADD CONSTRAINT transactions_transaction_type_check
+    CHECK (transaction_type IN ('transfer', 'mutual_fund_buy', 'mutual_fund_sell', 'deposit_create', 'deposit_cancel', 'deposit_maturity', 'adjustment'));
+
+CREATE TABLE IF NOT EXISTS job_checkpoints (
+    name VARCHAR(60) PRIMARY KEY,
+    run_key VARCHAR(40) NOT NULL,
+    position JSONB NOT NULL DEFAULT '{}'::jsonb,
+    processed BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+COMMIT;
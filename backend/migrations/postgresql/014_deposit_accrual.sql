@@ -0,0 +1,7 @@
+BEGIN;
+
+ALTER TABLE deposits ADD COLUMN IF NOT EXISTS installments_paid INTEGER NOT NULL DEFAULT 1;
+ALTER TABLE deposits ADD COLUMN IF NOT EXISTS accrued_interest NUMERIC(14,2) NOT NULL DEFAULT 0;
+ALTER TABLE deposits ADD COLUMN IF NOT EXISTS accrued_through DATE;
+
+COMMIT;
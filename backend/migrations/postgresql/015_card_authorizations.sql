@@ -0,0 +1,21 @@
+BEGIN;
+
+ALTER TABLE debit_cards ADD COLUMN IF NOT EXISTS daily_limit NUMERIC(14,2) NOT NULL DEFAULT 2000.00;
+ALTER TABLE debit_cards ADD COLUMN IF NOT EXISTS spent_today NUMERIC(14,2) NOT NULL DEFAULT 0.00;
+ALTER TABLE debit_cards ADD COLUMN IF NOT EXISTS spent_on DATE;
+
+CREATE TABLE IF NOT EXISTS card_authorizations (
+    id BIGSERIAL PRIMARY KEY,
+    card_id BIGINT NOT NULL REFERENCES debit_cards(id),
+    account_id BIGINT NOT NULL REFERENCES accounts(id),
+    amount NUMERIC(14,2) NOT NULL,
+    channel VARCHAR(20) NOT NULL,
+    merchant VARCHAR(120),
+    reference VARCHAR(40) NOT NULL UNIQUE,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS ix_card_authorizations_card_id ON card_authorizations(card_id);
+CREATE INDEX IF NOT EXISTS ix_card_authorizations_account_id ON card_authorizations(account_id);
+
+COMMIT;
@@ -0,0 +1,8 @@
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS number_sequences (
+    name VARCHAR(60) PRIMARY KEY,
+    next_value BIGINT NOT NULL
+);
+
+COMMIT;
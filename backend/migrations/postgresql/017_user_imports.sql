@@ -0,0 +1,31 @@
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS user_import_jobs (
+    id BIGSERIAL PRIMARY KEY,
+    created_by BIGINT REFERENCES users(id) ON DELETE SET NULL,
+    filename VARCHAR(255) NOT NULL DEFAULT '',
+    file_path VARCHAR(500) NOT NULL DEFAULT '',
+    file_format VARCHAR(10) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    processed_rows INTEGER NOT NULL DEFAULT 0,
+    created_count INTEGER NOT NULL DEFAULT 0,
+    skipped_count INTEGER NOT NULL DEFAULT 0,
+    failed_count INTEGER NOT NULL DEFAULT 0,
+    error VARCHAR(255),
+    completed_at TIMESTAMPTZ,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS user_import_results (
+    id BIGSERIAL PRIMARY KEY,
+    job_id BIGINT NOT NULL REFERENCES user_import_jobs(id) ON DELETE CASCADE,
+    line INTEGER NOT NULL,
+    email VARCHAR(255),
+    status VARCHAR(20) NOT NULL,
+    user_id BIGINT REFERENCES users(id) ON DELETE SET NULL,
+    error VARCHAR(255),
+    CONSTRAINT uq_user_import_results_job_line UNIQUE (job_id, line)
+);
+
+COMMIT;
@@ -0,0 +1,16 @@
+BEGIN;
+
+-- Normalized copies of name/email/contact for prefix search. Byte-order collation keeps
+-- "prefix <= value < next(prefix)" range scans correct regardless of the database locale.
+ALTER TABLE users ADD COLUMN IF NOT EXISTS search_name VARCHAR(120) COLLATE "C";
+ALTER TABLE users ADD COLUMN IF NOT EXISTS search_email VARCHAR(255) COLLATE "C";
+ALTER TABLE users ADD COLUMN IF NOT EXISTS search_contact VARCHAR(30) COLLATE "C";
+
+CREATE INDEX IF NOT EXISTS ix_users_search_name_id ON users(search_name, id);
+CREATE INDEX IF NOT EXISTS ix_users_search_email_id ON users(search_email, id);
+CREATE INDEX IF NOT EXISTS ix_users_search_contact_id ON users(search_contact, id);
+
+-- Account number prefixes range-scan the existing unique index (digits only).
+-- Existing rows are backfilled by the application on startup.
+
+COMMIT;
@@ -0,0 +1,5 @@
+-- Partial indexes for the "is_deleted IS false" filter used by the user and account listings.
+-- CONCURRENTLY avoids blocking writes on large tables, so this file runs outside a transaction.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_live_id ON users(id) WHERE is_deleted IS false;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_accounts_live_id ON accounts(id) WHERE is_deleted IS false;
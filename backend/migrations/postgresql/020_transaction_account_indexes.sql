@@ -0,0 +1,5 @@
+-- Per-account transaction lookups walk these newest-first instead of scanning the table.
+-- CONCURRENTLY avoids blocking transfers on large tables, so this file runs outside a transaction.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_from_account_id_id ON transactions(from_account_id, id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_to_account_id_id ON transactions(to_account_id, id);
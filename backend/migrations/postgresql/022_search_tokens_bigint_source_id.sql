@@ -0,0 +1,9 @@
+-- search_tokens.source_id references BIGINT transaction and audit log ids.
+-- Rewrites the table under an ACCESS EXCLUSIVE lock; the token index can be rebuilt from
+-- the source tables, so on a large index truncating it and resetting search_index_checkpoints
+-- first is the faster option.
+BEGIN;
+
+ALTER TABLE search_tokens ALTER COLUMN source_id TYPE BIGINT;
+
+COMMIT;
@@ -0,0 +1,75 @@
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+TEST_DB_PATH = Path(__file__).parent.parent / "data" / "test_banking.db"
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{TEST_DB_PATH.as_posix()}")
+os.environ.setdefault("SECRET_KEY", "test-secret-key-123456")
+os.environ.setdefault("AUDIT_MODE", "sync")
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def admin_token(client: TestClient) -> str:
+    response = client.post("/api/v1/auth/token", json={"email": "admin@bankexample.com", "password": "Admin@12345"})
+    assert response.status_code == 200, response.text
+    return response.json()["data"]["access_token"]
+
+
+@pytest.fixture
+def customer(client: TestClient):
+    def _create(**account_balances: int) -> dict:
+        email = f"customer-{uuid4().hex[:10]}@example.com"
+        register = client.post(
+            "/api/v1/users/register",
+            json={"name": "Test Customer", "email": email, "contact": "1234567890", "address": "Test Street", "password": "Password@123"},
+        )
+        assert register.status_code == 200, register.text
+        login = client.post("/api/v1/auth/token", json={"email": email, "password": "Password@123"})
+        assert login.status_code == 200, login.text
+        token = login.json()["data"]["access_token"]
+
+        accounts = {}
+        for name, balance in account_balances.items():
+            created = client.post(
+                "/api/v1/accounts/",
+                headers={"Authorization": f"Bearer {token}"},
+                json={"user_id": register.json()["data"]["user_id"], "account_type": "savings", "initial_deposit": balance},
+            )
+            assert created.status_code == 200, created.text
+            accounts[name] = created.json()["data"]["account_id"]
+
+        return {"user_id": register.json()["data"]["user_id"], "email": email, "token": token, "accounts": accounts}
+
+    return _create
+
+
+@pytest.fixture
+def query_budget():
+    """Fail if a request inside the block runs more than ``max_queries`` statements or repeats one."""
+    from app.core.instrumentation import observe_query_logs
+
+    @contextmanager
+    def _budget(max_queries: int, allow_repeats: bool = False):
+        logs = []
+        with observe_query_logs(logs.append):
+            yield logs
+        assert logs, "no request was made inside query_budget"
+        for log in logs:
+            assert log.count <= max_queries, f"{log.method} {log.path} ran {log.count} queries (budget {max_queries})"
+            if not allow_repeats:
+                assert not log.repeated(), f"{log.method} {log.path} repeated statements: {log.repeated()}"
+
+    return _budget
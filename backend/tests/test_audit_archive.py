@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, insert, select
+
+from app.core.database import engine
+from app.models import AuditLog
+from app.services.audit_archive import AuditArchive, audit_archive
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _insert_logs(entity: str, created_at: list[datetime]) -> None:
+    with engine.begin() as conn:
+        conn.execute(
+            insert(AuditLog),
+            [
+                {"action": "create", "entity": entity, "entity_id": index, "details": {"index": index}, "created_at": value}
+                for index, value in enumerate(created_at)
+            ],
+        )
+
+
+def _hot_count(entity: str) -> int:
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(AuditLog).where(AuditLog.entity == entity)).scalar_one()
+
+
+def test_expired_rows_move_to_monthly_segments(client, tmp_path):
+    entity = f"archive-{uuid4().hex[:8]}"
+    now = datetime.now(timezone.utc)
+    old = [datetime(2020, 1, 5, tzinfo=timezone.utc) + timedelta(days=index * 10) for index in range(6)]
+    _insert_logs(entity, [*old, now])
+
+    archive = AuditArchive(tmp_path, batch_size=4)
+    assert archive.archive(engine, now - timedelta(days=1)) >= 6
+
+    assert _hot_count(entity) == 1
+    assert {"2020-01", "2020-02"} <= set(archive.months())
+    assert not (tmp_path / "pending.json").exists()
+
+    february = [
+        record for record in archive.query(datetime(2020, 2, 1, tzinfo=timezone.utc), datetime(2020, 2, 29, tzinfo=timezone.utc))
+        if record["entity"] == entity
+    ]
+    assert sorted(record["entity_id"] for record in february) == [3, 4, 5]
+
+
+def test_interrupted_batch_is_recovered(client, tmp_path, monkeypatch):
+    entity = f"archive-{uuid4().hex[:8]}"
+    _insert_logs(entity, [datetime(2019, 6, 1, tzinfo=timezone.utc)] * 3)
+    cutoff = datetime(2019, 7, 1, tzinfo=timezone.utc)
+
+    archive = AuditArchive(tmp_path, batch_size=1000)
+
+    def _crash(*_):
+        raise RuntimeError("crash before delete")
+
+    monkeypatch.setattr(archive, "_delete_archived", _crash)
+    with pytest.raises(RuntimeError):
+        archive.archive(engine, cutoff)
+    assert _hot_count(entity) == 3
+
+    monkeypatch.undo()
+    assert archive.archive(engine, cutoff) == 0
+    assert _hot_count(entity) == 0
+
+    archived = [record for record in archive.query() if record["entity"] == entity]
+    assert len(archived) == 3
+
+
+def test_admin_lists_archived_logs(client, admin_token, tmp_path, monkeypatch):
+    entity = f"archive-{uuid4().hex[:8]}"
+    monkeypatch.setattr(audit_archive, "root", tmp_path)
+    _insert_logs(entity, [datetime(2018, 3, 1, tzinfo=timezone.utc), datetime.now(timezone.utc)])
+
+    response = client.post("/api/v1/audit-logs/archive", headers=_auth_header(admin_token))
+    assert response.status_code == 200, response.text
+    assert response.json()["data"]["archived"] >= 1
+    assert _hot_count(entity) == 1
+
+    # A window over archived months includes them without asking.
+    response = client.get(
+        "/api/v1/audit-logs/",
+        params={"date_from": "2018-01-01T00:00:00Z", "date_to": "2018-12-31T00:00:00Z"},
+        headers=_auth_header(admin_token),
+    )
+    assert response.status_code == 200, response.text
+    items = [item for item in response.json()["data"]["items"] if item["entity"] == entity]
+    assert len(items) == 1
+
+    # The first page is filled by hot rows newer than anything archived, so no segment is read.
+    def _no_segments(*_):
+        raise AssertionError("archive segments were read")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(audit_archive, "query", _no_segments)
+        response = client.get("/api/v1/audit-logs/", params={"page_size": 1}, headers=_auth_header(admin_token))
+    assert response.status_code == 200, response.text
+
+    _insert_logs(entity, [datetime(2018, 3, 2, tzinfo=timezone.utc), datetime(2018, 3, 3, tzinfo=timezone.utc)])
+    pages = [
+        client.get(
+            "/api/v1/audit-logs/",
+            params={"date_from": "2018-03-01T00:00:00Z", "date_to": "2018-03-31T00:00:00Z", "page": page, "page_size": 2},
+            headers=_auth_header(admin_token),
+        ).json()["data"]
+        for page in (1, 2)
+    ]
+    assert [[item["created_at"][:10] for item in data["items"] if item["entity"] == entity] for data in pages] == [
+        ["2018-03-03", "2018-03-02"],
+        ["2018-03-01"],
+    ]
+    assert pages[0]["has_more"] and not pages[1]["has_more"]
@@ -0,0 +1,74 @@
+import json
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.database import engine
+from app.core.exceptions import AppError
+from app.models import AuditLog, AuditSpoolCheckpoint
+from app.services.audit_writer import AuditWriter, build_record
+
+
+def _count(entity: str) -> int:
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(AuditLog).where(AuditLog.entity == entity)).scalar_one()
+
+
+def _records(entity: str, count: int) -> list[dict]:
+    return [build_record("create", entity, index, None, {"index": index}) for index in range(count)]
+
+
+def test_batched_records_are_bulk_inserted(client, tmp_path):
+    writer = AuditWriter(tmp_path, batch_size=4, fsync=False)
+    writer.start(engine, background=False)
+    writer.enqueue(_records("audit_batch_test", 10))
+
+    assert writer.flush() == 4
+    assert _count("audit_batch_test") == 4
+    # The spool keeps only what has not been inserted yet.
+    spool = tmp_path / writer._spool_name
+    assert [json.loads(line)["seq"] for line in spool.read_text().splitlines()] == list(range(5, 11))
+    writer.enqueue(_records("audit_batch_test", 1))
+    assert len(spool.read_text().splitlines()) == 7
+    writer.stop()
+
+    assert _count("audit_batch_test") == 11
+    assert list(tmp_path.glob("*.spool")) == []
+
+
+def test_spooled_records_survive_a_crash_exactly_once(client, tmp_path):
+    crashed = AuditWriter(tmp_path, batch_size=3, fsync=True)
+    crashed.start(engine, background=False)
+    crashed.enqueue(_records("audit_crash_test", 7))
+    crashed.flush()
+    crashed._spool.close()  # simulate the process dying with records still spooled
+
+    assert _count("audit_crash_test") == 3
+
+    survivor = AuditWriter(tmp_path, batch_size=3, fsync=False)
+    survivor.start(engine, background=False)
+    assert _count("audit_crash_test") == 7
+    assert survivor.recover_orphans() == 0
+    survivor.stop()
+
+    assert _count("audit_crash_test") == 7
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(AuditSpoolCheckpoint)).scalar_one() == 0
+
+
+def test_full_queue_applies_backpressure(client, tmp_path):
+    writer = AuditWriter(tmp_path, max_pending=5, enqueue_timeout_ms=50, fsync=False)
+    writer.start(engine, background=False)
+    writer.reserve(3)
+    writer.enqueue(_records("audit_backpressure_test", 3), reserved=3)
+    writer.reserve(2)
+
+    with pytest.raises(AppError) as exc_info:
+        writer.reserve(1)
+    assert exc_info.value.status_code == 503
+
+    writer.release(2)
+    writer.flush()
+    writer.reserve(5)
+    writer.release(5)
+    writer.stop()
@@ -0,0 +1,74 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+from sqlalchemy import update
+
+from app.core.database import SessionLocal
+from app.models import Account
+from app.services.balance_cache import CachedBalance, balance_cache, invalidate_from_event
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _balance(client, token: str, account_id: int) -> Decimal:
+    response = client.get(f"/api/v1/accounts/{account_id}/balance", headers=_auth_header(token))
+    assert response.status_code == 200, response.text
+    return Decimal(str(response.json()["data"]["balance"]["balance"]))
+
+
+def test_no_stale_read_after_committed_write(client, customer):
+    owner = customer(main=1000, spare=0)
+    main, spare = owner["accounts"]["main"], owner["accounts"]["spare"]
+
+    assert _balance(client, owner["token"], main) == Decimal("1000.00")
+    assert balance_cache.get(main) is not None
+
+    transfer = client.post(
+        "/api/v1/transactions/",
+        headers=_auth_header(owner["token"]),
+        json={"from_account_id": main, "to_account_id": spare, "amount": 300},
+    )
+    assert transfer.status_code == 200, transfer.text
+    assert _balance(client, owner["token"], main) == Decimal("700.00")
+    assert _balance(client, owner["token"], spare) == Decimal("300.00")
+
+    deposit = client.post(
+        "/api/v1/deposits/",
+        headers=_auth_header(owner["token"]),
+        json={"account_id": main, "deposit_type": "fixed", "term_months": 6, "amount": 200, "interest_rate": 5},
+    )
+    assert deposit.status_code == 200, deposit.text
+    assert _balance(client, owner["token"], main) == Decimal("500.00")
+
+    deleted = client.delete(f"/api/v1/accounts/{spare}", headers=_auth_header(owner["token"]))
+    assert deleted.status_code == 200, deleted.text
+    missing = client.get(f"/api/v1/accounts/{spare}/balance", headers=_auth_header(owner["token"]))
+    assert missing.status_code == 404
+
+
+def test_writes_from_other_workers_invalidate_by_version(client, customer):
+    owner = customer(main=1000)
+    main = owner["accounts"]["main"]
+    with SessionLocal() as session:
+        cached = CachedBalance.from_account(session.get(Account, main))
+    balance_cache.put(cached)
+
+    with SessionLocal() as session:
+        session.execute(
+            update(Account)
+            .where(Account.id == main)
+            .values(balance=Decimal("1234.00"), version=Account.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        session.commit()
+
+    invalidate_from_event(SimpleNamespace(account_id=main, payload={"version": cached.version}))
+    assert balance_cache.get(main) == cached
+
+    invalidate_from_event(SimpleNamespace(account_id=main, payload={"version": cached.version + 1}))
+    assert _balance(client, owner["token"], main) == Decimal("1234.00")
+
+    balance_cache.put(cached)
+    assert balance_cache.get(main).version == cached.version + 1
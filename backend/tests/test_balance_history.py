@@ -0,0 +1,105 @@
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import event, update
+
+from app.core.config import settings
+from app.core.database import engine
+from app.models import Account, CardAuthorization, Transaction
+
+NETWORK_KEY = "test-network-key"
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _transfer(client, owner: dict, source: str, target: str, amount: int, at: datetime | None = None) -> None:
+    response = client.post(
+        "/api/v1/transactions/",
+        headers=_auth_header(owner["token"]),
+        json={"from_account_id": owner["accounts"][source], "to_account_id": owner["accounts"][target], "amount": amount},
+    )
+    assert response.status_code == 200, response.text
+    if at is not None:
+        with engine.begin() as conn:
+            conn.execute(update(Transaction).where(Transaction.id == response.json()["data"]["transaction_id"]).values(created_at=at))
+
+
+def _card_hold(client, owner: dict, account: str, amount: str, at: datetime) -> None:
+    created = client.post("/api/v1/debit-cards/", headers=_auth_header(owner["token"]), json={"account_id": owner["accounts"][account]})
+    card_id, otp = created.json()["data"]["card_id"], created.json()["data"]["otp"]
+    client.put("/api/v1/debit-cards/activate", headers=_auth_header(owner["token"]), json={"card_id": card_id, "otp": otp})
+    card_number = client.get(f"/api/v1/debit-cards/{card_id}", headers=_auth_header(owner["token"])).json()["data"]["card"]["card_number"]
+    response = client.post(
+        "/api/v1/debit-cards/authorize",
+        headers={"X-Network-Key": NETWORK_KEY},
+        json={"card_number": card_number, "amount": amount, "channel": "pos"},
+    )
+    assert response.status_code == 200, response.text
+    with engine.begin() as conn:
+        conn.execute(update(CardAuthorization).where(CardAuthorization.id == response.json()["data"]["authorization_id"]).values(created_at=at))
+
+
+def _history(client, owner: dict, account: str, **params) -> list:
+    response = client.get(
+        f"/api/v1/accounts/{owner['accounts'][account]}/balance-history", headers=_auth_header(owner["token"]), params=params
+    )
+    assert response.status_code == 200, response.text
+    return [(point["at"][:10], None if point["balance"] is None else Decimal(str(point["balance"]))) for point in response.json()["data"]["points"]]
+
+
+def test_balance_history_rebuilds_end_of_bucket_balances(client, customer, monkeypatch):
+    monkeypatch.setattr(settings, "card_network_api_key", NETWORK_KEY)
+    owner = customer(main=1000, spare=0)
+    with engine.begin() as conn:
+        conn.execute(update(Account).where(Account.id == owner["accounts"]["main"]).values(created_at=datetime(2025, 12, 1)))
+        conn.execute(update(Account).where(Account.id == owner["accounts"]["spare"]).values(created_at=datetime(2026, 2, 1)))
+
+    _transfer(client, owner, "main", "spare", 100, datetime(2026, 2, 10))
+    _transfer(client, owner, "spare", "main", 30, datetime(2026, 3, 15))
+    _card_hold(client, owner, "main", "20.00", datetime(2026, 3, 20))
+    _transfer(client, owner, "main", "spare", 50)  # after the window; only used to walk back from today
+
+    window = {"from": "2026-01-01T00:00:00Z", "to": "2026-05-01T00:00:00Z", "buckets": 4}
+    assert _history(client, owner, "main", **window) == [
+        ("2026-01-31", Decimal("1000.00")),
+        ("2026-03-02", Decimal("900.00")),
+        ("2026-04-01", Decimal("910.00")),
+        ("2026-05-01", Decimal("910.00")),
+    ]
+    # Points before the account was opened carry no balance.
+    assert [balance for _, balance in _history(client, owner, "spare", **window)] == [None, Decimal("100.00"), Decimal("70.00"), Decimal("70.00")]
+
+    latest = _history(client, owner, "main", buckets=12)
+    assert len(latest) == 12 and latest[-1][1] == Decimal("860.00")
+
+
+def test_balance_history_is_one_aggregate_query_and_checks_access(client, customer):
+    owner = customer(main=500, spare=0)
+    other = customer(main=0)
+    for _ in range(5):
+        _transfer(client, owner, "main", "spare", 1)
+
+    statements = []
+
+    def _record(_conn, _cursor, statement, *_):
+        if "union all" in statement.lower():
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        points = _history(client, owner, "main", buckets=500)
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    assert len(points) == 500 and points[-1][1] == Decimal("495.00")
+    assert len(statements) == 1
+
+    forbidden = client.get(f"/api/v1/accounts/{owner['accounts']['main']}/balance-history", headers=_auth_header(other["token"]))
+    assert forbidden.status_code == 403
+    invalid = client.get(
+        f"/api/v1/accounts/{owner['accounts']['main']}/balance-history",
+        headers=_auth_header(owner["token"]),
+        params={"from": "2026-05-01T00:00:00Z", "to": "2026-01-01T00:00:00Z"},
+    )
+    assert invalid.status_code == 400
@@ -0,0 +1,99 @@
+from sqlalchemy import func, select
+
+from app.core.database import SessionLocal
+from app.models import Account, AuditLog, OutboxEvent
+from app.services.bulk_status import set_account_active
+from app.services.events import ACCOUNT_UPDATED
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _card(client, owner: dict, account: str, activate: bool) -> int:
+    created = client.post("/api/v1/debit-cards/", headers=_auth_header(owner["token"]), json={"account_id": owner["accounts"][account]})
+    assert created.status_code == 200, created.text
+    card_id = created.json()["data"]["card_id"]
+    if activate:
+        activated = client.put(
+            "/api/v1/debit-cards/activate",
+            headers=_auth_header(owner["token"]),
+            json={"card_id": card_id, "otp": created.json()["data"]["otp"]},
+        )
+        assert activated.status_code == 200, activated.text
+    return card_id
+
+
+def _card_status(client, owner: dict, card_id: int) -> str:
+    return client.get(f"/api/v1/debit-cards/{card_id}", headers=_auth_header(owner["token"])).json()["data"]["card"]["status"]
+
+
+def test_bulk_card_block_and_unblock(client, admin_token, customer):
+    owner = customer(savings=100, current=100)
+    other = customer(savings=100)
+    cards = [_card(client, owner, "savings", True), _card(client, owner, "current", True), _card(client, owner, "current", False)]
+    bystander = _card(client, other, "savings", True)
+
+    blocked = client.post(
+        "/api/v1/debit-cards/bulk-status", headers=_auth_header(admin_token), json={"user_id": owner["user_id"], "status": "disabled"}
+    )
+    assert blocked.status_code == 200, blocked.text
+    assert blocked.json()["data"]["updated"] == 3
+    assert [_card_status(client, owner, card_id) for card_id in cards] == ["disabled"] * 3
+    assert _card_status(client, other, bystander) == "active"
+    with SessionLocal() as db:
+        audited = db.execute(
+            select(func.count()).where(AuditLog.action == "bulk_update", AuditLog.entity == "debit_card", AuditLog.entity_id.in_(cards))
+        ).scalar_one()
+    assert audited == 3
+
+    # Only the previously activated cards come back; the pending one still needs its OTP.
+    unblocked = client.post(
+        "/api/v1/debit-cards/bulk-status",
+        headers=_auth_header(admin_token),
+        json={"account_ids": list(owner["accounts"].values()), "status": "active"},
+    )
+    assert unblocked.status_code == 200, unblocked.text
+    assert unblocked.json()["data"]["updated"] == 2
+    assert [_card_status(client, owner, card_id) for card_id in cards] == ["active", "active", "disabled"]
+
+    unfiltered = client.post("/api/v1/debit-cards/bulk-status", headers=_auth_header(admin_token), json={"status": "disabled"})
+    assert unfiltered.status_code == 400
+    forbidden = client.post(
+        "/api/v1/debit-cards/bulk-status", headers=_auth_header(owner["token"]), json={"card_ids": cards, "status": "disabled"}
+    )
+    assert forbidden.status_code == 403
+
+
+def test_bulk_account_freeze_bumps_versions_and_publishes_events(client, admin_token, customer):
+    owner = customer(savings=500, current=0, spare=0)
+    account_ids = sorted(owner["accounts"].values())
+    # Warm the balance cache so the freeze has something to invalidate.
+    for account_id in account_ids:
+        assert client.get(f"/api/v1/accounts/{account_id}/balance", headers=_auth_header(owner["token"])).status_code == 200
+    with SessionLocal() as db:
+        versions = dict(db.execute(select(Account.id, Account.version).where(Account.id.in_(account_ids))).all())
+
+    result = set_account_active(False, user_id=owner["user_id"], chunk_size=2)
+    assert result["updated"] == 3
+
+    with SessionLocal() as db:
+        rows = db.execute(select(Account.id, Account.version, Account.is_active).where(Account.id.in_(account_ids))).all()
+        events = db.execute(
+            select(OutboxEvent.account_id).where(OutboxEvent.event_type == ACCOUNT_UPDATED, OutboxEvent.account_id.in_(account_ids))
+        ).scalars().all()
+    assert all(row.version == versions[row.id] + 1 and not row.is_active for row in rows)
+    assert sorted(events) == account_ids
+
+    transfer = client.post(
+        "/api/v1/transactions/",
+        headers=_auth_header(owner["token"]),
+        json={"from_account_id": owner["accounts"]["savings"], "to_account_id": owner["accounts"]["current"], "amount": 10},
+    )
+    assert transfer.status_code >= 400
+
+    unfrozen = client.post(
+        "/api/v1/accounts/bulk-status", headers=_auth_header(admin_token), json={"account_ids": account_ids, "is_active": True}
+    )
+    assert unfrozen.status_code == 200, unfrozen.text
+    assert unfrozen.json()["data"]["updated"] == 3
@@ -0,0 +1,93 @@
+from decimal import Decimal
+
+import pytest
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import DebitCard, OutboxEvent
+from app.services.card_state import card_state_cache, invalidate_from_event
+from app.services.events import CARD_UPDATED
+
+NETWORK_KEY = "test-network-key"
+
+
+@pytest.fixture(autouse=True)
+def _network_key(monkeypatch):
+    monkeypatch.setattr(settings, "card_network_api_key", NETWORK_KEY)
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _balance(client, owner: dict) -> Decimal:
+    response = client.get(f"/api/v1/accounts/{owner['accounts']['savings']}/balance", headers=_auth_header(owner["token"]))
+    return Decimal(str(response.json()["data"]["balance"]["balance"]))
+
+
+def _active_card(client, owner: dict) -> tuple[int, str]:
+    created = client.post("/api/v1/debit-cards/", headers=_auth_header(owner["token"]), json={"account_id": owner["accounts"]["savings"]})
+    assert created.status_code == 200, created.text
+    card_id, otp = created.json()["data"]["card_id"], created.json()["data"]["otp"]
+    activated = client.put("/api/v1/debit-cards/activate", headers=_auth_header(owner["token"]), json={"card_id": card_id, "otp": otp})
+    assert activated.status_code == 200, activated.text
+    card = client.get(f"/api/v1/debit-cards/{card_id}", headers=_auth_header(owner["token"])).json()["data"]["card"]
+    return card_id, card["card_number"]
+
+
+def _authorize(client, card_number: str, amount: str, key: str = NETWORK_KEY):
+    return client.post(
+        "/api/v1/debit-cards/authorize",
+        headers={"X-Network-Key": key},
+        json={"card_number": card_number, "amount": amount, "channel": "pos", "merchant": "Corner Grocery"},
+    )
+
+
+def test_authorization_holds_funds_within_daily_limit(client, customer):
+    owner = customer(savings=1000)
+    card_id, card_number = _active_card(client, owner)
+
+    assert _authorize(client, card_number, "100", key="wrong-key").status_code == 401
+
+    response = _authorize(client, card_number, "100")
+    assert response.status_code == 200, response.text
+    assert Decimal(response.json()["data"]["available_balance"]) == Decimal("900.00")
+    assert _balance(client, owner) == Decimal("900")
+
+    limited = client.put(
+        f"/api/v1/debit-cards/{card_id}/limit", headers=_auth_header(owner["token"]), json={"daily_limit": "150"}
+    )
+    assert limited.status_code == 200, limited.text
+    assert _authorize(client, card_number, "60").status_code == 402
+    assert _authorize(client, card_number, "50").status_code == 200
+    assert _balance(client, owner) == Decimal("850")
+
+    with SessionLocal() as db:
+        assert db.get(DebitCard, card_id).spent_today == Decimal("150.00")
+
+
+def test_declines_leave_balance_and_limit_untouched(client, customer):
+    owner = customer(savings=100)
+    card_id, card_number = _active_card(client, owner)
+
+    assert _authorize(client, card_number, "150").status_code == 402
+    assert _authorize(client, "000000000000", "10").status_code == 404
+    assert _authorize(client, card_number, "100").status_code == 200
+    assert _balance(client, owner) == Decimal("0")
+
+    disabled = client.put(
+        f"/api/v1/debit-cards/{card_id}/status", headers=_auth_header(owner["token"]), json={"status": "disabled"}
+    )
+    assert disabled.status_code == 200, disabled.text
+    assert _authorize(client, card_number, "1").status_code == 403
+
+
+def test_card_event_invalidates_cached_state(client, customer):
+    owner = customer(savings=100)
+    card_id, card_number = _active_card(client, owner)
+    assert _authorize(client, card_number, "1").status_code == 200
+    assert card_state_cache.get(card_number) is not None
+
+    # Another worker changing the card is seen here through the outbox event.
+    invalidate_from_event(OutboxEvent(event_type=CARD_UPDATED, user_id=owner["user_id"], payload={"card_id": card_id}))
+    assert card_state_cache.get(card_number) is None
@@ -0,0 +1,73 @@
+import json
+
+from app.core.config import settings
+from app.services import card_issuance
+from app.services.card_issuance import CardNumberAllocator
+from app.services.utils import luhn_check_digit
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _is_luhn_valid(card_number: str) -> bool:
+    return luhn_check_digit(card_number[:-1]) == card_number[-1]
+
+
+def test_allocator_hands_out_unique_luhn_valid_numbers():
+    first, second = CardNumberAllocator(block_size=3), CardNumberAllocator(block_size=3)
+    numbers = first.allocate(2) + second.allocate(4) + first.allocate(5)
+
+    assert len(set(numbers)) == len(numbers)
+    assert all(len(number) == 16 and number.startswith("521234") and _is_luhn_valid(number) for number in numbers)
+
+
+def test_bulk_issuance_streams_a_result_per_account(client, admin_token, customer):
+    owners = [customer(savings=100) for _ in range(3)]
+    account_ids = [owner["accounts"]["savings"] for owner in owners]
+
+    response = client.post(
+        "/api/v1/debit-cards/bulk", headers=_auth_header(admin_token), json={"account_ids": [*account_ids, 999_999_999]}
+    )
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    results = [json.loads(line) for line in response.text.splitlines()]
+
+    assert [result["account_id"] for result in results] == [*account_ids, 999_999_999]
+    assert [result["status"] for result in results] == ["issued", "issued", "issued", "failed"]
+    assert all(_is_luhn_valid(result["card_number"]) for result in results[:3])
+
+    # Issued cards activate with their streamed OTP like a singly-issued card.
+    owner, issued = owners[0], results[0]
+    activated = client.put(
+        "/api/v1/debit-cards/activate",
+        headers=_auth_header(owner["token"]),
+        json={"card_id": issued["card_id"], "otp": issued["otp"]},
+    )
+    assert activated.status_code == 200, activated.text
+
+    forbidden = client.post("/api/v1/debit-cards/bulk", headers=_auth_header(owner["token"]), json={"account_ids": account_ids})
+    assert forbidden.status_code == 403
+
+
+def test_failed_chunk_reports_every_remaining_account(client, admin_token, customer, monkeypatch):
+    owners = [customer(savings=100) for _ in range(3)]
+    account_ids = [owner["accounts"]["savings"] for owner in owners]
+    monkeypatch.setattr(settings, "card_issue_chunk_size", 2)
+    issue_chunk = card_issuance._issue_chunk
+    calls = []
+
+    def _fail_second_chunk(db, chunk, actor_id):
+        calls.append(chunk)
+        if len(calls) == 2:
+            raise RuntimeError("connection lost")
+        return issue_chunk(db, chunk, actor_id)
+
+    monkeypatch.setattr(card_issuance, "_issue_chunk", _fail_second_chunk)
+    response = client.post("/api/v1/debit-cards/bulk", headers=_auth_header(admin_token), json={"account_ids": account_ids})
+    assert response.status_code == 200, response.text
+    results = [json.loads(line) for line in response.text.splitlines()]
+
+    assert [result["account_id"] for result in results] == account_ids
+    assert [result["status"] for result in results] == ["issued", "issued", "failed"]
+    assert results[2]["error"] == "Card issuance failed"
@@ -0,0 +1,72 @@
+from uuid import uuid4
+
+from sqlalchemy import select, update
+
+from app.core.database import SessionLocal, engine
+from app.models import Account, User
+from app.services.customer_search import backfill_search_columns
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _register(client, name: str, email: str, contact: str) -> int:
+    response = client.post(
+        "/api/v1/users/register",
+        json={"name": name, "email": email, "contact": contact, "address": "Search Street", "password": "Password@123"},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["data"]["user_id"]
+
+
+def _search(client, admin_token: str, **params) -> dict:
+    response = client.get("/api/v1/search/customers", headers=_auth_header(admin_token), params=params)
+    assert response.status_code == 200, response.text
+    return response.json()["data"]
+
+
+def test_prefix_search_by_each_field(client, admin_token, customer):
+    tag = uuid4().hex[:8]
+    contact = f"+91 {int(tag, 16) % 10**8:08d}"
+    user_id = _register(client, f"Zoë  O'Brien-{tag}", f"Zoe.{tag}@Example.com", contact)
+
+    assert [item["user"]["id"] for item in _search(client, admin_token, q=f"ZOE o brien {tag[:4]}")["items"]] == [user_id]
+    assert [item["user"]["id"] for item in _search(client, admin_token, q=f"zoe.{tag}@ex", field="email")["items"]] == [user_id]
+    by_contact = _search(client, admin_token, q=contact.replace(" ", "-"), field="contact")["items"]
+    assert user_id in [item["user"]["id"] for item in by_contact]
+
+    owner = customer(savings=10)
+    with SessionLocal() as db:
+        number = db.execute(select(Account.account_number).where(Account.id == owner["accounts"]["savings"])).scalar_one()
+    hits = _search(client, admin_token, q=number, field="account_number")["items"]
+    assert [(item["user"]["id"], item["account"]["id"]) for item in hits] == [(owner["user_id"], owner["accounts"]["savings"])]
+
+    # Rows written before the search columns existed are filled in by the startup backfill.
+    with engine.begin() as conn:
+        conn.execute(update(User).where(User.id == user_id).values(search_name=None, search_email=None, search_contact=None))
+    assert backfill_search_columns(engine) >= 1
+    assert [item["user"]["id"] for item in _search(client, admin_token, q=f"zoe o brien {tag}")["items"]] == [user_id]
+
+    assert client.get("/api/v1/search/customers", headers=_auth_header(admin_token), params={"q": "!!"}).status_code == 400
+    assert client.get("/api/v1/search/customers", headers=_auth_header(owner["token"]), params={"q": "zoe"}).status_code == 403
+
+
+def test_keyset_pages_cover_every_match_once(client, admin_token):
+    tag = uuid4().hex[:8]
+    expected = [_register(client, f"Pager {tag} {index % 3}", f"pager-{tag}-{index}@example.com", "5550001111") for index in range(7)]
+
+    seen, cursor = [], None
+    while True:
+        params = {"q": f"pager {tag}", "page_size": 3, **({"cursor": cursor} if cursor else {})}
+        page = _search(client, admin_token, **params)
+        assert len(page["items"]) <= 3
+        seen += [(item["user"]["name"], item["user"]["id"]) for item in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(user_id for _, user_id in seen) == sorted(expected)
+    assert seen == sorted(seen)
+    invalid = client.get("/api/v1/search/customers", headers=_auth_header(admin_token), params={"q": "pager", "cursor": "nope"})
+    assert invalid.status_code == 400
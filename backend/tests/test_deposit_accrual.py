@@ -0,0 +1,120 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from sqlalchemy import update
+
+from app.core.database import SessionLocal
+from app.models import Deposit, DepositType
+from app.services.deposit_math import accrued_interest, installment_date, maturity_payout
+from app.services.utils import calculate_maturity_date
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _balance(client, owner: dict) -> Decimal:
+    response = client.get(f"/api/v1/accounts/{owner['accounts']['savings']}/balance", headers=_auth_header(owner["token"]))
+    return Decimal(str(response.json()["data"]["balance"]["balance"]))
+
+
+def _terms(deposit_type: DepositType, amount: str, rate: str, term_months: int, installments_paid: int = 1) -> Deposit:
+    start = date(2026, 1, 10)
+    return Deposit(
+        deposit_type=deposit_type,
+        term_months=term_months,
+        amount=Decimal(amount),
+        interest_rate=Decimal(rate),
+        start_date=start,
+        maturity_date=calculate_maturity_date(start, term_months),
+        installments_paid=installments_paid,
+    )
+
+
+def _backdated_deposit(client, owner: dict, deposit_type: str, amount: str, days_ago: int) -> int:
+    response = client.post(
+        "/api/v1/deposits/",
+        headers=_auth_header(owner["token"]),
+        json={
+            "account_id": owner["accounts"]["savings"],
+            "deposit_type": deposit_type,
+            "term_months": 6,
+            "amount": amount,
+            "interest_rate": "12",
+        },
+    )
+    assert response.status_code == 200, response.text
+    deposit_id = response.json()["data"]["deposit_id"]
+    start = date.today() - timedelta(days=days_ago)
+    with SessionLocal() as db:
+        db.execute(
+            update(Deposit)
+            .where(Deposit.id == deposit_id)
+            .values(
+                start_date=start,
+                maturity_date=calculate_maturity_date(start, 6),
+                next_installment_date=installment_date(start, 1) if deposit_type == "recurring" else None,
+            )
+        )
+        db.commit()
+    return deposit_id
+
+
+def _get_deposit(client, owner: dict, deposit_id: int) -> dict:
+    response = client.get(f"/api/v1/deposits/{deposit_id}", headers=_auth_header(owner["token"]))
+    assert response.status_code == 200, response.text
+    return response.json()["data"]["deposit"]
+
+
+def test_accrual_schedule():
+    fixed = _terms(DepositType.FIXED, "1000", "12", 12)
+    assert accrued_interest(fixed, fixed.start_date) == Decimal("0.00")
+    assert accrued_interest(fixed, date(2026, 7, 10)) == Decimal("59.51")
+    assert accrued_interest(fixed, date(2030, 1, 1)) == Decimal("120.00")
+
+    # Installments of 1000 stay invested for 3, 2 and 1 months.
+    recurring = _terms(DepositType.RECURRING, "1000", "12", 3, installments_paid=3)
+    assert maturity_payout(recurring) == (Decimal("60.00"), Decimal("3060.00"))
+    assert accrued_interest(recurring, date(2026, 2, 10)) < accrued_interest(recurring, date(2026, 3, 10))
+
+
+def test_accrual_records_interest_without_moving_money(client, admin_token, customer):
+    owner = customer(savings=1000)
+    deposit_id = _backdated_deposit(client, owner, "recurring", "100", days_ago=40)
+    assert _balance(client, owner) == Decimal("900")
+
+    for _ in range(2):
+        response = client.post("/api/v1/deposits/accrue", headers=_auth_header(admin_token))
+        assert response.status_code == 200, response.text
+    assert set(response.json()["data"]) == {"as_of", "accrued"}
+
+    deposit = _get_deposit(client, owner, deposit_id)
+    assert deposit["installments_paid"] == 1
+    assert deposit["accrued_through"] == date.today().isoformat()
+    assert _balance(client, owner) == Decimal("900")
+    with SessionLocal() as db:
+        expected = accrued_interest(db.get(Deposit, deposit_id), date.today())
+    assert expected > 0
+    assert Decimal(str(deposit["accrued_interest"])) == expected
+
+    # Cancellation pays the recorded accrual on top of the principal, less the early-exit penalty.
+    response = client.put(f"/api/v1/deposits/{deposit_id}/cancel", headers=_auth_header(owner["token"]))
+    assert response.status_code == 200, response.text
+    data = response.json()["data"]
+    assert Decimal(data["interest"]) == expected
+    assert Decimal(data["penalty"]) == Decimal("1.00")
+    assert _balance(client, owner) == Decimal("999.00") + expected
+
+
+def test_cancellation_brings_a_stale_accrual_up_to_date(client, customer):
+    owner = customer(savings=1000)
+    deposit_id = _backdated_deposit(client, owner, "fixed", "500", days_ago=30)
+    assert _get_deposit(client, owner, deposit_id)["accrued_through"] is None
+
+    response = client.put(f"/api/v1/deposits/{deposit_id}/cancel", headers=_auth_header(owner["token"]))
+    assert response.status_code == 200, response.text
+    deposit = _get_deposit(client, owner, deposit_id)
+    assert deposit["accrued_through"] == date.today().isoformat()
+    interest = Decimal(str(deposit["accrued_interest"]))
+    assert interest > 0 and Decimal(response.json()["data"]["interest"]) == interest
+    assert _balance(client, owner) == Decimal("1000") - Decimal("5.00") + interest
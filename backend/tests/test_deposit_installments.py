@@ -0,0 +1,114 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from sqlalchemy import update
+
+from app.core.database import SessionLocal, engine
+from app.models import Deposit
+from app.services.deposit_installments import backfill_installment_schedules
+from app.services.deposit_math import installment_date
+from app.services.utils import calculate_maturity_date
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _balance(client, owner: dict) -> Decimal:
+    response = client.get(f"/api/v1/accounts/{owner['accounts']['savings']}/balance", headers=_auth_header(owner["token"]))
+    return Decimal(str(response.json()["data"]["balance"]["balance"]))
+
+
+def _recurring(client, owner: dict, amount: str) -> int:
+    response = client.post(
+        "/api/v1/deposits/",
+        headers=_auth_header(owner["token"]),
+        json={
+            "account_id": owner["accounts"]["savings"],
+            "deposit_type": "recurring",
+            "term_months": 6,
+            "amount": amount,
+            "interest_rate": "12",
+        },
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["data"]["deposit_id"]
+
+
+def _get_deposit(client, owner: dict, deposit_id: int) -> dict:
+    response = client.get(f"/api/v1/deposits/{deposit_id}", headers=_auth_header(owner["token"]))
+    assert response.status_code == 200, response.text
+    return response.json()["data"]["deposit"]
+
+
+def _collect(client, admin_token: str, as_of: date) -> dict:
+    response = client.post("/api/v1/deposits/collect", headers=_auth_header(admin_token), params={"as_of": as_of.isoformat()})
+    assert response.status_code == 200, response.text
+    return response.json()["data"]
+
+
+def test_installments_are_collected_one_per_run_without_catching_up(client, admin_token, customer):
+    owner = customer(savings=1000)
+    deposit_id = _recurring(client, owner, "100")
+    start = date.today()
+    assert _get_deposit(client, owner, deposit_id)["next_installment_date"] == installment_date(start, 1).isoformat()
+
+    # Due today: collected once, and running again the same day is a no-op.
+    _collect(client, admin_token, installment_date(start, 1))
+    _collect(client, admin_token, installment_date(start, 1))
+    deposit = _get_deposit(client, owner, deposit_id)
+    assert deposit["installments_paid"] == 2
+    assert deposit["next_installment_date"] == installment_date(start, 2).isoformat()
+    assert _balance(client, owner) == Decimal("800")
+
+    # Installment 3 was never collected before installment 4 fell due: nothing is debited and the
+    # schedule stops with the installments already paid.
+    _collect(client, admin_token, installment_date(start, 3))
+    deposit = _get_deposit(client, owner, deposit_id)
+    assert deposit["installments_paid"] == 2
+    assert deposit["installments_missed"] == 4
+    assert deposit["next_installment_date"] is None
+    assert _balance(client, owner) == Decimal("800")
+
+
+def test_an_installment_the_account_cannot_cover_is_retried(client, admin_token, customer):
+    owner = customer(savings=100, main=500)
+    deposit_id = _recurring(client, owner, "100")
+    due = installment_date(date.today(), 1)
+
+    assert _collect(client, admin_token, due)["short"] >= 1
+    deposit = _get_deposit(client, owner, deposit_id)
+    assert deposit["installments_paid"] == 1 and deposit["next_installment_date"] == due.isoformat()
+
+    response = client.post(
+        "/api/v1/transactions/",
+        headers=_auth_header(owner["token"]),
+        json={"from_account_id": owner["accounts"]["main"], "to_account_id": owner["accounts"]["savings"], "amount": 100},
+    )
+    assert response.status_code == 200, response.text
+    _collect(client, admin_token, due)
+    assert _get_deposit(client, owner, deposit_id)["installments_paid"] == 2
+    assert _balance(client, owner) == Decimal("0")
+
+
+def test_backfill_schedules_existing_deposits_without_overdue_debits(client, customer):
+    owner = customer(savings=1000)
+    current = _recurring(client, owner, "100")
+    overdue = _recurring(client, owner, "100")
+    start = date.today()
+    backdated = start - timedelta(days=40)
+    with SessionLocal() as db:
+        db.execute(update(Deposit).where(Deposit.id.in_([current, overdue])).values(next_installment_date=None))
+        db.execute(
+            update(Deposit)
+            .where(Deposit.id == overdue)
+            .values(start_date=backdated, maturity_date=calculate_maturity_date(backdated, 6))
+        )
+        db.commit()
+
+    backfill_installment_schedules(engine)
+
+    assert _get_deposit(client, owner, current)["next_installment_date"] == installment_date(start, 1).isoformat()
+    missed = _get_deposit(client, owner, overdue)
+    assert missed["next_installment_date"] is None and missed["installments_missed"] == 5
+    assert _balance(client, owner) == Decimal("800")
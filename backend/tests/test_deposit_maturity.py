@@ -0,0 +1,132 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import update
+
+from app.core.database import SessionLocal
+from app.models import Deposit, DepositType
+from app.services import deposit_maturity
+from app.services.deposit_math import maturity_payout
+from app.services.utils import calculate_maturity_date
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _balance(client, owner: dict) -> Decimal:
+    response = client.get(f"/api/v1/accounts/{owner['accounts']['savings']}/balance", headers=_auth_header(owner["token"]))
+    return Decimal(str(response.json()["data"]["balance"]["balance"]))
+
+
+def _deposit(client, owner: dict, amount: str, rate: str = "6.5", term_months: int = 12) -> int:
+    response = client.post(
+        "/api/v1/deposits/",
+        headers=_auth_header(owner["token"]),
+        json={
+            "account_id": owner["accounts"]["savings"],
+            "deposit_type": "fixed",
+            "term_months": term_months,
+            "amount": amount,
+            "interest_rate": rate,
+        },
+    )
+    assert response.status_code == 200, response.text
+    deposit_id = response.json()["data"]["deposit_id"]
+    start = date.today() - timedelta(days=400)
+    with SessionLocal() as db:
+        db.execute(
+            update(Deposit)
+            .where(Deposit.id == deposit_id)
+            .values(start_date=start, maturity_date=calculate_maturity_date(start, term_months))
+        )
+        db.commit()
+    return deposit_id
+
+
+def _get_deposit(client, owner: dict, deposit_id: int) -> dict:
+    response = client.get(f"/api/v1/deposits/{deposit_id}", headers=_auth_header(owner["token"]))
+    assert response.status_code == 200, response.text
+    return response.json()["data"]["deposit"]
+
+
+def _fixed(amount: str, rate: str, term_months: int) -> Deposit:
+    start = date(2026, 1, 10)
+    return Deposit(
+        deposit_type=DepositType.FIXED,
+        term_months=term_months,
+        amount=Decimal(amount),
+        interest_rate=Decimal(rate),
+        start_date=start,
+        maturity_date=calculate_maturity_date(start, term_months),
+        installments_paid=1,
+    )
+
+
+def test_maturity_payout_is_simple_interest_in_cents():
+    assert maturity_payout(_fixed("1000", "6.5", 12)) == (Decimal("65.00"), Decimal("1065.00"))
+    assert maturity_payout(_fixed("1234.56", "7.25", 5)) == (Decimal("37.29"), Decimal("1271.85"))
+
+
+def test_matured_deposit_is_paid_once(client, admin_token, customer):
+    owner = customer(savings=5000)
+    deposit_id = _deposit(client, owner, "1000")
+    assert _balance(client, owner) == Decimal("4000")
+
+    for _ in range(2):
+        response = client.post("/api/v1/deposits/mature", headers=_auth_header(admin_token))
+        assert response.status_code == 200, response.text
+
+    deposit = _get_deposit(client, owner, deposit_id)
+    assert deposit["status"] == "matured"
+    assert Decimal(str(deposit["payout_amount"])) == Decimal("1065.00")
+    assert _balance(client, owner) == Decimal("5065")
+
+    response = client.put(f"/api/v1/deposits/{deposit_id}/cancel", headers=_auth_header(owner["token"]))
+    assert response.status_code == 400
+
+
+def test_cancelling_past_maturity_pays_the_maturity_amount(client, admin_token, customer):
+    owner = customer(savings=5000)
+    deposit_id = _deposit(client, owner, "1000")
+
+    response = client.put(f"/api/v1/deposits/{deposit_id}/cancel", headers=_auth_header(owner["token"]))
+    assert response.status_code == 200, response.text
+    data = response.json()["data"]
+    assert data["status"] == "matured"
+    assert (Decimal(data["interest"]), Decimal(data["penalty"])) == (Decimal("65.00"), Decimal("0.00"))
+
+    # The maturity job sees a matured deposit and does not pay it again.
+    assert client.post("/api/v1/deposits/mature", headers=_auth_header(admin_token)).status_code == 200
+    deposit = _get_deposit(client, owner, deposit_id)
+    assert deposit["status"] == "matured"
+    assert Decimal(str(deposit["payout_amount"])) == Decimal("1065.00")
+    assert _balance(client, owner) == Decimal("5065")
+
+
+def test_interrupted_run_resumes_from_checkpoint(client, customer, monkeypatch):
+    owners = [customer(savings=1000) for _ in range(3)]
+    deposits = [_deposit(client, owner, amount) for owner, amount in zip(owners, ("100", "200", "300"))]
+
+    real_payout = deposit_maturity.maturity_payout
+
+    def _flaky_payout(deposit):
+        if deposit.amount == Decimal("200"):
+            raise RuntimeError("worker died")
+        return real_payout(deposit)
+
+    monkeypatch.setattr(deposit_maturity, "maturity_payout", _flaky_payout)
+    with pytest.raises(RuntimeError):
+        deposit_maturity.mature_deposits(chunk_size=1)
+    assert [_get_deposit(client, owner, deposit_id)["status"] for owner, deposit_id in zip(owners, deposits)] == [
+        "matured",
+        "active",
+        "active",
+    ]
+
+    monkeypatch.setattr(deposit_maturity, "maturity_payout", real_payout)
+    deposit_maturity.mature_deposits(chunk_size=1)
+    for owner, deposit_id, amount in zip(owners, deposits, ("100", "200", "300")):
+        assert _get_deposit(client, owner, deposit_id)["status"] == "matured"
+        assert _balance(client, owner) == Decimal("1000") + Decimal(amount) * Decimal("0.065")
@@ -0,0 +1,76 @@
+from datetime import date
+from decimal import Decimal
+
+from app.models import Deposit, DepositType
+from app.services.deposit_math import accrued_interest, early_exit_penalty, maturity_payout, principal_paid
+from app.services.deposit_quotes import quote_cache_info, quote_deposit
+from app.services.utils import calculate_maturity_date
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _quote(client, token: str, **payload) -> dict:
+    response = client.post("/api/v1/deposits/quote", headers=_auth_header(token), json=payload)
+    assert response.status_code == 200, response.text
+    return response.json()["data"]["quote"]
+
+
+def test_fixed_deposit_quote(client, admin_token):
+    quote = _quote(client, admin_token, deposit_type="fixed", term_months=12, amount="1000", interest_rate="6.5")
+
+    assert quote["maturity_date"] == calculate_maturity_date(date.today(), 12).isoformat()
+    assert Decimal(str(quote["interest"])) == Decimal("65.00")
+    assert Decimal(str(quote["maturity_amount"])) == Decimal("1065.00")
+    assert len(quote["installments"]) == 1
+    assert [point["month"] for point in quote["cancellation"]] == list(range(1, 13))
+    early = quote["cancellation"][0]
+    assert Decimal(str(early["penalty"])) == Decimal("10.00")
+    assert Decimal(str(early["interest"])) > 0
+    assert Decimal(str(early["payout"])) == Decimal("990.00") + Decimal(str(early["interest"]))
+    assert Decimal(str(quote["cancellation"][-1]["payout"])) == Decimal("1065.00")
+
+
+def test_quote_matches_what_cancellation_and_maturity_pay():
+    start = date(2026, 1, 31)
+    quote = quote_deposit(DepositType.RECURRING, 7, Decimal("1234.57"), Decimal("7.25"), start)
+    for point in quote.cancellation:
+        deposit = Deposit(
+            deposit_type=DepositType.RECURRING,
+            term_months=7,
+            amount=Decimal("1234.57"),
+            interest_rate=Decimal("7.25"),
+            start_date=start,
+            maturity_date=quote.maturity_date,
+            installments_paid=min(point.month + 1, 7),
+        )
+        assert point.principal == principal_paid(deposit)
+        if point.cancelled_on < quote.maturity_date:
+            assert point.interest == accrued_interest(deposit, point.cancelled_on)
+            assert point.payout == point.principal + point.interest - early_exit_penalty(point.principal)
+        else:
+            assert (point.interest, point.payout) == maturity_payout(deposit)
+            assert (quote.interest, quote.maturity_amount) == maturity_payout(deposit)
+
+
+def test_recurring_quote_is_memoized(client, admin_token):
+    payload = {"deposit_type": "recurring", "term_months": 3, "amount": "1000", "interest_rate": "12"}
+    first = _quote(client, admin_token, **payload)
+    hits = quote_cache_info().hits
+
+    # The schedule is cached without the amount, so other amounts are hits too.
+    assert _quote(client, admin_token, **{**payload, "amount": "1000.00"}) == first
+    other = _quote(client, admin_token, **{**payload, "amount": "250"})
+    assert quote_cache_info().hits == hits + 2
+    assert Decimal(str(other["maturity_amount"])) == Decimal("765.00")
+    assert [item["number"] for item in first["installments"]] == [1, 2, 3]
+    assert Decimal(str(first["principal"])) == Decimal("3000.00")
+    assert Decimal(str(first["interest"])) == Decimal("60.00")
+
+
+def test_quote_requires_auth_and_validates_terms(client, admin_token):
+    payload = {"deposit_type": "fixed", "term_months": 0, "amount": "10", "interest_rate": "5"}
+    assert client.post("/api/v1/deposits/quote", json={**payload, "term_months": 12}).status_code == 401
+    response = client.post("/api/v1/deposits/quote", headers=_auth_header(admin_token), json=payload)
+    assert response.status_code == 422
@@ -0,0 +1,87 @@
+import asyncio
+from types import SimpleNamespace
+
+from app.core.config import settings
+from app.services.events import EventDispatcher
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_balance_changes_are_written_to_the_outbox_scoped_by_owner(client, customer, admin_token):
+    payer = customer(main=1000)
+    payee = customer(main=0)
+
+    transfer = client.post(
+        "/api/v1/transactions/",
+        headers=_auth_header(payer["token"]),
+        json={"from_account_id": payer["accounts"]["main"], "to_account_id": payee["accounts"]["main"], "amount": 250},
+    )
+    assert transfer.status_code == 200, transfer.text
+    transaction_id = transfer.json()["data"]["transaction_id"]
+
+    payer_events = client.get("/api/v1/events/", headers=_auth_header(payer["token"])).json()["data"]["items"]
+    payee_events = client.get("/api/v1/events/", headers=_auth_header(payee["token"])).json()["data"]["items"]
+
+    assert [(e["account_id"], e["payload"]["balance"]) for e in payer_events] == [(payer["accounts"]["main"], "750.00")]
+    assert [(e["account_id"], e["payload"]["balance"]) for e in payee_events] == [(payee["accounts"]["main"], "250.00")]
+    assert payer_events[0]["payload"]["transaction_id"] == transaction_id
+
+    resumed = client.get(
+        "/api/v1/events/",
+        headers=_auth_header(payer["token"]),
+        params={"after_id": payer_events[0]["id"]},
+    )
+    assert resumed.json()["data"]["items"] == []
+
+    admin_events = client.get(
+        "/api/v1/events/",
+        headers=_auth_header(admin_token),
+        params={"after_id": payer_events[0]["id"] - 1},
+    ).json()["data"]["items"]
+    assert {e["id"] for e in payer_events + payee_events} <= {e["id"] for e in admin_events}
+
+
+def test_dispatcher_fans_out_by_owner_and_closes_slow_subscribers():
+    async def scenario():
+        dispatcher = EventDispatcher()
+        owner = dispatcher.subscribe(user_id=1, is_admin=False)
+        stranger = dispatcher.subscribe(user_id=2, is_admin=False)
+        admin = dispatcher.subscribe(user_id=3, is_admin=True)
+
+        dispatcher.dispatch([SimpleNamespace(id=10, user_id=1), SimpleNamespace(id=10, user_id=1)])
+
+        assert owner.queue.qsize() == 1
+        assert stranger.queue.empty()
+        assert admin.queue.qsize() == 1
+        assert dispatcher.last_id == 10
+
+        for event_id in range(11, 11 + owner.queue.maxsize):
+            dispatcher.dispatch([SimpleNamespace(id=event_id, user_id=1)])
+        assert owner.queue.get_nowait() is None
+
+    asyncio.run(scenario())
+
+
+def test_dispatcher_delivers_late_commits_once_and_expires_gaps(monkeypatch):
+    async def scenario():
+        dispatcher = EventDispatcher()
+        owner = dispatcher.subscribe(user_id=1, is_admin=False)
+        dispatcher.dispatch([SimpleNamespace(id=5, user_id=1), SimpleNamespace(id=8, user_id=1)])
+        assert sorted(dispatcher._gaps) == [6, 7]
+
+        # 7 commits after 8: it is still delivered, once, and re-dispatching old ids is a no-op.
+        dispatcher.dispatch([SimpleNamespace(id=7, user_id=1)])
+        dispatcher.dispatch([SimpleNamespace(id=5, user_id=1), SimpleNamespace(id=7, user_id=1), SimpleNamespace(id=8, user_id=1)])
+        assert [owner.queue.get_nowait().id for _ in range(owner.queue.qsize())] == [5, 8, 7]
+        assert sorted(dispatcher._gaps) == [6] and dispatcher.last_id == 8
+        # A stream resuming from 8 re-reads the late 7.
+        assert dispatcher.late_ids(8) == [7] and dispatcher.late_ids(6) == []
+
+        # 6 never shows up (rolled back) and is forgotten after the gap timeout.
+        monkeypatch.setattr(settings, "event_gap_timeout_seconds", 0)
+        dispatcher._expire_gaps()
+        assert dispatcher._gaps == {} and dispatcher.late_ids(8) == []
+
+    asyncio.run(scenario())
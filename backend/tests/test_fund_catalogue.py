@@ -0,0 +1,85 @@
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlalchemy import update
+
+from app.core.database import SessionLocal
+from app.models import MutualFund
+from app.services.fund_catalogue import FundCatalogue, fund_catalogue
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _create_fund(client, admin_token: str, nav: str) -> int:
+    symbol = f"CAT{uuid4().hex[:8]}".upper()
+    response = client.post(
+        "/api/v1/mutual-funds/",
+        headers=_auth_header(admin_token),
+        json={"name": f"Fund {symbol}", "symbol": symbol, "nav": nav},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["data"]["fund_id"]
+
+
+def test_nav_update_is_visible_immediately_and_versioned(client, admin_token, customer):
+    fund_id = _create_fund(client, admin_token, "10")
+    user = customer(savings=1000)
+
+    listed = client.get("/api/v1/mutual-funds/", headers=_auth_header(user["token"])).json()["data"]["items"]
+    assert any(item["id"] == fund_id and item["nav_version"] == 1 for item in listed)
+
+    response = client.put(f"/api/v1/mutual-funds/{fund_id}", headers=_auth_header(admin_token), json={"nav": "12.5"})
+    assert response.status_code == 200, response.text
+
+    fund = client.get(f"/api/v1/mutual-funds/{fund_id}", headers=_auth_header(user["token"])).json()["data"]["fund"]
+    assert Decimal(str(fund["nav"])) == Decimal("12.5")
+    assert fund["nav_version"] == 2
+
+    response = client.post(
+        "/api/v1/mutual-funds/buy",
+        headers=_auth_header(user["token"]),
+        json={"account_id": user["accounts"]["savings"], "fund_id": fund_id, "amount": "125"},
+    )
+    assert response.status_code == 200, response.text
+    trade_id = response.json()["data"]["trade_id"]
+
+    trades = client.get("/api/v1/mutual-funds/trades", headers=_auth_header(user["token"])).json()["data"]["items"]
+    trade = next(item for item in trades if item["id"] == trade_id)
+    assert Decimal(str(trade["nav"])) == Decimal("12.5")
+    assert trade["nav_version"] == 2
+    assert Decimal(str(trade["units"])) == Decimal("10")
+
+
+def test_deactivated_fund_leaves_catalogue(client, admin_token, customer):
+    fund_id = _create_fund(client, admin_token, "10")
+    user = customer(savings=1000)
+
+    response = client.delete(f"/api/v1/mutual-funds/{fund_id}", headers=_auth_header(admin_token))
+    assert response.status_code == 200, response.text
+
+    listed = client.get("/api/v1/mutual-funds/", headers=_auth_header(user["token"])).json()["data"]["items"]
+    assert all(item["id"] != fund_id for item in listed)
+    response = client.post(
+        "/api/v1/mutual-funds/buy",
+        headers=_auth_header(user["token"]),
+        json={"account_id": user["accounts"]["savings"], "fund_id": fund_id, "amount": "100"},
+    )
+    assert response.status_code == 404
+
+
+def test_other_workers_reload_on_version_change(client, admin_token):
+    fund_id = _create_fund(client, admin_token, "10")
+    worker = FundCatalogue(check_interval_ms=0)
+    with SessionLocal() as db:
+        assert worker.fund(db, fund_id).nav == Decimal("10")
+
+        # A change made elsewhere is not seen until the shared version moves.
+        db.execute(update(MutualFund).where(MutualFund.id == fund_id).values(nav=Decimal("11")))
+        db.commit()
+        assert worker.fund(db, fund_id).nav == Decimal("10")
+
+        fund_catalogue.mark_changed(db)
+        db.commit()
+        assert worker.fund(db, fund_id).nav == Decimal("11")
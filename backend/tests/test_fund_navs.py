@@ -0,0 +1,119 @@
+import json
+from decimal import Decimal
+from uuid import uuid4
+
+from app.services import fund_navs
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _create_fund(client, admin_token: str, nav: str) -> tuple[int, str]:
+    symbol = f"NAV{uuid4().hex[:8]}".upper()
+    response = client.post(
+        "/api/v1/mutual-funds/",
+        headers=_auth_header(admin_token),
+        json={"name": f"Fund {symbol}", "symbol": symbol, "nav": nav},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["data"]["fund_id"], symbol
+
+
+def _fund_nav(client, token: str, fund_id: int) -> Decimal:
+    response = client.get(f"/api/v1/mutual-funds/{fund_id}", headers=_auth_header(token))
+    return Decimal(str(response.json()["data"]["fund"]["nav"]))
+
+
+def _history(client, token: str, fund_id: int, **params) -> list[tuple[str, Decimal]]:
+    response = client.get(f"/api/v1/mutual-funds/{fund_id}/navs", params=params, headers=_auth_header(token))
+    assert response.status_code == 200, response.text
+    return [(item["nav_date"], Decimal(str(item["nav"]))) for item in response.json()["data"]["items"]]
+
+
+def test_csv_upload_updates_navs_and_history(client, admin_token):
+    first, first_symbol = _create_fund(client, admin_token, "10")
+    second, _ = _create_fund(client, admin_token, "20")
+    csv_body = (
+        "symbol,fund_id,nav,nav_date\n"
+        f"{first_symbol.lower()},,11.5,2026-03-02\n"
+        f"{first_symbol},,11.25,2026-03-01\n"
+        f",{second},21.0001,2026-03-02\n"
+    )
+
+    response = client.post(
+        "/api/v1/mutual-funds/navs/upload",
+        headers=_auth_header(admin_token),
+        files={"file": ("navs.csv", csv_body, "text/csv")},
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["data"] == {"records": 3, "funds_updated": 2, "nav_dates": ["2026-03-01", "2026-03-02"]}
+
+    assert _fund_nav(client, admin_token, first) == Decimal("11.5")
+    assert _fund_nav(client, admin_token, second) == Decimal("21.0001")
+    assert _history(client, admin_token, first) == [("2026-03-02", Decimal("11.5")), ("2026-03-01", Decimal("11.25"))]
+    assert _history(client, admin_token, first, date_to="2026-03-01") == [("2026-03-01", Decimal("11.25"))]
+
+    backfill = json.dumps([{"fund_id": first, "nav": "9.75", "nav_date": "2026-02-27"}])
+    response = client.post(
+        "/api/v1/mutual-funds/navs/upload",
+        headers=_auth_header(admin_token),
+        files={"file": ("navs.json", backfill, "application/json")},
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["data"]["funds_updated"] == 0
+    assert _fund_nav(client, admin_token, first) == Decimal("11.5")
+
+
+def test_invalid_upload_is_rejected_without_changes(client, admin_token):
+    fund_id, symbol = _create_fund(client, admin_token, "10")
+    ndjson_body = "\n".join(
+        [
+            json.dumps({"symbol": symbol, "nav": "12", "nav_date": "2026-03-02"}),
+            json.dumps({"symbol": "NOPE-MISSING", "nav": "5"}),
+            json.dumps({"fund_id": fund_id, "nav": "-1"}),
+        ]
+    )
+
+    response = client.post(
+        "/api/v1/mutual-funds/navs/upload",
+        headers=_auth_header(admin_token),
+        files={"file": ("navs.ndjson", ndjson_body, "application/x-ndjson")},
+    )
+    assert response.status_code == 422
+    assert response.json()["data"]["errors"][0]["loc"] == ["file", 3, "nav"]
+
+    response = client.post(
+        "/api/v1/mutual-funds/navs/upload",
+        headers=_auth_header(admin_token),
+        files={"file": ("navs.ndjson", "\n".join(ndjson_body.splitlines()[:2]), "application/x-ndjson")},
+    )
+    assert response.status_code == 422
+    assert response.json()["data"]["errors"][0]["msg"] == "Unknown fund"
+
+    assert _fund_nav(client, admin_token, fund_id) == Decimal("10")
+    assert _history(client, admin_token, fund_id) == []
+
+
+def test_upload_is_written_in_chunks_and_rolled_back_on_a_late_error(client, admin_token, monkeypatch):
+    monkeypatch.setattr(fund_navs, "_CHUNK_SIZE", 2)
+    fund_id, symbol = _create_fund(client, admin_token, "10")
+    rows = [json.dumps({"fund_id": fund_id, "nav": f"1{day}", "nav_date": f"2026-04-0{day}"}) for day in range(1, 6)]
+
+    def _upload(body: str):
+        return client.post(
+            "/api/v1/mutual-funds/navs/upload",
+            headers=_auth_header(admin_token),
+            files={"file": ("navs.ndjson", body, "application/x-ndjson")},
+        )
+
+    response = _upload("\n".join([*rows, json.dumps({"fund_id": fund_id, "nav": "0"})]))
+    assert response.status_code == 422
+    assert response.json()["data"]["errors"][0]["loc"] == ["file", 6, "nav"]
+    assert _history(client, admin_token, fund_id) == []
+
+    response = _upload("\n".join(rows))
+    assert response.status_code == 200, response.text
+    assert response.json()["data"]["records"] == 5
+    assert len(_history(client, admin_token, fund_id)) == 5
+    assert _fund_nav(client, admin_token, fund_id) == Decimal("15")
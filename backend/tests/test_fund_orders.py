@@ -0,0 +1,155 @@
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import FundOrderStatus, FundTradeType, MutualFundHolding, MutualFundTrade, Transaction
+from app.services.fund_orders import execute_pending_orders
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def order_book(monkeypatch):
+    monkeypatch.setattr(settings, "fund_order_mode", "order_book")
+
+
+def _create_fund(client, admin_token: str, nav: str) -> int:
+    symbol = f"OB{uuid4().hex[:8]}".upper()
+    response = client.post(
+        "/api/v1/mutual-funds/",
+        headers=_auth_header(admin_token),
+        json={"name": f"Fund {symbol}", "symbol": symbol, "nav": nav},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["data"]["fund_id"]
+
+
+def _order(client, owner: dict, side: str, fund_id: int, **quantity) -> int:
+    response = client.post(
+        f"/api/v1/mutual-funds/{side}",
+        headers=_auth_header(owner["token"]),
+        json={"account_id": owner["accounts"]["main"], "fund_id": fund_id, **quantity},
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["data"]["status"] == "pending"
+    return response.json()["data"]["order_id"]
+
+
+def _orders(client, owner: dict) -> dict[int, dict]:
+    response = client.get("/api/v1/mutual-funds/orders", headers=_auth_header(owner["token"]))
+    assert response.status_code == 200, response.text
+    return {item["id"]: item for item in response.json()["data"]["items"]}
+
+
+def _balance(client, owner: dict) -> Decimal:
+    response = client.get(f"/api/v1/accounts/{owner['accounts']['main']}/balance", headers=_auth_header(owner["token"]))
+    return Decimal(str(response.json()["data"]["balance"]["balance"]))
+
+
+def _units(owner: dict, fund_id: int) -> Decimal:
+    with SessionLocal() as session:
+        holding = session.execute(
+            select(MutualFundHolding).where(
+                MutualFundHolding.account_id == owner["accounts"]["main"], MutualFundHolding.fund_id == fund_id
+            )
+        ).scalar_one_or_none()
+        return holding.units if holding else Decimal("0")
+
+
+def test_cutoff_nets_orders_per_account(client, customer, admin_token, order_book):
+    owner = customer(main=1000)
+    held = _create_fund(client, admin_token, "10")
+    target = _create_fund(client, admin_token, "20")
+
+    response = client.post(
+        "/api/v1/mutual-funds/buy",
+        headers=_auth_header(owner["token"]),
+        json={"account_id": owner["accounts"]["main"], "fund_id": held, "amount": 1000},
+    )
+    first_buy = response.json()["data"]["order_id"]
+    assert _balance(client, owner) == Decimal("1000")
+
+    assert execute_pending_orders()["executed"] >= 1
+    assert _balance(client, owner) == Decimal("0")
+    assert _units(owner, held) == Decimal("100")
+
+    big_buy = _order(client, owner, "buy", target, amount=900)
+    sell_all = _order(client, owner, "sell", held, units=100)
+    oversell = _order(client, owner, "sell", held, units=1)
+    too_big = _order(client, owner, "buy", target, amount=200)
+    cancelled = _order(client, owner, "buy", target, amount=50)
+
+    response = client.put(f"/api/v1/mutual-funds/orders/{cancelled}/cancel", headers=_auth_header(owner["token"]))
+    assert response.status_code == 200, response.text
+
+    response = client.post("/api/v1/mutual-funds/orders/execute", headers=_auth_header(admin_token))
+    assert response.status_code == 200, response.text
+
+    orders = _orders(client, owner)
+    assert orders[first_buy]["status"] == "executed"
+    assert orders[sell_all]["status"] == "executed"
+    assert Decimal(str(orders[sell_all]["executed_amount"])) == Decimal("1000")
+    assert orders[big_buy]["status"] == "executed"
+    assert Decimal(str(orders[big_buy]["executed_units"])) == Decimal("45")
+    assert orders[oversell]["status"] == "rejected"
+    assert orders[oversell]["failure_reason"] == "Insufficient holding units"
+    assert orders[too_big]["status"] == "rejected"
+    assert orders[too_big]["failure_reason"] == "Insufficient account balance"
+    assert orders[cancelled]["status"] == "cancelled"
+
+    assert _balance(client, owner) == Decimal("100")
+    assert _units(owner, held) == Decimal("0")
+    assert _units(owner, target) == Decimal("45")
+
+    response = client.put(f"/api/v1/mutual-funds/orders/{cancelled}/cancel", headers=_auth_header(owner["token"]))
+    assert response.status_code == 400
+
+
+def test_rerun_does_not_execute_orders_twice(client, customer, admin_token, order_book):
+    owner = customer(main=500)
+    fund_id = _create_fund(client, admin_token, "5")
+    order_id = _order(client, owner, "buy", fund_id, amount=100)
+
+    execute_pending_orders()
+    execute_pending_orders()
+
+    assert _orders(client, owner)[order_id]["status"] == FundOrderStatus.EXECUTED.value
+    assert _balance(client, owner) == Decimal("400")
+    assert _units(owner, fund_id) == Decimal("20")
+
+    response = client.post("/api/v1/mutual-funds/orders/execute", headers=_auth_header(owner["token"]))
+    assert response.status_code == 403
+
+
+def test_cutoff_nets_each_fund_into_one_trade(client, customer, admin_token, order_book):
+    owner = customer(main=1000)
+    fund_id = _create_fund(client, admin_token, "10")
+    _order(client, owner, "buy", fund_id, amount=500)
+    execute_pending_orders()
+
+    netted = [
+        _order(client, owner, "sell", fund_id, units=20),
+        _order(client, owner, "buy", fund_id, amount=300),
+        _order(client, owner, "buy", fund_id, amount=100),
+    ]
+    execute_pending_orders()
+
+    orders = _orders(client, owner)
+    assert [Decimal(str(orders[order_id]["executed_amount"])) for order_id in netted] == [Decimal("200"), Decimal("300"), Decimal("100")]
+    trade_ids = {orders[order_id]["trade_id"] for order_id in netted}
+    assert len(trade_ids) == 1
+    with SessionLocal() as session:
+        trade = session.get(MutualFundTrade, trade_ids.pop())
+        assert (trade.trade_type, trade.units, trade.amount) == (FundTradeType.BUY, Decimal("20"), Decimal("200"))
+        cash = session.execute(
+            select(Transaction).where(Transaction.from_account_id == owner["accounts"]["main"]).order_by(Transaction.id.desc())
+        ).scalars().first()
+        assert cash.amount == Decimal("200") and "net of 3 orders" in cash.description
+    assert _balance(client, owner) == Decimal("300")
+    assert _units(owner, fund_id) == Decimal("70")
@@ -0,0 +1,59 @@
+import re
+
+from app.core.metrics import HTTP_REQUESTS, Histogram, MetricsRegistry
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _sample(body: str, name: str, **labels: str) -> float:
+    for line in body.splitlines():
+        match = re.fullmatch(rf"{re.escape(name)}(?:\{{(.*)\}})? (\S+)", line)
+        if not match:
+            continue
+        found = dict(re.findall(r'(\w+)="([^"]*)"', match.group(1) or ""))
+        if found == labels:
+            return float(match.group(2))
+    raise AssertionError(f"{name}{labels} not exported")
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    latency = registry.histogram("demo_seconds", "Demo latency.", ("route",), buckets=(0.1, 1.0))
+    assert isinstance(latency, Histogram)
+    for value in (0.05, 0.5, 0.5, 3.0):
+        latency.observe(value, route="/a")
+
+    body = registry.render()
+    assert "# TYPE demo_seconds histogram" in body
+    assert _sample(body, "demo_seconds_bucket", route="/a", le="0.1") == 1
+    assert _sample(body, "demo_seconds_bucket", route="/a", le="1") == 3
+    assert _sample(body, "demo_seconds_bucket", route="/a", le="+Inf") == 4
+    assert _sample(body, "demo_seconds_count", route="/a") == 4
+    assert _sample(body, "demo_seconds_sum", route="/a") == 4.05
+
+
+def test_metrics_endpoint_exports_route_db_pool_and_bcrypt_series(client, customer):
+    owner = customer(savings=100)
+    route = "/api/v1/accounts/{account_id}"
+    before = HTTP_REQUESTS.value(method="GET", route=route, status="200")
+    for _ in range(2):
+        response = client.get(f"/api/v1/accounts/{owner['accounts']['savings']}", headers=_auth_header(owner["token"]))
+        assert response.status_code == 200
+    assert client.get("/api/v1/accounts/999999999", headers=_auth_header(owner["token"])).status_code == 404
+    assert client.get("/no/such/path").status_code == 404
+
+    body = client.get("/metrics").text
+    assert _sample(body, "banking_http_requests_total", method="GET", route=route, status="200") == before + 2
+    assert _sample(body, "banking_http_requests_total", method="GET", route=route, status="404") >= 1
+    assert _sample(body, "banking_http_requests_total", method="GET", route="<unmatched>", status="404") >= 1
+    assert _sample(body, "banking_http_request_duration_seconds_count", method="GET", route=route) >= 2
+    # The scrape itself is the only request in flight.
+    assert _sample(body, "banking_http_requests_in_flight", method="GET") == 1
+    assert _sample(body, "banking_db_query_duration_seconds_count", statement="SELECT") > 0
+    assert _sample(body, "banking_db_pool_checkout_wait_seconds_count") > 0
+    assert _sample(body, "banking_db_pool_size") >= 1
+    assert _sample(body, "banking_db_pool_overflow") >= 0
+    assert _sample(body, "banking_password_hash_duration_seconds_count", operation="hash") > 0
+    assert _sample(body, "banking_password_hash_duration_seconds_count", operation="verify") > 0
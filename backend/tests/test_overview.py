@@ -0,0 +1,88 @@
+from decimal import Decimal
+from uuid import uuid4
+
+from sqlalchemy import event
+
+from app.core.database import SessionLocal, engine
+from app.models import User
+from app.services.account_overview import account_overview
+
+OVERVIEW_QUERY_BUDGET = 6  # account, cards, deposits, holdings, funds, transactions
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _post(client, token: str, path: str, payload: dict) -> dict:
+    response = client.post(path, headers=_auth_header(token), json=payload)
+    assert response.status_code == 200, response.text
+    return response.json()["data"]
+
+
+def _populate(client, admin_token: str, owner: dict, rounds: int) -> None:
+    symbol = f"OV{uuid4().hex[:8]}".upper()
+    fund_id = _post(client, admin_token, "/api/v1/mutual-funds/", {"name": f"Fund {symbol}", "symbol": symbol, "nav": "10"})["fund_id"]
+    main, spare = owner["accounts"]["main"], owner["accounts"]["spare"]
+    for _ in range(rounds):
+        _post(client, owner["token"], "/api/v1/debit-cards/", {"account_id": main})
+        _post(
+            client,
+            owner["token"],
+            "/api/v1/deposits/",
+            {"account_id": main, "deposit_type": "fixed", "term_months": 12, "amount": 100, "interest_rate": "6.5"},
+        )
+        _post(client, owner["token"], "/api/v1/mutual-funds/buy", {"account_id": main, "fund_id": fund_id, "amount": 100})
+        _post(client, owner["token"], "/api/v1/transactions/", {"from_account_id": main, "to_account_id": spare, "amount": 5})
+        _post(client, owner["token"], "/api/v1/transactions/", {"from_account_id": spare, "to_account_id": main, "amount": 2})
+
+
+def _count_queries(user_id: int, account_id: int) -> int:
+    with SessionLocal() as db:
+        user = db.get(User, user_id)
+        connection = db.connection()
+        statements = []
+
+        def _record(conn, _cursor, statement, *_):
+            if conn is connection:
+                statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            account_overview(db, account_id, user, 10)
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+    return len(statements)
+
+
+def test_overview_returns_every_section(client, admin_token, customer):
+    owner = customer(main=10_000, spare=100)
+    other = customer(main=0)
+    _populate(client, admin_token, owner, rounds=2)
+
+    response = client.get(
+        f"/api/v1/accounts/{owner['accounts']['main']}/overview", headers=_auth_header(owner["token"]), params={"transactions": 3}
+    )
+    assert response.status_code == 200, response.text
+    data = response.json()["data"]
+    assert data["account"]["id"] == owner["accounts"]["main"]
+    assert len(data["debit_cards"]) == 2
+    assert [deposit["status"] for deposit in data["deposits"]] == ["active", "active"]
+    assert len(data["holdings"]["positions"]) == 1
+    assert Decimal(str(data["holdings"]["totals"]["market_value"])) == Decimal("200.00")
+    ids = [txn["id"] for txn in data["transactions"]]
+    assert len(ids) == 3 and ids == sorted(ids, reverse=True)
+    assert data["transactions"][0]["from_account_id"] == owner["accounts"]["spare"]
+
+    forbidden = client.get(f"/api/v1/accounts/{owner['accounts']['main']}/overview", headers=_auth_header(other["token"]))
+    assert forbidden.status_code == 403
+
+
+def test_overview_query_count_does_not_grow_with_data(client, admin_token, customer):
+    owner = customer(main=10_000, spare=100)
+    _populate(client, admin_token, owner, rounds=1)
+    small = _count_queries(owner["user_id"], owner["accounts"]["main"])
+    _populate(client, admin_token, owner, rounds=4)
+    large = _count_queries(owner["user_id"], owner["accounts"]["main"])
+
+    assert small == large == OVERVIEW_QUERY_BUDGET
@@ -0,0 +1,86 @@
+from decimal import Decimal
+from uuid import uuid4
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _create_fund(client, admin_token: str, nav: str) -> int:
+    symbol = f"PF{uuid4().hex[:8]}".upper()
+    response = client.post(
+        "/api/v1/mutual-funds/",
+        headers=_auth_header(admin_token),
+        json={"name": f"Fund {symbol}", "symbol": symbol, "nav": nav},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["data"]["fund_id"]
+
+
+def _buy(client, owner: dict, account: str, fund_id: int, amount: int) -> None:
+    response = client.post(
+        "/api/v1/mutual-funds/buy",
+        headers=_auth_header(owner["token"]),
+        json={"account_id": owner["accounts"][account], "fund_id": fund_id, "amount": amount},
+    )
+    assert response.status_code == 200, response.text
+
+
+def _money(value) -> Decimal:
+    return Decimal(str(value))
+
+
+def test_portfolio_values_positions_and_groups(client, customer, admin_token):
+    owner = customer(main=5000, savings=5000)
+    growth = _create_fund(client, admin_token, "10")
+    income = _create_fund(client, admin_token, "20")
+    _buy(client, owner, "main", growth, 1000)
+    _buy(client, owner, "savings", growth, 500)
+    _buy(client, owner, "savings", income, 500)
+
+    response = client.put(f"/api/v1/mutual-funds/{growth}", headers=_auth_header(admin_token), json={"nav": "12"})
+    assert response.status_code == 200, response.text
+
+    response = client.get("/api/v1/mutual-funds/portfolio", headers=_auth_header(owner["token"]))
+    assert response.status_code == 200, response.text
+    data = response.json()["data"]
+
+    assert _money(data["totals"]["market_value"]) == Decimal("2300.00")
+    assert _money(data["totals"]["cost"]) == Decimal("2000.00")
+    assert _money(data["totals"]["unrealized_pnl"]) == Decimal("300.00")
+    assert _money(data["totals"]["unrealized_pnl_pct"]) == Decimal("0.15")
+
+    by_fund = {item["fund_id"]: item for item in data["by_fund"]}
+    assert _money(by_fund[growth]["units"]) == Decimal("150")
+    assert _money(by_fund[growth]["market_value"]) == Decimal("1800.00")
+    assert _money(by_fund[growth]["allocation"]) == Decimal("0.7826")
+
+    by_account = {item["account_id"]: item for item in data["by_account"]}
+    assert _money(by_account[owner["accounts"]["savings"]]["market_value"]) == Decimal("1100.00")
+    assert len(data["positions"]) == 3
+
+
+def test_portfolio_permissions_and_firm_summary(client, customer, admin_token):
+    owner = customer(main=5000)
+    stranger = customer(main=0)
+    fund_id = _create_fund(client, admin_token, "25")
+    _buy(client, owner, "main", fund_id, 1000)
+
+    response = client.get(
+        "/api/v1/mutual-funds/portfolio", params={"user_id": owner["user_id"]}, headers=_auth_header(stranger["token"])
+    )
+    assert response.status_code == 403
+    response = client.get("/api/v1/mutual-funds/portfolio/summary", headers=_auth_header(owner["token"]))
+    assert response.status_code == 403
+
+    response = client.get(
+        "/api/v1/mutual-funds/portfolio", params={"user_id": owner["user_id"]}, headers=_auth_header(admin_token)
+    )
+    assert _money(response.json()["data"]["totals"]["market_value"]) == Decimal("1000.00")
+
+    response = client.get("/api/v1/mutual-funds/portfolio/summary", headers=_auth_header(admin_token))
+    assert response.status_code == 200, response.text
+    fund = next(item for item in response.json()["data"]["by_fund"] if item["fund_id"] == fund_id)
+    assert fund["positions"] == 1
+    assert _money(fund["units"]) == Decimal("40")
+    assert _money(fund["market_value"]) == Decimal("1000.00")
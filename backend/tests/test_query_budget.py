@@ -0,0 +1,56 @@
+from app.core.config import settings
+from app.core.instrumentation import QueryLog
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_query_log_flags_identical_statements_only():
+    log = QueryLog("GET", "/demo")
+    log.statements += [("SELECT a FROM t WHERE id = ?", "(1,)"), ("SELECT a FROM t WHERE id = ?", "(2,)")]
+    assert log.repeated() == []
+    log.statements.append(("SELECT a FROM t WHERE id = ?", "(1,)"))
+    assert log.count == 3 and log.repeated() == [("SELECT a FROM t WHERE id = ?", 2)]
+
+
+def test_debug_mode_reports_query_count_header(client, customer, monkeypatch):
+    owner = customer(main=10)
+    url = f"/api/v1/accounts/{owner['accounts']['main']}"
+    assert "x-db-queries" not in client.get(url, headers=_auth_header(owner["token"])).headers
+
+    monkeypatch.setattr(settings, "debug", True)
+    response = client.get(url, headers=_auth_header(owner["token"]))
+    assert response.status_code == 200
+    # The current user and the account.
+    assert response.headers["x-db-queries"] == "2"
+
+
+def test_detail_endpoints_load_owner_with_the_row(client, customer, query_budget):
+    owner = customer(main=1000, spare=0)
+    headers = _auth_header(owner["token"])
+    created = client.post("/api/v1/debit-cards/", headers=headers, json={"account_id": owner["accounts"]["main"]}).json()["data"]
+    transfer = client.post(
+        "/api/v1/transactions/",
+        headers=headers,
+        json={"from_account_id": owner["accounts"]["main"], "to_account_id": owner["accounts"]["spare"], "amount": 5},
+    ).json()["data"]
+    deposit = client.post(
+        "/api/v1/deposits/",
+        headers=headers,
+        json={"account_id": owner["accounts"]["main"], "deposit_type": "fixed", "term_months": 12, "amount": 100, "interest_rate": "5"},
+    ).json()["data"]
+
+    with query_budget(2):
+        assert client.get(f"/api/v1/debit-cards/{created['card_id']}", headers=headers).status_code == 200
+        assert client.get(f"/api/v1/transactions/{transfer['transaction_id']}", headers=headers).status_code == 200
+        assert client.get(f"/api/v1/deposits/{deposit['deposit_id']}", headers=headers).status_code == 200
+    with query_budget(5):
+        activated = client.put("/api/v1/debit-cards/activate", headers=headers, json={"card_id": created["card_id"], "otp": created["otp"]})
+        assert activated.status_code == 200
+    with query_budget(8):
+        assert client.put(f"/api/v1/deposits/{deposit['deposit_id']}/cancel", headers=headers).status_code == 200
+
+    other = customer(main=0)
+    assert client.get(f"/api/v1/transactions/{transfer['transaction_id']}", headers=_auth_header(other["token"])).status_code == 403
+    assert client.get(f"/api/v1/deposits/{deposit['deposit_id']}", headers=_auth_header(other["token"])).status_code == 403
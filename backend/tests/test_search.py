@@ -0,0 +1,131 @@
+from uuid import uuid4
+
+from sqlalchemy import func, insert, select
+
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
+from app.models import Transaction, TransactionType
+from app.services import search
+from app.services.search import TRANSACTION, SearchIndex
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _transfer(client, owner: dict, description: str) -> int:
+    response = client.post(
+        "/api/v1/transactions/",
+        headers=_auth_header(owner["token"]),
+        json={
+            "from_account_id": owner["accounts"]["main"],
+            "to_account_id": owner["accounts"]["spare"],
+            "amount": 5,
+            "description": description,
+        },
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["data"]["transaction_id"]
+
+
+def test_search_ranks_and_scopes_transactions(client, customer, admin_token):
+    owner = customer(main=1000, spare=0)
+    stranger = customer(main=1000, spare=0)
+    word = f"acme{uuid4().hex[:8]}"
+    weak = _transfer(client, owner, f"invoice for {word}")
+    strong = _transfer(client, owner, f"{word} refund {word} {word}")
+    _transfer(client, owner, "unrelated payment")
+
+    response = client.get("/api/v1/search/", params={"q": word}, headers=_auth_header(owner["token"]))
+    assert response.status_code == 200, response.text
+    ids = [item["transaction"]["id"] for item in response.json()["data"]["items"]]
+    assert ids == [strong, weak]
+
+    response = client.get("/api/v1/search/", params={"q": word, "page_size": 1}, headers=_auth_header(owner["token"]))
+    data = response.json()["data"]
+    assert [item["transaction"]["id"] for item in data["items"]] == [strong]
+    assert data["has_more"] is True
+
+    response = client.get("/api/v1/search/", params={"q": word}, headers=_auth_header(stranger["token"]))
+    assert response.json()["data"]["items"] == []
+
+    response = client.get("/api/v1/search/", params={"q": word}, headers=_auth_header(admin_token))
+    assert len(response.json()["data"]["items"]) == 2
+
+
+def test_search_audit_logs_is_admin_only(client, customer, admin_token):
+    owner = customer(main=1000, spare=0)
+    transaction_id = _transfer(client, owner, "audit search")
+    reference = str(owner["accounts"]["spare"])
+
+    response = client.get("/api/v1/search/", params={"q": "transfer", "source": "audit_logs"}, headers=_auth_header(owner["token"]))
+    assert response.status_code == 403
+
+    response = client.get(
+        "/api/v1/search/", params={"q": f"transfer {reference}", "source": "audit_logs"}, headers=_auth_header(admin_token)
+    )
+    assert response.status_code == 200, response.text
+    entity_ids = [item["audit_log"]["entity_id"] for item in response.json()["data"]["items"]]
+    assert transaction_id in entity_ids
+
+
+def test_token_index_follows_inserts_updates_and_deletes(client, customer, monkeypatch):
+    index = SearchIndex(backend="tokens", batch_size=50)
+    monkeypatch.setattr(search, "search_index", index)
+    owner = customer(main=1000, spare=0)
+    word = f"globex{uuid4().hex[:8]}"
+    transaction_id = _transfer(client, owner, f"paid {word}")
+    with SessionLocal() as session:
+        # Searching does not index; the row shows up after the next sync.
+        assert index.search(session, TRANSACTION, word) == []
+
+    index.sync(engine)
+    assert index.sync(engine) == 0
+    with SessionLocal() as session:
+        assert [item.id for item, _ in index.search(session, TRANSACTION, word)] == [transaction_id]
+
+        session.get(Transaction, transaction_id).description = f"renamed {word}x"
+        session.commit()
+        assert index.search(session, TRANSACTION, word) == []
+        assert [item.id for item, _ in index.search(session, TRANSACTION, f"{word}x renamed")] == [transaction_id]
+
+        session.delete(session.get(Transaction, transaction_id))
+        session.commit()
+        assert index.search(session, TRANSACTION, f"{word}x") == []
+
+
+def test_token_index_picks_up_late_commits_until_the_gap_expires(client, monkeypatch):
+    index = SearchIndex(backend="tokens", batch_size=50)
+    monkeypatch.setattr(search, "search_index", index)
+    index.sync(engine)
+    word = f"initech{uuid4().hex[:8]}"
+
+    def _insert(transaction_id: int, description: str) -> None:
+        with engine.begin() as conn:
+            conn.execute(
+                insert(Transaction).values(
+                    id=transaction_id,
+                    transaction_type=TransactionType.ADJUSTMENT,
+                    amount=1,
+                    description=description,
+                    reference=uuid4().hex[:20],
+                )
+            )
+
+    with engine.connect() as conn:
+        base = conn.execute(select(func.max(Transaction.id))).scalar_one()
+    # base + 1 and base + 2 are allocated but commit after base + 3.
+    _insert(base + 3, f"{word} third")
+    index.sync(engine)
+    assert [source_id for source_id in sorted(index._gaps[TRANSACTION]) if source_id > base] == [base + 1, base + 2]
+
+    _insert(base + 1, f"{word} first")
+    index.sync(engine)
+    with SessionLocal() as session:
+        assert sorted(item.id for item, _ in index.search(session, TRANSACTION, word)) == [base + 1, base + 3]
+    assert [source_id for source_id in sorted(index._gaps[TRANSACTION]) if source_id > base] == [base + 2]
+
+    # base + 2 rolled back: it is dropped once the horizon passes.
+    monkeypatch.setattr(settings, "search_index_gap_timeout_seconds", 0)
+    index.sync(engine)
+    assert index._gaps[TRANSACTION] == {}
@@ -0,0 +1,125 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.models import SipFrequency, SipInstruction
+from app.services import sips
+from app.services.sips import next_run_after
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _today() -> str:
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def _create_fund(client, admin_token: str, nav: str) -> int:
+    symbol = f"SIP{uuid4().hex[:8]}".upper()
+    response = client.post(
+        "/api/v1/mutual-funds/",
+        headers=_auth_header(admin_token),
+        json={"name": f"Fund {symbol}", "symbol": symbol, "nav": nav},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["data"]["fund_id"]
+
+
+def _create_sip(client, user: dict, fund_id: int, amount: str, frequency: str = "monthly") -> dict:
+    response = client.post(
+        "/api/v1/mutual-funds/sips",
+        headers=_auth_header(user["token"]),
+        json={"account_id": user["accounts"]["savings"], "fund_id": fund_id, "amount": amount, "frequency": frequency},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["data"]["sip"]
+
+
+def _executions(client, token: str, sip_id: int) -> list[dict]:
+    response = client.get(f"/api/v1/mutual-funds/sips/{sip_id}/executions", headers=_auth_header(token))
+    assert response.status_code == 200, response.text
+    return response.json()["data"]["items"]
+
+
+def _balance(client, token: str, account_id: int) -> Decimal:
+    response = client.get(f"/api/v1/accounts/{account_id}/balance", headers=_auth_header(token))
+    return Decimal(str(response.json()["data"]["balance"]["balance"]))
+
+
+def test_next_run_keeps_day_of_month():
+    instruction = SipInstruction(frequency=SipFrequency.MONTHLY, start_date=date(2026, 1, 31), next_run_date=date(2026, 1, 31))
+    instruction.next_run_date = next_run_after(instruction, date(2026, 1, 31))
+    assert instruction.next_run_date == date(2026, 2, 28)
+    assert next_run_after(instruction, date(2026, 2, 28)) == date(2026, 3, 31)
+    assert next_run_after(instruction, date(2026, 5, 1)) == date(2026, 5, 31)
+
+    weekly = SipInstruction(frequency=SipFrequency.WEEKLY, start_date=date(2026, 3, 2), next_run_date=date(2026, 3, 2))
+    assert next_run_after(weekly, date(2026, 3, 2)) == date(2026, 3, 9)
+
+
+def test_run_executes_due_sips_once_and_records_failures(client, admin_token, customer):
+    fund_id = _create_fund(client, admin_token, "10")
+    funded = customer(savings=1000)
+    broke = customer(savings=100)
+    good = _create_sip(client, funded, fund_id, "250")
+    bad = _create_sip(client, broke, fund_id, "250", frequency="weekly")
+
+    for _ in range(2):
+        response = client.post("/api/v1/mutual-funds/sips/run", params={"run_date": _today()}, headers=_auth_header(admin_token))
+        assert response.status_code == 200, response.text
+
+    executions = _executions(client, funded["token"], good["id"])
+    assert [item["status"] for item in executions] == ["executed"]
+    assert Decimal(str(executions[0]["units"])) == Decimal("25")
+    assert _balance(client, funded["token"], funded["accounts"]["savings"]) == Decimal("750")
+
+    failures = _executions(client, broke["token"], bad["id"])
+    assert [(item["status"], item["failure_reason"]) for item in failures] == [("failed", "Insufficient account balance")]
+    assert _balance(client, broke["token"], broke["accounts"]["savings"]) == Decimal("100")
+
+    items = client.get("/api/v1/mutual-funds/sips", headers=_auth_header(broke["token"])).json()["data"]["items"]
+    assert [(item["id"], item["last_run_date"]) for item in items] == [(bad["id"], _today())]
+    assert items[0]["next_run_date"] > _today()
+
+
+def test_interrupted_run_resumes_without_double_execution(client, admin_token, customer, monkeypatch):
+    fund_id = _create_fund(client, admin_token, "10")
+    users = [customer(savings=1000) for _ in range(3)]
+    created = [_create_sip(client, user, fund_id, "100") for user in users]
+    failing_id = created[1]["id"]
+
+    real_settle = sips.settle
+
+    def _flaky_settle(db, requests):
+        requests = list(requests)
+        if any(request.key == failing_id for request in requests):
+            raise RuntimeError("worker died")
+        return real_settle(db, requests)
+
+    monkeypatch.setattr(sips, "settle", _flaky_settle)
+    with pytest.raises(RuntimeError):
+        sips.run_due_sips(date.fromisoformat(_today()), chunk_size=1)
+    assert len(_executions(client, users[0]["token"], created[0]["id"])) == 1
+    assert _executions(client, users[1]["token"], created[1]["id"]) == []
+
+    monkeypatch.setattr(sips, "settle", real_settle)
+    sips.run_due_sips(date.fromisoformat(_today()), chunk_size=1)
+    for user, sip in zip(users, created):
+        assert [item["status"] for item in _executions(client, user["token"], sip["id"])] == ["executed"]
+        assert _balance(client, user["token"], user["accounts"]["savings"]) == Decimal("900")
+
+
+def test_cancelled_sip_is_not_executed(client, admin_token, customer):
+    fund_id = _create_fund(client, admin_token, "10")
+    user = customer(savings=1000)
+    sip = _create_sip(client, user, fund_id, "100")
+
+    response = client.put(f"/api/v1/mutual-funds/sips/{sip['id']}/cancel", headers=_auth_header(user["token"]))
+    assert response.status_code == 200, response.text
+    client.post("/api/v1/mutual-funds/sips/run", params={"run_date": _today()}, headers=_auth_header(admin_token))
+
+    assert _executions(client, user["token"], sip["id"]) == []
+    assert _balance(client, user["token"], user["accounts"]["savings"]) == Decimal("1000")
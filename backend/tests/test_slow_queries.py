@@ -0,0 +1,46 @@
+import re
+
+from app.core.config import settings
+from app.core.slow_queries import normalize_sql, slow_query_log
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_normalize_sql_groups_one_query_shape():
+    assert normalize_sql("SELECT *\n  FROM t WHERE a = 'x''y' AND b IN (?, ?, ?) AND c = 42") == (
+        "SELECT * FROM t WHERE a = ? AND b IN (?, ...) AND c = ?"
+    )
+    assert normalize_sql("SELECT t1.a::text FROM t1 WHERE id = %(id_1)s OR id = :id OR id = $1") == (
+        "SELECT t1.a::text FROM t1 WHERE id = ? OR id = ? OR id = ?"
+    )
+
+
+def test_slow_queries_are_aggregated_with_endpoint_and_plan(client, customer, admin_token, monkeypatch):
+    owner = customer(main=100)
+    slow_query_log.reset()
+    monkeypatch.setattr(settings, "slow_query_threshold_ms", 0.000001)
+    for _ in range(2):
+        assert client.get("/api/v1/transactions/", headers=_auth_header(owner["token"])).status_code == 200
+    monkeypatch.setattr(settings, "slow_query_threshold_ms", 0)
+
+    assert client.get("/api/v1/diagnostics/slow-queries", headers=_auth_header(owner["token"])).status_code == 403
+    response = client.get("/api/v1/diagnostics/slow-queries", headers=_auth_header(admin_token), params={"limit": 50})
+    assert response.status_code == 200
+    items = response.json()["data"]["items"]
+    totals = [item["total_ms"] for item in items]
+    assert totals == sorted(totals, reverse=True)
+
+    listing = next(item for item in items if item["sql"].startswith("SELECT transactions.id"))
+    assert listing["calls"] == 2
+    assert listing["endpoints"] == [{"endpoint": "GET /api/v1/transactions/", "calls": 2}]
+    assert listing["parameter_shape"] == ["int", "int"]
+    assert listing["plan"] and any("transactions" in line for line in listing["plan"])
+    # Only types are kept, never the bound values. The timings and timestamp can contain the id's
+    # digits by chance, so the check looks at the fields and at whole numbers in the SQL.
+    assert set(listing) == {"sql", "calls", "total_ms", "mean_ms", "max_ms", "last_seen", "parameter_shape", "endpoints", "plan"}
+    assert not re.search(rf"\b{owner['accounts']['main']}\b", listing["sql"])
+
+    assert client.delete("/api/v1/diagnostics/slow-queries", headers=_auth_header(admin_token)).status_code == 200
+    assert slow_query_log.top(10) == []
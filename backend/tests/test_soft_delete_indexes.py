@@ -0,0 +1,27 @@
+from sqlalchemy import create_engine, inspect, select
+
+from app.core.schema import apply_schema_compatibility
+from app.models import Account, User
+
+
+def _plan(engine, stmt) -> str:
+    sql = stmt.compile(engine, compile_kwargs={"literal_binds": True})
+    with engine.connect() as conn:
+        return " / ".join(row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"))
+
+
+def test_partial_indexes_serve_live_listings(tmp_path):
+    engine = create_engine(f"sqlite:///{(tmp_path / 'indexes.db').as_posix()}")
+    apply_schema_compatibility(engine)
+    # A second pass must not try to build the MySQL-only fallbacks.
+    apply_schema_compatibility(engine)
+
+    indexes = {index["name"] for table in ("users", "accounts") for index in inspect(engine).get_indexes(table)}
+    assert {"ix_users_live_id", "ix_accounts_live_id"} <= indexes
+    assert not indexes & {"ix_users_is_deleted_id", "ix_accounts_is_deleted_id"}
+
+    users_page = select(User).where(User.is_deleted.is_(False)).order_by(User.id.desc())
+    accounts_page = select(Account).where(Account.is_deleted.is_(False)).order_by(Account.id.desc())
+    assert "ix_users_live_id" in _plan(engine, users_page)
+    assert "ix_accounts_live_id" in _plan(engine, accounts_page)
+    engine.dispose()
@@ -0,0 +1,75 @@
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from sqlalchemy.exc import OperationalError
+
+from app.core.metrics import DB_TRANSACTION_RETRIES
+from app.core.database import SessionLocal
+from app.routers import transactions
+from app.services.unit_of_work import BUSY, classify_db_error, run_in_transaction
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _balance(client, token: str, account_id: int) -> Decimal:
+    response = client.get(f"/api/v1/accounts/{account_id}/balance", headers=_auth_header(token))
+    assert response.status_code == 200, response.text
+    return Decimal(response.json()["data"]["balance"]["balance"])
+
+
+def test_reciprocal_transfers_run_in_parallel_without_losing_money(client, customer):
+    owner = customer(first=1000, second=1000)
+    first, second = owner["accounts"]["first"], owner["accounts"]["second"]
+
+    def transfer(index: int) -> int:
+        source, target = (first, second) if index % 2 == 0 else (second, first)
+        response = client.post(
+            "/api/v1/transactions/",
+            headers=_auth_header(owner["token"]),
+            json={"from_account_id": source, "to_account_id": target, "amount": 7, "description": "ping-pong"},
+        )
+        return response.status_code
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        statuses = list(pool.map(transfer, range(40)))
+
+    assert statuses == [200] * 40
+    assert _balance(client, owner["token"], first) == Decimal("1000.00")
+    assert _balance(client, owner["token"], second) == Decimal("1000.00")
+
+
+def test_busy_errors_are_retried_and_counted():
+    calls = []
+
+    def flaky_work() -> str:
+        calls.append(1)
+        if len(calls) < 3:
+            raise OperationalError("UPDATE accounts", {}, Exception("database is locked"))
+        return "done"
+
+    before = DB_TRANSACTION_RETRIES.value(operation="test_flaky", reason=BUSY)
+    with SessionLocal() as session:
+        assert run_in_transaction(session, flaky_work, "test_flaky") == "done"
+
+    assert len(calls) == 3
+    assert DB_TRANSACTION_RETRIES.value(operation="test_flaky", reason=BUSY) == before + 2
+    assert classify_db_error(ValueError("boom")) is None
+
+
+def test_unexpected_transfer_errors_do_not_leak_details(client, customer, monkeypatch):
+    owner = customer(main=100, spare=0)
+
+    def _broken() -> str:
+        raise RuntimeError("connection string postgres://secret@db")
+
+    monkeypatch.setattr(transactions, "generate_transaction_reference", _broken)
+    response = client.post(
+        "/api/v1/transactions/",
+        headers=_auth_header(owner["token"]),
+        json={"from_account_id": owner["accounts"]["main"], "to_account_id": owner["accounts"]["spare"], "amount": 10},
+    )
+    assert response.status_code == 500
+    assert response.json()["message"] == "Transfer failed"
+    assert _balance(client, owner["token"], owner["accounts"]["main"]) == Decimal("100")
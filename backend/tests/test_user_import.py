@@ -0,0 +1,114 @@
+import io
+import json
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select, update
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import ImportJobStatus, User, UserImportJob
+from app.services import user_import
+
+
+@pytest.fixture(autouse=True)
+def import_dir(tmp_path, monkeypatch):
+    # Uploads are written to disk; keep them out of the working tree.
+    monkeypatch.setattr(settings, "user_import_dir", str(tmp_path))
+    return tmp_path
+
+
+def _auth_header(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _person(email: str) -> dict[str, str]:
+    return {"name": "Legacy Customer", "email": email, "contact": "1234567890", "address": "Old Core Street", "password": "Password@123"}
+
+
+def _admin_id() -> int:
+    with SessionLocal() as db:
+        return db.execute(select(User.id).where(User.email == "admin@bankexample.com")).scalar_one()
+
+
+def _report(client, admin_token: str, job_id: int) -> list[dict]:
+    response = client.get(f"/api/v1/users/imports/{job_id}/report", headers=_auth_header(admin_token))
+    assert response.status_code == 200, response.text
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_csv_import_reports_every_row(client, admin_token, customer):
+    existing = customer()["email"]
+    fresh = f"legacy-{uuid4().hex[:10]}@example.com"
+    rows = [_person(fresh), _person(fresh), _person(existing), {**_person("not-an-email"), "is_admin": "true"}]
+    body = "name,email,contact,address,password,is_admin\n" + "".join(
+        f"{row['name']},{row['email']},{row['contact']},{row['address']},{row['password']},{row.get('is_admin', '')}\n" for row in rows
+    )
+
+    response = client.post(
+        "/api/v1/users/imports", headers=_auth_header(admin_token), files={"file": ("legacy.csv", body, "text/csv")}
+    )
+    assert response.status_code == 200, response.text
+    job_id = response.json()["data"]["job"]["id"]
+
+    job = client.get(f"/api/v1/users/imports/{job_id}", headers=_auth_header(admin_token)).json()["data"]["job"]
+    assert (job["status"], job["processed_rows"], job["created_count"], job["skipped_count"], job["failed_count"]) == (
+        "completed",
+        4,
+        1,
+        2,
+        1,
+    )
+    report = _report(client, admin_token, job_id)
+    assert [(row["line"], row["status"]) for row in report] == [(2, "created"), (3, "skipped"), (4, "skipped"), (5, "failed")]
+    assert report[1]["error"] == "Duplicate email in file"
+    assert report[2]["error"] == "Email already exists"
+
+    login = client.post("/api/v1/auth/token", json={"email": fresh, "password": "Password@123"})
+    assert login.status_code == 200, login.text
+
+
+def test_failed_import_resumes_from_checkpoint(client, admin_token, monkeypatch, import_dir):
+    emails = [f"resume-{uuid4().hex[:10]}@example.com" for _ in range(5)]
+    body = "".join(json.dumps(_person(email)) + "\n" for email in emails).encode()
+    with SessionLocal() as db:
+        job_id = user_import.create_import_job(db, io.BytesIO(body), "legacy.ndjson", None, _admin_id()).id
+    assert (import_dir / f"{job_id}.ndjson").exists()
+
+    real_hash = user_import.hash_passwords
+    calls = []
+
+    def _flaky_hash(passwords):
+        calls.append(len(passwords))
+        if len(calls) == 2:
+            raise RuntimeError("worker died")
+        return real_hash(passwords)
+
+    monkeypatch.setattr(user_import, "hash_passwords", _flaky_hash)
+    user_import.run_user_import(job_id, chunk_size=2)
+    job = client.get(f"/api/v1/users/imports/{job_id}", headers=_auth_header(admin_token)).json()["data"]["job"]
+    assert (job["status"], job["processed_rows"], job["created_count"]) == (ImportJobStatus.FAILED.value, 2, 2)
+    assert "worker died" in job["error"]
+
+    monkeypatch.setattr(user_import, "hash_passwords", real_hash)
+    resumed = client.post(f"/api/v1/users/imports/{job_id}/resume", headers=_auth_header(admin_token))
+    assert resumed.status_code == 200, resumed.text
+
+    job = client.get(f"/api/v1/users/imports/{job_id}", headers=_auth_header(admin_token)).json()["data"]["job"]
+    assert (job["status"], job["processed_rows"], job["created_count"]) == ("completed", 5, 5)
+    assert [row["email"] for row in _report(client, admin_token, job_id)] == emails
+    assert client.post(f"/api/v1/users/imports/{job_id}/resume", headers=_auth_header(admin_token)).status_code == 409
+
+
+def test_running_import_cannot_be_resumed(client, admin_token):
+    body = (json.dumps(_person(f"running-{uuid4().hex[:10]}@example.com")) + "\n").encode()
+    with SessionLocal() as db:
+        job_id = user_import.create_import_job(db, io.BytesIO(body), "legacy.ndjson", None, _admin_id()).id
+        db.execute(update(UserImportJob).where(UserImportJob.id == job_id).values(status=ImportJobStatus.RUNNING))
+        db.commit()
+
+    response = client.post(f"/api/v1/users/imports/{job_id}/resume", headers=_auth_header(admin_token))
+    assert response.status_code == 409, response.text
+    assert response.json()["message"] == "Import job is still running"
+    job = client.get(f"/api/v1/users/imports/{job_id}", headers=_auth_header(admin_token)).json()["data"]["job"]
+    assert (job["status"], job["processed_rows"]) == ("running", 0)
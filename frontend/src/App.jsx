@@ -1049,7 +1049,7 @@ function DepositsPanel({ token, notify }) {
     event.preventDefault();
     try {
       const response = await apiRequest(`/deposits/${cancelId}/cancel`, { method: "PUT", token });
-      notify("success", `Deposit cancelled, penalty ${response.data.penalty}`);
+      notify("success", `Deposit cancelled, interest ${response.data.interest}, penalty ${response.data.penalty}`);
       setCancelId("");
       await load();
     } catch (error) {
@@ -1127,11 +1127,15 @@ function DepositsPanel({ token, notify }) {
 
 function AuditPanel({ token, currentUser, notify }) {
   const [rows, setRows] = useState([]);
+  const [page, setPage] = useState(1);
+  const [hasMore, setHasMore] = useState(false);
 
-  const load = async () => {
+  const load = async (targetPage = page) => {
     try {
-      const response = await apiRequest("/audit-logs/", { token });
+      const response = await apiRequest(`/audit-logs/?page=${targetPage}&page_size=100`, { token });
       setRows(response.data.items || []);
+      setHasMore(Boolean(response.data.has_more));
+      setPage(targetPage);
     } catch (error) {
       notify("error", error.message);
     }
@@ -1147,7 +1151,20 @@ function AuditPanel({ token, currentUser, notify }) {
 
   return (
     <div className="panel-grid">
-      <SectionCard title="Audit Logs" actions={<button onClick={load}>Refresh</button>}>
+      <SectionCard
+        title="Audit Logs"
+        actions={
+          <>
+            <button onClick={() => load(page - 1)} disabled={page === 1}>
+              Previous
+            </button>
+            <button onClick={() => load(page)}>Refresh</button>
+            <button onClick={() => load(page + 1)} disabled={!hasMore}>
+              Next
+            </button>
+          </>
+        }
+      >
         <DataTable
           columns={[
             { key: "id", label: "ID" },